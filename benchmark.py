@@ -0,0 +1,263 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+# This code is part of the TrinityX software suite
+# Copyright (C) 2025  ClusterVision Solutions b.v.
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program.  If not, see <https://www.gnu.org/licenses/>
+
+
+"""
+Startup benchmark only for Development Purpose.
+Usage: python benchmark.py parse [--runs N] [command ...]
+       python benchmark.py importtime [--runs N] [--record] [--tolerance T]
+       python benchmark.py prepare [--runs N] [--nodes N]
+       python benchmark.py fields [--runs N] [--nodes N] [--fields F]
+"""
+__author__      = "Sumit Sharma"
+__copyright__   = "Copyright 2025, Luna2 Project [CLI]"
+__license__     = "GPL"
+__version__     = "2.1"
+__maintainer__  = "Sumit Sharma"
+__email__       = "sumit.sharma@clustervision.com"
+__status__      = "Development"
+
+import os
+import sys
+import json
+import base64
+import subprocess
+from time import perf_counter
+from argparse import ArgumentParser
+from luna.cli import Cli, COMMANDS, load_command
+from luna.utils.log import Log
+
+CURRENT_DIR = os.path.dirname(os.path.realpath(__file__))
+BASELINE_FILE = f'{CURRENT_DIR}/benchmark.json'
+STARTUP = {
+    'luna --help': ['--help'],
+    'luna node list': ['node', 'list']
+}
+
+
+def parse_time(argv, commands, lazy=True, runs=5):
+    """
+    This method will return the best time in milliseconds to build the parser with the given
+    commands registered and parse the argv.
+    """
+    best = None
+    for _ in range(runs):
+        start = perf_counter()
+        cli = Cli()
+        cli.parser = ArgumentParser(prog='luna')
+        cli.parser.add_argument('-v', '--verbose', action='store_true', default=None)
+        cli.subparsers = cli.parser.add_subparsers(dest="command")
+        for name in commands:
+            if lazy is False or name == argv[0]:
+                load_command(name)(parser=cli.parser, subparsers=cli.subparsers)
+            else:
+                cli.subparsers.add_parser(name)
+        cli.parser.parse_args(argv)
+        elapsed = (perf_counter() - start) * 1000
+        best = elapsed if best is None else min(best, elapsed)
+    return best
+
+
+def import_time(argv, runs=5):
+    """
+    This method will run the CLI under python -X importtime and return the best total import
+    time in microseconds, the sum of the cumulative time of every top level import done after
+    the interpreter startup (site).
+    """
+    code = 'import sys; sys.argv[0] = "benchmark"; from luna.cli import run_tool; run_tool()'
+    env = {key: value for key, value in os.environ.items() if key != '_ARGCOMPLETE'}
+    best = None
+    for _ in range(runs):
+        result = subprocess.run([sys.executable, '-X', 'importtime', '-c', code] + argv,
+                                capture_output=True, text=True, cwd=CURRENT_DIR, env=env, check=False)
+        total, started = 0, False
+        for line in result.stderr.splitlines():
+            if line.startswith('import time:'):
+                parts = line.split('|')
+                if parts[1].strip().isdigit() and not parts[2][1:].startswith(' '):
+                    if started:
+                        total += int(parts[1])
+                    started = started or parts[2].strip() == 'site'
+        best = total if best is None else min(best, total)
+    return best
+
+
+def startup(options):
+    """
+    This method will compare the cold start import time with the recorded baseline, and exit
+    with an error when any command is slower than the baseline plus the tolerance.
+    """
+    current = {name: import_time(argv, options.runs) for name, argv in STARTUP.items()}
+    if options.record:
+        with open(BASELINE_FILE, 'w', encoding='utf-8') as baseline_file:
+            json.dump(current, baseline_file, indent=2)
+        sys.stdout.write(f'Baseline recorded in {BASELINE_FILE}\n')
+    baseline = {}
+    if os.path.isfile(BASELINE_FILE):
+        with open(BASELINE_FILE, 'r', encoding='utf-8') as baseline_file:
+            baseline = json.load(baseline_file)
+    failed = []
+    sys.stdout.write(f'{"Command":<16} {"Import (ms)":>12} {"Baseline (ms)":>14}\n')
+    for name, value in current.items():
+        limit = baseline.get(name)
+        status = ''
+        if limit is not None and value > limit * (1 + options.tolerance):
+            status = 'SLOWER'
+            failed.append(name)
+        recorded = f'{limit / 1000:.2f}' if limit is not None else '--NA--'
+        sys.stdout.write(f'{name:<16} {value / 1000:>12.2f} {recorded:>14} {status}\n')
+    if failed:
+        sys.stderr.write(f'ERROR :: Startup budget exceeded for {", ".join(failed)}.\n')
+        sys.exit(1)
+
+
+def parse(options):
+    """
+    This method will print the parse phase cost of eager and lazy construction, while the
+    number of registered commands grows.
+    """
+    Log.init_log('info')
+    names = [options.argv[0]] + [name for name in COMMANDS if name != options.argv[0]]
+    sys.stdout.write(f'Parsing => luna {" ".join(options.argv)}\n')
+    sys.stdout.write(f'{"Commands":>8} {"Eager (ms)":>12} {"Lazy (ms)":>12}\n')
+    for count in range(1, len(names) + 1):
+        eager = parse_time(options.argv, names[:count], lazy=False, runs=options.runs)
+        lazy = parse_time(options.argv, names[:count], lazy=True, runs=options.runs)
+        sys.stdout.write(f'{count:>8} {eager:>12.2f} {lazy:>12.2f}\n')
+
+
+def synthetic_nodes(count=10000):
+    """
+    This method will return a node list response as the Luna Daemon sends it, with base64
+    encoded scripts and interface options.
+    """
+    def encode(text):
+        return base64.b64encode(text.encode('utf-8')).decode('utf-8')
+    script = encode('\n'.join(f'echo "step {line}" >> /var/log/node-setup.log' for line in range(40)))
+    response = {}
+    for num in range(1, count + 1):
+        name = f'node{num:05d}'
+        response[name] = {
+            'name': name, 'group': 'compute', 'osimage': 'rocky9', 'setupbmc': True, 'bmcsetup': 'default',
+            'status': 'installer.discovery', 'tpm_uuid': None, 'prescript': script, 'partscript': script,
+            'postscript': script, 'kerneloptions': encode('net.ifnames=0 biosdevname=0'),
+            'comment': encode(f'rack {num // 40} slot {num % 40}'),
+            'interfaces': [
+                {'interface': 'BOOTIF', 'ipaddress': f'10.141.{num // 250}.{num % 250 + 1}',
+                 'macaddress': f'aa:bb:cc:{num // 65536 % 256:02x}:{num // 256 % 256:02x}:{num % 256:02x}',
+                 'network': 'cluster', 'options': encode('ONBOOT=yes\nMTU=9000'), 'dhcp': False},
+                {'interface': 'BMC', 'ipaddress': f'10.148.{num // 250}.{num % 250 + 1}', 'macaddress': None,
+                 'network': 'ipmi', 'options': None, 'dhcp': False}
+            ]
+        }
+    return response
+
+
+def prepare(options):
+    """
+    This method will print the time spent in Helper.prepare_json for a synthetic node list
+    response, for each output mode.
+    """
+    from luna.utils.helper import Helper # pylint: disable=C0415
+    from luna.utils.constant import filter_columns # pylint: disable=C0415
+    Log.init_log('info')
+    raw = json.dumps(synthetic_nodes(options.nodes))
+    modes = {
+        'raw': (False, None),
+        'show': (True, None),
+        'list': (True, filter_columns('node'))
+    }
+    sys.stdout.write(f'Decoding => {options.nodes} nodes\n')
+    sys.stdout.write(f'{"Mode":<8} {"Time (ms)":>12}\n')
+    for mode, (limit, fields) in modes.items():
+        best = None
+        for _ in range(options.runs):
+            data = json.loads(raw)
+            start = perf_counter()
+            Helper().prepare_json(data, limit, fields)
+            elapsed = (perf_counter() - start) * 1000
+            best = elapsed if best is None else min(best, elapsed)
+        sys.stdout.write(f'{mode:<8} {best:>12.2f}\n')
+
+
+def fields(options):
+    """
+    This method will compare a full node list with a list projected on a few fields, from the
+    parsed response to the written table, and to tsv lines.
+    """
+    import io # pylint: disable=C0415
+    import contextlib # pylint: disable=C0415
+    from luna.utils.helper import Helper # pylint: disable=C0415
+    from luna.utils.presenter import Presenter # pylint: disable=C0415
+    from luna.utils.constant import filter_columns # pylint: disable=C0415
+    Log.init_log('info')
+    raw = json.dumps(synthetic_nodes(options.nodes))
+    def full_list(data):
+        data = Helper().prepare_json(data, True, filter_columns('node'))
+        Presenter().show_table(' << Node >>', *Helper().filter_nodelist_col('node', data))
+    def projected(data, output='table'):
+        Helper().output_records('node', data.values(), {'fields': options.fields, 'output': output})
+    sys.stdout.write(f'Listing => {options.nodes} nodes, fields {options.fields}\n')
+    sys.stdout.write(f'{"Mode":<8} {"Time (ms)":>12}\n')
+    modes = [('list', full_list), ('fields', projected), ('tsv', lambda data: projected(data, 'tsv'))]
+    for mode, call in modes:
+        best = None
+        for _ in range(options.runs):
+            data = json.loads(raw)
+            start = perf_counter()
+            with contextlib.redirect_stdout(io.StringIO()):
+                call(data)
+            elapsed = (perf_counter() - start) * 1000
+            best = elapsed if best is None else min(best, elapsed)
+        sys.stdout.write(f'{mode:<8} {best:>12.2f}\n')
+
+
+def main():
+    """
+    This method will run the requested benchmark.
+    """
+    bench = ArgumentParser(description='Luna CLI startup benchmark')
+    bench_args = bench.add_subparsers(dest='benchmark', required=True)
+    parse_args = bench_args.add_parser('parse', help='Parser construction, eager vs lazy')
+    parse_args.add_argument('--runs', type=int, default=5, help='Runs per measurement, best is kept')
+    parse_args.add_argument('argv', nargs='*', default=['monitor', 'queue'], help='Command line to parse')
+    import_args = bench_args.add_parser('importtime', help='Cold start import time vs the baseline')
+    import_args.add_argument('--runs', type=int, default=5, help='Runs per measurement, best is kept')
+    import_args.add_argument('--record', action='store_true', help='Record the current timing as baseline')
+    import_args.add_argument('--tolerance', type=float, default=0.25, help='Allowed slowdown, 0.25 = 25%%')
+    prepare_args = bench_args.add_parser('prepare', help='Base64 decoding of a synthetic node list')
+    prepare_args.add_argument('--runs', type=int, default=3, help='Runs per measurement, best is kept')
+    prepare_args.add_argument('--nodes', type=int, default=10000, help='Number of nodes in the response')
+    fields_args = bench_args.add_parser('fields', help='Full node list vs a projection on a few fields')
+    fields_args.add_argument('--runs', type=int, default=3, help='Runs per measurement, best is kept')
+    fields_args.add_argument('--nodes', type=int, default=5000, help='Number of nodes in the response')
+    fields_args.add_argument('--fields', default='name,group,osimage', help='Fields of the projection')
+    options = bench.parse_args()
+    if options.benchmark == 'parse':
+        parse(options)
+    elif options.benchmark == 'prepare':
+        prepare(options)
+    elif options.benchmark == 'fields':
+        fields(options)
+    else:
+        startup(options)
+
+
+if __name__ == '__main__':
+    main()
@@ -32,11 +32,7 @@ __status__      = "Development"
 
 import os
 import sys
-from shutil import copy2
 
-INI_FILE = '/trinity/local/luna/cli/config/luna.ini'
-LOG_FOLDER = '/var/log/luna'
-CURRENT_DIR = os.path.dirname(os.path.realpath(__file__))
 
 def create_dir(path: str):
     """
@@ -50,7 +46,17 @@ def create_dir(path: str):
             sys.stderr.write('ERROR :: Install this tool as a super user.\n')
             sys.exit(1)
 
-if False in [os.path.exists(LOG_FOLDER), os.path.exists(INI_FILE)]:
-    create_dir(path=LOG_FOLDER)
-    create_dir(path="/trinity/local/luna/config")
-    copy2(f'{CURRENT_DIR}/luna.ini', INI_FILE)
+
+def bootstrap():
+    """
+    This method will place the log directory and the default luna.ini on the first run.
+    It's called by the CLI before the logger is set up, importing the package has no side
+    effects.
+    """
+    from shutil import copy2 # pylint: disable=C0415
+    from luna.utils.constant import INI_FILE, LOG_DIR # pylint: disable=C0415
+    if False in [os.path.exists(LOG_DIR), os.path.exists(INI_FILE)]:
+        create_dir(path=LOG_DIR)
+        create_dir(path=os.path.dirname(INI_FILE))
+        current_dir = os.path.dirname(os.path.realpath(__file__))
+        copy2(f'{current_dir}/luna.ini', INI_FILE)
@@ -0,0 +1,301 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+# This code is part of the TrinityX software suite
+# Copyright (C) 2025  ClusterVision Solutions b.v.
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program.  If not, see <https://www.gnu.org/licenses/>
+
+
+"""
+Apply Class for the CLI
+"""
+__author__      = "Sumit Sharma"
+__copyright__   = "Copyright 2025, Luna2 Project [CLI]"
+__license__     = "GPL"
+__version__     = "2.1"
+__maintainer__  = "Sumit Sharma"
+__email__       = "sumit.sharma@clustervision.com"
+__status__      = "Development"
+
+import sys
+import json
+from copy import deepcopy
+from luna.utils.helper import Helper
+from luna.utils.presenter import Presenter
+from luna.utils.rest import Rest
+from luna.utils.log import Log
+from luna.utils.message import Message
+from luna.utils.cache import NameCache
+from luna.utils.parallel import Parallel
+from luna.utils.constant import APPLY_TABLES, APPLY_WORKERS, BOOL_KEYS, EDITOR_KEYS
+
+
+class Apply():
+    """
+    Apply Class responsible to bring the groups and nodes in line with a manifest file.
+    Each table is fetched once, and only the records with a difference are written.
+    """
+
+    def __init__(self, args=None, parser=None, subparsers=None):
+        self.logger = Log.get_logger()
+        self.args = args
+        self.route = "apply"
+        if self.args:
+            self.logger.debug(f'Arguments Supplied => {self.args}')
+            self.apply_manifest()
+        else:
+            self.get_arguments(parser, subparsers)
+
+
+    def get_arguments(self, parser, subparsers):
+        """
+        Method will provide all the arguments related to the Apply class.
+        """
+        apply_menu = Helper().get_help_message(subparsers, self.route)
+        apply_menu.add_argument('-f', '--file', required=True, help='Manifest file in YAML or JSON, - for stdin')
+        apply_menu.add_argument('-p', '--plan', action='store_true', help='Only show what would be changed')
+        apply_menu.add_argument('--parallel', type=int, metavar='N', default=APPLY_WORKERS,
+                                help=f'Write N records at once, default {APPLY_WORKERS}')
+        apply_menu.add_argument('-v', '--verbose', action='store_true', default=None, help='Verbose Mode')
+        return parser
+
+
+    def read_manifest(self):
+        """
+        This method will read the manifest, a mapping of table to records keyed on name. JSON is
+        read as is, YAML with PyYAML, which is only imported when it's needed.
+        """
+        try:
+            if self.args['file'] == '-':
+                content = sys.stdin.read()
+            else:
+                with open(self.args['file'], 'r', encoding='utf-8') as manifest_file:
+                    content = manifest_file.read()
+        except OSError as file_error:
+            Message().error_exit(f'ERROR :: Unable to read {self.args["file"]}: {file_error.strerror}')
+        try:
+            manifest = json.loads(content)
+        except ValueError:
+            try:
+                import yaml # pylint: disable=C0415
+            except ImportError:
+                Message().error_exit('ERROR :: PyYAML is needed for a YAML manifest, install it or use JSON')
+            try:
+                manifest = yaml.safe_load(content)
+            except yaml.YAMLError as yaml_error:
+                Message().error_exit(f'ERROR :: {self.args["file"]} is not valid, {yaml_error}')
+        if isinstance(manifest, dict) and 'config' in manifest:
+            manifest = manifest['config']
+        if not isinstance(manifest, dict):
+            Message().error_exit(f'ERROR :: {self.args["file"]} should map the tables to their records')
+        unknown = [table for table in manifest if table not in APPLY_TABLES]
+        if unknown:
+            Message().error_exit(f'ERROR :: {", ".join(unknown)} can not be applied, choose from {", ".join(APPLY_TABLES)}')
+        for table, records in manifest.items():
+            if not isinstance(records, dict) or not all(isinstance(record, dict) for record in records.values()):
+                Message().error_exit(f'ERROR :: {table} should map each name to its fields')
+        return manifest
+
+
+    def snapshot(self, table=None):
+        """
+        This method will fetch all the records of a table once, an empty table is answered with 404.
+        """
+        response = {}
+        get_list = Rest().get_data(table)
+        if get_list.status_code == 200:
+            response = get_list.content['config'][table]
+        elif get_list.status_code != 404:
+            Message().error_exit(get_list.content, get_list.status_code)
+        return response
+
+
+    @staticmethod
+    def normalize(key=None, value=None):
+        """
+        This method will turn the yes and no choices of a bool key into a bool.
+        """
+        if key in BOOL_KEYS and isinstance(value, str) and value != '':
+            return value.lower() in ['y', 'yes', 'true']
+        return value
+
+
+    def diff_fields(self, wanted=None, current=None):
+        """
+        This method will return the changed fields as key => (current, wanted) with
+        Helper.changed_fields, the comparison of Helper.compare_data. A None value is not
+        compared.
+        """
+        wanted = {key: self.normalize(key, value) for key, value in wanted.items()
+                  if value is not None and key != 'name'}
+        return Helper().changed_fields(wanted, current)
+
+
+    def diff(self, wanted=None, current=None):
+        """
+        This method will return the minimal change of a record, the changed fields and for each
+        interface only its changed fields. None is returned when nothing is changed.
+        """
+        current = Helper().prepare_json(deepcopy(current))
+        wanted = dict(wanted)
+        interfaces = wanted.pop('interfaces', None) or []
+        response = self.diff_fields(wanted, current)
+        known = {item.get('interface'): item for item in current.get('interfaces') or []}
+        changed_interfaces = []
+        for interface in interfaces:
+            changes = self.diff_fields(interface, known.get(interface['interface'], {}))
+            changes.pop('interface', None)
+            if changes or interface['interface'] not in known:
+                changed_interfaces.append((interface['interface'], changes))
+        if changed_interfaces:
+            response['interfaces'] = changed_interfaces
+        return response or None
+
+
+    @staticmethod
+    def encode(key=None, value=None):
+        """
+        This method will encode the text of an editor key, as the Luna Daemon expects it.
+        """
+        if key in EDITOR_KEYS and isinstance(value, str):
+            return Helper().base64_encode(bytes(value, 'utf-8'))
+        return value
+
+
+    def payload(self, name=None, wanted=None, changes=None):
+        """
+        This method will build the payload of a record, the whole record for a new one and only
+        the changed fields for an existing one.
+        """
+        if changes is None:
+            response = {key: self.encode(key, self.normalize(key, value)) for key, value in wanted.items()
+                        if value is not None and key != 'interfaces'}
+            interfaces = [{key: self.encode(key, self.normalize(key, value)) for key, value in item.items()
+                           if value is not None} for item in wanted.get('interfaces') or []]
+        else:
+            response = {key: self.encode(key, value[1]) for key, value in changes.items() if key != 'interfaces'}
+            interfaces = [dict({'interface': interface},
+                               **{key: self.encode(key, value[1]) for key, value in fields.items()})
+                          for interface, fields in changes.get('interfaces', [])]
+        if interfaces:
+            response['interfaces'] = interfaces
+        response['name'] = name
+        return response
+
+
+    @staticmethod
+    def change_lines(changes=None):
+        """
+        This method will describe the changes of a record, one line per field.
+        """
+        def short(value):
+            value = '' if value is None else str(value).replace('\n', ' ')
+            return value if len(value) <= 40 else value[:37] + '...'
+        lines = []
+        for key, change in changes.items():
+            if key == 'interfaces':
+                continue
+            current, value = change
+            lines.append(f'{key}: {short(current)} => {short(value)}')
+        for interface, fields in changes.get('interfaces', []):
+            for key, (current, value) in fields.items():
+                lines.append(f'{interface}.{key}: {short(current)} => {short(value)}')
+        return '\n'.join(lines)
+
+
+    def plan(self, manifest=None):
+        """
+        This method will compare the manifest with the tables, and return the creates, the
+        changes and the unchanged count of each table.
+        """
+        response = {}
+        for table in [table for table in APPLY_TABLES if table in manifest]:
+            snapshot = self.snapshot(table)
+            create, change, unchanged = {}, {}, 0
+            for name, wanted in manifest[table].items():
+                name = str(name)
+                for interface in wanted.get('interfaces') or []:
+                    if not isinstance(interface, dict) or not interface.get('interface'):
+                        Message().error_exit(f'ERROR :: Each interface of {table} {name} needs the interface name')
+                if name not in snapshot:
+                    create[name] = self.payload(name, wanted)
+                    continue
+                changes = self.diff(wanted, snapshot[name])
+                if changes is None:
+                    unchanged += 1
+                else:
+                    change[name] = (self.payload(name, wanted, changes), changes)
+            self.logger.debug(f'Plan {table} => {len(create)} create, {len(change)} change, {unchanged} unchanged')
+            response[table] = {'create': create, 'change': change, 'unchanged': unchanged}
+        return response
+
+
+    def show_plan(self, plans=None):
+        """
+        This method will show the records which would be created or changed.
+        """
+        fields = ['#', 'Table', 'Name', 'Action', 'Changes']
+        rows = []
+        for table, plan in plans.items():
+            for name, payload in plan['create'].items():
+                rows.append([len(rows) + 1, table, name, 'create', ', '.join(key for key in payload if key != 'name')])
+            for name, (_, changes) in plan['change'].items():
+                rows.append([len(rows) + 1, table, name, 'change', self.change_lines(changes)])
+        if rows:
+            Presenter().show_table(' << Plan >>', fields, rows)
+        created = sum(len(plan['create']) for plan in plans.values())
+        changed = sum(len(plan['change']) for plan in plans.values())
+        unchanged = sum(plan['unchanged'] for plan in plans.values())
+        return Message().show_success(f'Plan: {created} to create, {changed} to change, {unchanged} unchanged.')
+
+
+    def write(self, table=None, payloads=None):
+        """
+        This method will write the payloads of a table with the pool of parallel workers.
+        """
+        def write_each(name):
+            request_data = {'config': {table: {name: payloads[name]}}}
+            self.logger.debug(f'Payload => {request_data}')
+            response = Rest().post_data(table, name, request_data)
+            if response.status_code not in [201, 204]:
+                Message().error_exit(response.content, response.status_code)
+        return Parallel(self.args['parallel']).run(list(payloads), write_each)
+
+
+    def apply_manifest(self):
+        """
+        This method will show the plan, or write the records with a difference and show the
+        created, changed, unchanged and failed counts. Groups are written before the nodes.
+        """
+        plans = self.plan(self.read_manifest())
+        if self.args['plan']:
+            return self.show_plan(plans)
+        fields = ['Table', 'Created', 'Changed', 'Unchanged', 'Failed']
+        rows, failed = [], []
+        for table, plan in plans.items():
+            created = self.write(table, plan['create'])
+            changed = self.write(table, {name: payload for name, (payload, _) in plan['change'].items()})
+            if plan['create']:
+                NameCache(table).invalidate()
+            errors = [result for result in created + changed if result['status'] != 'OK']
+            failed.extend((table, result) for result in errors)
+            passed = [len([result for result in results if result['status'] == 'OK']) for results in [created, changed]]
+            rows.append([table] + passed + [plan['unchanged'], len(errors)])
+        Presenter().show_table(' << Apply >>', fields, rows)
+        for table, result in failed:
+            Message().show_error(f'{table} {result["name"]} :: {result["output"]}')
+        if failed:
+            sys.exit(1)
+        return True
@@ -0,0 +1,155 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+# This code is part of the TrinityX software suite
+# Copyright (C) 2025  ClusterVision Solutions b.v.
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program.  If not, see <https://www.gnu.org/licenses/>
+
+
+"""
+Batch Class for the CLI
+"""
+__author__      = "Sumit Sharma"
+__copyright__   = "Copyright 2025, Luna2 Project [CLI]"
+__license__     = "GPL"
+__version__     = "2.1"
+__maintainer__  = "Sumit Sharma"
+__email__       = "sumit.sharma@clustervision.com"
+__status__      = "Development"
+
+import sys
+import shlex
+from time import time
+from luna.utils.helper import Helper
+from luna.utils.presenter import Presenter
+from luna.utils.log import Log
+from luna.utils.message import Message
+
+
+class Batch():
+    """
+    Batch Class responsible to run many luna commands in a single process.
+    """
+
+    def __init__(self, args=None, parser=None, subparsers=None):
+        self.logger = Log.get_logger()
+        self.args = args
+        self.route = "batch"
+        self.parsers = {}
+        if self.args:
+            self.logger.debug(f'Arguments Supplied => {self.args}')
+            self.run_batch()
+        else:
+            self.get_arguments(parser, subparsers)
+
+
+    def get_arguments(self, parser, subparsers):
+        """
+        Method will provide all the arguments related to the Batch class.
+        """
+        batch_menu = Helper().get_help_message(subparsers, self.route)
+        batch_menu.add_argument('-f', '--file', default='-', help='File with one luna command per line, - for stdin')
+        batch_menu.add_argument('-k', '--keep-going', action='store_true', help='Keep going after a failed command')
+        batch_menu.add_argument('-v', '--verbose', action='store_true', default=None, help='Verbose Mode')
+        return parser
+
+
+    def read_commands(self):
+        """
+        This method will read the commands, empty lines and comments are skipped.
+        """
+        response = []
+        if self.args['file'] == '-':
+            lines = sys.stdin.read().splitlines()
+        else:
+            try:
+                with open(self.args['file'], 'r', encoding='utf-8') as batch_file:
+                    lines = batch_file.read().splitlines()
+            except OSError as file_error:
+                Message().error_exit(f'ERROR :: Unable to read {self.args["file"]}: {file_error.strerror}')
+        for num, line in enumerate(lines, start=1):
+            try:
+                words = shlex.split(line, comments=True)
+            except ValueError as line_error:
+                Message().error_exit(f'ERROR :: Line {num} is not valid, {line_error}')
+            if words and words[0] == 'luna':
+                words = words[1:]
+            if words:
+                response.append((num, words))
+        return response
+
+
+    def get_cli(self, command=None):
+        """
+        This method will build the parser for a command once, and reuse it for the next lines.
+        """
+        from luna.cli import Cli # pylint: disable=C0415
+        if command not in self.parsers:
+            cli = Cli()
+            cli.build_parser(command)
+            self.parsers[command] = cli
+        return self.parsers[command]
+
+
+    def run_command(self, words=None):
+        """
+        This method will run one command through the CLI and return its exit status.
+        """
+        from luna.cli import Cli # pylint: disable=C0415
+        status = 0
+        command = Cli.requested_command(words)
+        try:
+            if command == self.route:
+                Message().error_exit('ERROR :: A batch can not run another batch')
+            cli = self.get_cli(command)
+            cli.args = vars(cli.parser.parse_args(words))
+            cli.call_command()
+        except SystemExit as exit_error:
+            if isinstance(exit_error.code, int):
+                status = exit_error.code
+            elif exit_error.code is not None:
+                sys.stderr.write(f'{exit_error.code}\n')
+                status = 1
+        except Exception as command_error: # pylint: disable=W0718
+            self.logger.debug(f'Batch Command Exception => {command_error}', exc_info=True)
+            Message().show_error(f'ERROR :: {command_error}')
+            status = 1
+        sys.stdout.flush()
+        return status
+
+
+    def run_batch(self):
+        """
+        This method will run the commands one by one, stop at the first failure unless keep going
+        is set, and show the exit status of every command.
+        """
+        rows = []
+        exit_code = 0
+        for num, words in self.read_commands():
+            command = ' '.join(words)
+            self.logger.info(f'Batch Command Supplied => luna {command}')
+            start = time()
+            status = self.run_command(words)
+            rows.append([num, f'luna {command}', status, f'{time() - start:.2f}s'])
+            if status != 0:
+                exit_code = exit_code or status
+                if not self.args['keep_going']:
+                    break
+        if rows:
+            fields = ['Line', 'Command', 'Exit Status', 'Duration']
+            Presenter().show_table('<< Batch Summary >>', fields, rows)
+        if exit_code:
+            sys.exit(exit_code)
+        return True
@@ -30,46 +30,34 @@ __email__       = "sumit.sharma@clustervision.com"
 __status__      = "Development"
 
 import sys
-import urllib3
 try:
     import os
     from pathlib import Path
     from textwrap import dedent
+    from importlib import import_module
     from argparse import ArgumentParser, RawDescriptionHelpFormatter
-    import argcomplete
-    from luna.utils.constant import TOOL_DESCRIPTION, TOOL_EPILOG, LOG_DIR, VERSION_FILE
+    from luna import bootstrap
+    from luna.utils.constant import TOOL_DESCRIPTION, TOOL_EPILOG, LOG_DIR, VERSION_FILE, parser_doc
     from luna.utils.log import Log
-    from luna.network import Network
-    from luna.group import Group
-    from luna.osimage import OSImage
-    from luna.cluster import Cluster
-    from luna.cloud import Cloud
-    from luna.bmcsetup import BMCSetup
-    from luna.node import Node
-    from luna.switch import Switch
-    from luna.otherdev import OtherDev
-    from luna.secrets import Secrets
-    from luna.service import Service
-    from luna.control import Control
-    from luna.monitor import Monitor
     from luna.utils.message import Message
-    from luna.utils.rest import Rest
-    from luna.utils.message import Message
-    classes = [
-        Cluster,
-        Cloud,
-        Network,
-        OSImage,
-        BMCSetup,
-        Switch,
-        OtherDev,
-        Group,
-        Node,
-        Secrets,
-        Service,
-        Control,
-        Monitor
-    ]
+    COMMANDS = {
+        'cluster': ('luna.cluster', 'Cluster'),
+        'cloud': ('luna.cloud', 'Cloud'),
+        'network': ('luna.network', 'Network'),
+        'osimage': ('luna.osimage', 'OSImage'),
+        'bmcsetup': ('luna.bmcsetup', 'BMCSetup'),
+        'switch': ('luna.switch', 'Switch'),
+        'otherdev': ('luna.otherdev', 'OtherDev'),
+        'group': ('luna.group', 'Group'),
+        'node': ('luna.node', 'Node'),
+        'secrets': ('luna.secrets', 'Secrets'),
+        'service': ('luna.service', 'Service'),
+        'control': ('luna.control', 'Control'),
+        'monitor': ('luna.monitor', 'Monitor'),
+        'batch': ('luna.batch', 'Batch'),
+        'sync': ('luna.sync', 'Sync'),
+        'apply': ('luna.apply', 'Apply')
+    }
 
 except KeyboardInterrupt:
     sys.stderr.write("\nKeyboard Interrupted.\n")
@@ -82,7 +70,11 @@ class Cli():
     """
 
     def __init__(self):
-        self.logger = Log.init_log('info')
+        bootstrap()
+        try:
+            self.logger = Log.get_logger()
+        except RuntimeError:
+            self.logger = Log.init_log('info')
         self.parser = ArgumentParser()
         self.subparsers = None
         self.args = {}
@@ -102,8 +94,8 @@ class Cli():
         self.parser.add_argument('-V', '--version', action='version', version=f'%(prog)s {ver}')
         self.parser.add_argument('-v', '--verbose', action='store_true', default=None, help='Verbose Mode')
         self.subparsers = self.parser.add_subparsers(dest="command", help='See Details by --help')
-        for cls in classes:
-            cls(parser=self.parser, subparsers =self.subparsers)
+        for name in COMMANDS:
+            load_command(name)(parser=self.parser, subparsers =self.subparsers)
         print(f"{self.parser}")
         return self.parser
 
@@ -112,6 +104,19 @@ class Cli():
         Main method to fetch and provide the arguments for each class.
         """
         self.log_checker()
+        self.build_parser(self.requested_command())
+        if '_ARGCOMPLETE' in os.environ:
+            import argcomplete # pylint: disable=C0415
+            argcomplete.autocomplete(self.parser, always_complete_options=False)
+        self.args = vars(self.parser.parse_args())
+        self.call_class()
+        return True
+
+
+    def build_parser(self, command=None):
+        """
+        This method will build the top level parser, with the full subparser tree of the command.
+        """
         ver = self.get_version()
         self.parser = ArgumentParser(
             prog = 'luna',
@@ -122,13 +127,41 @@ class Cli():
         self.parser.add_argument('-V', '--version', action='version', version=f'%(prog)s {ver}')
         self.parser.add_argument('-v', '--verbose', action='store_true', default=None, help='Verbose Mode')
         self.subparsers = self.parser.add_subparsers(dest="command", help='See Details by --help')
-        for cls in classes:
-            cls(parser=self.parser, subparsers =self.subparsers)
+        self.add_commands(command)
+        return self.parser
 
-        argcomplete.autocomplete(self.parser, always_complete_options=False)
-        self.args = vars(self.parser.parse_args())
-        self.call_class()
-        return True
+
+    def add_commands(self, command=None):
+        """
+        This method will register every command name on the top level parser, only the requested
+        command will build its full subparser tree, the rest are kept as a light stub.
+        """
+        for name in COMMANDS:
+            if name == command:
+                load_command(name)(parser=self.parser, subparsers=self.subparsers)
+            else:
+                self.subparsers.add_parser(name, help=parser_doc(name).help)
+        return self.subparsers
+
+
+    @staticmethod
+    def requested_command(words=None):
+        """
+        This method will find the command from the given words, the command line, or from the line
+        under completion when argcomplete is running. It will return None when there is no command.
+        """
+        if words is not None:
+            pass
+        elif '_ARGCOMPLETE' in os.environ:
+            comp_line = os.environ.get('COMP_LINE', '')
+            comp_point = int(os.environ.get('COMP_POINT', len(comp_line)))
+            words = comp_line[:comp_point].split()[1:]
+        else:
+            words = sys.argv[1:]
+        for word in words:
+            if not word.startswith('-'):
+                return word if word in COMMANDS else None
+        return None
 
 
     def call_class(self):
@@ -139,31 +172,32 @@ class Cli():
             self.logger = Log.init_log('debug')
         else:
             self.logger = Log.init_log('info')
-        command = sys.argv
-        command[0] = 'luna'
-        command = ' '.join(command)
+        command = ' '.join(['luna'] + sys.argv[1:])
         self.logger.info(f'Command Supplied => {command}')
         try:
-            if self.args["command"]:
-                if self.args["command"] == "osimage":
-                    call = globals()["OSImage"]
-                elif self.args["command"] == "bmcsetup":
-                    call = globals()["BMCSetup"]
-                elif self.args["command"] == "otherdev":
-                    call = globals()["OtherDev"]
-                else:
-                    call = globals()[self.args["command"].capitalize()]
-                urllib3.disable_warnings()
-                Rest().daemon_validation()
-                call(self.args, self.parser, self.subparsers)
-            else:
-                self.parser.print_help(sys.stdout)
-                sys.exit(0)
+            self.call_command()
         except KeyboardInterrupt:
             sys.stderr.write("\nKeyboard Interrupted\n")
             sys.exit(1)
 
 
+    def call_command(self):
+        """
+        Method to run the parsed command with its class, or show the help without a command.
+        """
+        if self.args["command"]:
+            call = load_command(self.args["command"])
+            try:
+                call(self.args, self.parser, self.subparsers)
+            finally:
+                if 'luna.utils.rest' in sys.modules:
+                    rest = sys.modules['luna.utils.rest'].Rest
+                    self.logger.debug(f'Connection Pool => {rest.pool_stats()}')
+        else:
+            self.parser.print_help(sys.stdout)
+            sys.exit(0)
+
+
     def get_version(self):
         """
         This Method will fetch the current version of Luna CLI from VERSION File.
@@ -190,6 +224,14 @@ class Cli():
                 Message().error_exit('ERROR :: Install this tool as a super user.')
 
 
+def load_command(name=None):
+    """
+    This method will import the module of a command only when it's needed, and return its class.
+    """
+    module_name, class_name = COMMANDS[name]
+    return getattr(import_module(module_name), class_name)
+
+
 def run_tool():
     """
     This method initiate the main method of CLI class.
@@ -199,6 +241,10 @@ def run_tool():
     except KeyboardInterrupt:
         sys.stderr.write("\nKeyboard Interrupted.\n")
         sys.exit(1)
+    except BrokenPipeError:
+        # The reader has gone away (head, less), the rest of the output goes nowhere.
+        os.dup2(os.open(os.devnull, os.O_WRONLY), sys.stdout.fileno())
+        sys.exit(1)
 
 
 def get_parser():
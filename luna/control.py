@@ -29,16 +29,19 @@ __maintainer__  = "Sumit Sharma"
 __email__       = "sumit.sharma@clustervision.com"
 __status__      = "Development"
 
+from time import time, sleep
 from textwrap import wrap
-from multiprocessing import Process
 from argparse import FileType
 from luna.utils.helper import Helper
 from luna.utils.presenter import Presenter
 from luna.utils.rest import Rest
 from luna.utils.log import Log
-from luna.utils.constant import actions
+from luna.utils.watcher import ControlWatcher
+from luna.utils.constant import actions, WATCH_FIRST_POLL, CONTROL_WAVE_INTERVAL
 from luna.utils.message import Message
 
+WAVE_USAGE = '[--wave-size N] [--wave-interval S]'
+
 class Control():
     """
     Control class is a power control area.
@@ -72,9 +75,10 @@ class Control():
         power_parser = control_args.add_parser('power', help='Power Operations')
         power_menu = power_parser.add_subparsers(dest='action')
         for action in actions('power'):
-            action_parser = power_menu.add_parser(action, help=f'Node(s) {action.capitalize()}', usage='%(prog)s [-h] [-v] [node|hostlist]')
+            action_parser = power_menu.add_parser(action, help=f'Node(s) {action.capitalize()}', usage=f'%(prog)s [-h] [-v] {WAVE_USAGE} [node|hostlist]')
             action_parser.add_argument('-v', '--verbose', action='store_true', default=None, help='Verbose Mode')
             action_parser.add_argument('node', help='Node Name or Node Hostlist').completer = Helper().name_completer("node")
+            self.wave_args(action_parser)
         sel_parser = control_args.add_parser('sel', help='Sel Operations')
         sel_menu = sel_parser.add_subparsers(dest='action')
         for action in actions('sel'):
@@ -84,16 +88,28 @@ class Control():
         chassis_parser = control_args.add_parser('chassis', help='Chassis Operations')
         chassis_menu = chassis_parser.add_subparsers(dest='action')
         for action in actions('chassis'):
-            action_parser = chassis_menu.add_parser(action, help=f'Node(s) {action.capitalize()}', usage='%(prog)s [-h] [-v] [node|hostlist]')
+            action_parser = chassis_menu.add_parser(action, help=f'Node(s) {action.capitalize()}', usage=f'%(prog)s [-h] [-v] {WAVE_USAGE} [node|hostlist]')
             action_parser.add_argument('-v', '--verbose', action='store_true', default=None, help='Verbose Mode')
             action_parser.add_argument('node', help='Node Name or Node Hostlist').completer = Helper().name_completer("node")
+            self.wave_args(action_parser)
         redfish_parser = control_args.add_parser('redfish', help='RedFish Operations')
         redfish_menu = redfish_parser.add_subparsers(dest='action')
         for action in actions('redfish'):
-            action_parser = redfish_menu.add_parser(action, help=f'Node(s) {action.capitalize()}', usage='%(prog)s [-h] [-v] [node|hostlist]')
+            action_parser = redfish_menu.add_parser(action, help=f'Node(s) {action.capitalize()}', usage=f'%(prog)s [-h] [-v] {WAVE_USAGE} [node|hostlist]')
             action_parser.add_argument('-v', '--verbose', action='store_true', default=None, help='Verbose Mode')
             action_parser.add_argument('node', help='Node Name or Node Hostlist').completer = Helper().name_completer("node")
             action_parser.add_argument('-f', '--file', type=FileType('r'), help='File Path')
+            self.wave_args(action_parser)
+        return parser
+
+
+    def wave_args(self, parser=None):
+        """
+        This method will provide the arguments to run a hostlist in waves.
+        """
+        parser.add_argument('--wave-size', type=int, metavar='N', help='Post the hostlist in waves of N nodes')
+        parser.add_argument('--wave-interval', type=float, metavar='S', default=CONTROL_WAVE_INTERVAL,
+                            help=f'Seconds between the waves, default {CONTROL_WAVE_INTERVAL}')
         return parser
 
 
@@ -136,28 +152,79 @@ class Control():
             response = Presenter().show_table_col(title, fields, rows)
 
         elif len(hostlist) > 1:
-            control_process = Process(target=Helper().loader, args=("Fetching Nodes Status...",))
-            control_process.start()
-            request_id = None
-            uri = f'{self.route}/action/{self.args["system"]}/_{self.args["action"]}'
-            payload = {
-                'control':{
-                    self.args['system']:{
-                        self.args['action']:{
-                            'hostlist':self.args['node']
-                        }
+            control_process = Helper().start_loader("Fetching Nodes Status...")
+            response = self.run_waves(hostlist)
+            Helper().stop_loader(control_process)
+        return response
+
+
+    def submit_wave(self, nodes=None, count=1):
+        """
+        This method will post the control action for the nodes of a wave, and return the watcher
+        of its status. A wave without a request_id is done right away.
+        """
+        import hostlist # pylint: disable=C0415
+        uri = f'{self.route}/action/{self.args["system"]}/_{self.args["action"]}'
+        payload = {
+            'control':{
+                self.args['system']:{
+                    self.args['action']:{
+                        'hostlist': hostlist.collect_hostlist(nodes)
                     }
                 }
             }
-            response = Rest().post_raw(uri, payload)
-            self.logger.debug(f'HTTP STATUS => {response.status_code}')
-            self.logger.debug(f'HTTP Response => {response.content}')
-            if response.status_code == 200:
-                content = response.json()
-                if 'control' in content:
-                    request_id = content['request_id'] if 'request_id' in content else None
-                    count = Helper().control_print(self.args['system'], content ,1)
-                    if request_id:
-                        Helper().dig_control_status(request_id, count, self.args['system'])
-                        control_process.terminate()
-        return response
+        }
+        watcher = ControlWatcher(None, self.args['system'], count, WATCH_FIRST_POLL, close=False)
+        watcher.done = True
+        response = Rest().post_raw(uri, payload)
+        self.logger.debug(f'HTTP STATUS => {response.status_code}')
+        self.logger.debug(f'HTTP Response => {response.content}')
+        if response.status_code == 200:
+            content = response.json()
+            if 'control' in content:
+                request_id = content['request_id'] if 'request_id' in content else None
+                watcher = ControlWatcher(request_id, self.args['system'], count, WATCH_FIRST_POLL, close=False)
+                watcher.handle(content)
+                watcher.done = request_id is None
+        else:
+            Message().show_error(f'{response.content}', response.status_code)
+        return watcher
+
+
+    def run_waves(self, nodes=None):
+        """
+        This method will run the control action on the hostlist in waves of --wave-size nodes,
+        a wave is posted every --wave-interval seconds while the status of the earlier waves is
+        still collected. Without a wave size the whole hostlist is a single wave.
+        """
+        wave_size = self.args.get('wave_size') or len(nodes)
+        if wave_size < 1:
+            Message().error_exit('ERROR :: The wave size should be at least 1')
+        waves = [nodes[index:index + wave_size] for index in range(0, len(nodes), wave_size)]
+        interval = self.args.get('wave_interval') or 0
+        self.logger.debug(f'Control Waves => {len(waves)} of {wave_size} nodes, {interval}s apart')
+        watchers, count, next_wave = [], 1, time()
+        while waves or not all(watcher.done for watcher in watchers):
+            if waves and time() >= next_wave:
+                watcher = self.submit_wave(waves.pop(0), count)
+                count = watcher.count
+                watchers.append(watcher)
+                next_wave = time() + interval
+            for watcher in [watcher for watcher in watchers if not watcher.done and watcher.next_poll <= time()]:
+                watcher.count = count
+                watcher.poll_once()
+                count = watcher.count
+            planned = [watcher.next_poll for watcher in watchers if not watcher.done]
+            if waves:
+                planned.append(next_wave)
+            if planned:
+                sleep(max(0, min(planned) - time()))
+        if count > 1:
+            ControlWatcher.close_table()
+        results = {}
+        for watcher in watchers:
+            results.update(watcher.results)
+        last_results = [watcher.last_result for watcher in watchers if watcher.last_result is not None]
+        ControlWatcher.show_summary(results, nodes, watchers[0].started, max(last_results, default=None))
+        return True
+
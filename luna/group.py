@@ -35,9 +35,12 @@ from luna.utils.helper import Helper
 from luna.utils.presenter import Presenter
 from luna.utils.rest import Rest
 from luna.utils.log import Log
-from luna.utils.constant import actions, BOOL_CHOICES, BOOL_META
+from luna.utils.constant import actions, BOOL_CHOICES, BOOL_META, filter_columns
 from luna.utils.message import Message
+from luna.utils.cache import NameCache
 from luna.utils.arguments import Arguments
+from luna.utils.query import Query
+from luna.utils.rollout import RollingPush
 
 class Group():
     """
@@ -72,14 +75,14 @@ class Group():
         group_menu = Helper().get_help_message(subparsers, self.table)
         group_args = group_menu.add_subparsers(dest='action', title='commands', description='Available group operations')
         group_list = group_args.add_parser('list', help='List Groups')
-        Arguments().common_list_args(group_list, True)
+        Arguments().common_list_args(group_list, True, cached=True, query=True)
         group_show = group_args.add_parser('show', help='Show Group details')
         group_show.add_argument('name', help='Name of the Group').completer = Helper().name_completer(self.table)
-        Arguments().common_list_args(group_show)
+        Arguments().common_list_args(group_show, cached=True)
         group_show.add_argument('-f', '--full-scripts', action='store_true', default=None, help='Show the Full Scripts')
         group_member = group_args.add_parser('member', help='Group Used by Nodes')
         group_member.add_argument('name', help='Name of the Group').completer = Helper().name_completer(self.table)
-        Arguments().common_list_args(group_member)
+        Arguments().common_list_args(group_member, cached=True)
         group_add = group_args.add_parser('add', help='Add Group')
         group_add.add_argument('name', help='Name of the Group')
         Arguments().common_group_args(group_add)
@@ -105,6 +108,7 @@ class Group():
         group_ospush.add_argument('--nodry', action='store_true', default=None,
                                   help='No Dry flag to avoid dry run')
         group_ospush.add_argument('-v', '--verbose', action='store_true', default=None, help='Verbose Mode')
+        Arguments().rolling_args(group_ospush)
         group_interfaces = group_args.add_parser('listinterface', help='List Group Interfaces')
         group_interfaces.add_argument('name', help='Name of the Group').completer = Helper().name_completer(self.table)
         Arguments().common_list_args(group_interfaces)
@@ -147,21 +151,23 @@ class Group():
         #return Helper().get_list(self.table, self.args)
         response = False
         fields, rows = [], []
-        get_list = Rest().get_data(self.table)
+        get_list = Helper().config_data(self.table, None, self.args)
         if get_list.status_code == 200:
             get_list = get_list.content
         else:
             Message().error_exit(get_list.content, get_list.status_code)
         self.logger.debug(f'Get List Data from Helper => {get_list}')
         if get_list:
-            data = get_list['config'][self.table]
-            if self.args.get('csv'):
+            data = Query(self.args).apply(get_list['config'][self.table])
+            if self.args.get('fields') or self.args.get('output') in ['ndjson', 'tsv']:
+                response = Helper().output_records(self.table, data.values(), self.args)
+            elif self.args.get('csv'):
                 response = Helper().column_csv(self.table, data, self.args['csv'])
             elif 'raw' in self.args and self.args['raw']:
                 json_data = Helper().prepare_json(data)
                 response = Presenter().show_json(json_data)
             else:
-                data = Helper().prepare_json(data, True)
+                data = Helper().prepare_json(data, True, filter_columns(self.table))
                 fields, rows  = Helper().filter_data(self.table, data)
                 self.logger.debug(f'Fields => {fields}')
                 self.logger.debug(f'Rows => {rows}')
@@ -277,9 +283,20 @@ class Group():
 
     def ospush_group(self):
         """
-        Method to push an osimage to a group.
+        Method to push an osimage to a group. With --rolling it's pushed to the member nodes
+        one by one, with a window of pushes in flight.
         """
-        return Helper().push_osimage(self.table, self.args)
+        rolling = RollingPush.pop_args(self.args)
+        if rolling is None:
+            return Helper().push_osimage(self.table, self.args)
+        get_list = Rest().get_data(self.table, self.args['name']+'/_member')
+        if get_list.status_code != 200:
+            Message().error_exit(get_list.content, get_list.status_code)
+        members = get_list.content['config'][self.table][self.args['name']]['members']
+        if not members:
+            Message().error_exit(f'{self.table} {self.args["name"]} not have any node.')
+        self.args.pop('name')
+        return RollingPush(self.args, **rolling).run(members)
 
 
     def clone_group(self):
@@ -333,7 +350,7 @@ class Group():
                 json_data = Helper().prepare_json(data)
                 response = Presenter().show_json(json_data)
             else:
-                data = Helper().prepare_json(data, True)
+                data = Helper().prepare_json(data, True, filter_columns(self.interface))
                 fields, rows  = Helper().filter_interface(self.interface, data)
                 self.logger.debug(f'Fields => {fields}')
                 self.logger.debug(f'Rows => {rows}')
@@ -420,6 +437,7 @@ class Group():
                 response = Rest().post_data(self.table, group_name+'/interfaces', request_data)
                 self.logger.debug(f'Response => {response}')
                 if response.status_code == 204:
+                    NameCache(self.table, group_name, kind='interfaces').invalidate()
                     Message().show_success(f'Group {group_name} Interface {interface["interface"]} is updated.')
                 else:
                     Message().error_exit(response.content, response.status_code)
@@ -444,6 +462,7 @@ class Group():
             response = Rest().get_delete(self.table, uri)
             self.logger.debug(f'Response => {response}')
             if response.status_code == 204:
+                NameCache(self.table, payload['name'], kind='interfaces').invalidate()
                 msg = f'Group {payload["name"]} Interface {payload["interface"]} is removed.'
                 Message().show_success(msg)
             else:
@@ -481,6 +500,7 @@ class Group():
                 response = Rest().post_data(self.table, group_name+'/interfaces', request_data)
                 self.logger.debug(f'Response => {response}')
                 if response.status_code == 204:
+                    NameCache(self.table, group_name, kind='interfaces').invalidate()
                     Message().show_success(f'Group {group_name} Interface {interface["interface"]} is updated.')
                 else:
                     Message().error_exit(response.content, response.status_code)
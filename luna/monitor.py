@@ -29,13 +29,17 @@ __maintainer__  = "Sumit Sharma"
 __email__       = "sumit.sharma@clustervision.com"
 __status__      = "Development"
 
+import sys
 import json
+from time import time, sleep
 from luna.utils.rest import Rest
 from luna.utils.helper import Helper
 from luna.utils.presenter import Presenter
 from luna.utils.log import Log
 from luna.utils.message import Message
 from luna.utils.arguments import Arguments
+from luna.utils.watcher import TaskWatcher
+from luna.utils.constant import REST_POOL_SIZE, filter_columns
 
 class Monitor():
     """
@@ -53,8 +57,10 @@ class Monitor():
                 self.status_monitor()
             elif self.args["action"] == 'queue':
                 self.queue_monitor()
+            elif self.args["action"] == 'watch':
+                self.watch_monitor()
             else:
-                Message().show_warning('Use status or queue to see the status of monitor service.')
+                Message().show_warning('Use status, queue or watch to see the status of monitor service.')
         else:
             self.get_arguments(parser, subparsers)
 
@@ -67,9 +73,14 @@ class Monitor():
         monitor.add_argument('-v', '--verbose', action='store_true', default=None, help='Verbose Mode')
         monitor_menu = monitor.add_subparsers(dest='action', title='commands', description='Available monitor operations')
         monitor_status = monitor_menu.add_parser('status', help='Get Monitor Status.')
-        Arguments().common_list_args(monitor_status)
+        Arguments().common_list_args(monitor_status, output=True)
         monitor_queue = monitor_menu.add_parser('queue', help='Get Monitor Queue Status.')
-        Arguments().common_list_args(monitor_queue)
+        Arguments().common_list_args(monitor_queue, output=True)
+        monitor_watch = monitor_menu.add_parser('watch', help='Watch Background Tasks on a live status board.')
+        monitor_watch.add_argument('request_id', nargs='*', help='Request IDs, by default taken from the Monitor Queue')
+        monitor_watch.add_argument('-r', '--route', default='config', choices=['config', 'control', 'service'],
+                                   help='Status route of the Request IDs')
+        monitor_watch.add_argument('-v', '--verbose', action='store_true', default=None, help='Verbose Mode')
         return parser
 
 
@@ -87,11 +98,13 @@ class Monitor():
             data = json.loads(data)
             data = data['monitor']['status']
             if data:
-                if self.args['raw']:
+                if self.args.get('fields') or self.args.get('output') in ['ndjson', 'tsv']:
+                    response = Helper().output_records('status', data, self.args)
+                elif self.args['raw']:
                     json_data = Helper().prepare_json(data)
                     response = Presenter().show_json(json_data)
                 else:
-                    data = Helper().prepare_json(data, True)
+                    data = Helper().prepare_json(data, True, filter_columns('status'))
                     fields, rows  = Helper().filter_interface('status', data)
                     fields = list(map(lambda x: x.replace('username_initiator', 'Initiate By'), fields))
                     fields = list(map(lambda x: x.replace('request_id', 'Request ID'), fields))
@@ -123,11 +136,13 @@ class Monitor():
             data = json.loads(data)
             data = data['monitor']['queue']
             if data:
-                if self.args['raw']:
+                if self.args.get('fields') or self.args.get('output') in ['ndjson', 'tsv']:
+                    response = Helper().output_records('queue', data, self.args)
+                elif self.args['raw']:
                     json_data = Helper().prepare_json(data)
                     response = Presenter().show_json(json_data)
                 else:
-                    data = Helper().prepare_json(data, True)
+                    data = Helper().prepare_json(data, True, filter_columns('queue'))
                     fields, rows  = Helper().filter_interface('queue', data)
                     fields = list(map(lambda x: x.replace('username_initiator', 'Initiate By'), fields))
                     fields = list(map(lambda x: x.replace('queue_id', 'Queue-ID'), fields))
@@ -146,3 +161,71 @@ class Monitor():
         else:
             response = Message().show_error('Monitor Queue is not working at this moment.')
         return response
+
+
+    def queue_requests(self):
+        """
+        This method will return the distinct request ids of the monitor queue.
+        """
+        response = []
+        get_list = Rest().get_raw('monitor/queue')
+        if get_list.status_code == 200 and get_list.content:
+            for task in get_list.json()['monitor']['queue'] or []:
+                if task.get('request_id') and task['request_id'] not in response:
+                    response.append(task['request_id'])
+        return response
+
+
+    def watch_monitor(self):
+        """
+        This method will follow many background tasks at once. One loop polls the tasks which are
+        due with a pool of workers sharing the REST connection pool, and draws a status board.
+        Without a terminal each task gets a line as soon as it's done, and the board at the end.
+        """
+        from concurrent.futures import ThreadPoolExecutor # pylint: disable=C0415
+        request_ids = self.args['request_id'] or self.queue_requests()
+        if not request_ids:
+            Message().show_success('Monitor Queue is empty.')
+            return True
+        watchers = [TaskWatcher(self.args['route'], request_id, TaskWatcher.silent_format) for request_id in request_ids]
+        live = sys.stdout.isatty()
+        lines = 0
+        reported = set()
+        workers = min(len(watchers), REST_POOL_SIZE)
+        with ThreadPoolExecutor(max_workers=workers) as executor:
+            while True:
+                running = [watcher for watcher in watchers if not watcher.done]
+                if live:
+                    lines = Presenter().show_board(*self.watch_board(watchers), lines)
+                else:
+                    for watcher in watchers:
+                        if watcher.done and watcher.request_id not in reported:
+                            reported.add(watcher.request_id)
+                            Message().show_success(f'{watcher.request_id} :: {watcher.state} in {watcher.duration:.1f}s '
+                                                   f':: {watcher.last_message}')
+                if not running:
+                    break
+                delay = min(watcher.next_poll for watcher in running) - time()
+                if delay > 0:
+                    sleep(delay)
+                due = [watcher for watcher in running if watcher.next_poll <= time()]
+                list(executor.map(lambda watcher: watcher.poll_once(), due))
+        if not live:
+            Presenter().show_table(*self.watch_board(watchers))
+        if any(watcher.failed for watcher in watchers):
+            sys.exit(1)
+        return True
+
+
+    def watch_board(self, watchers=None):
+        """
+        This method will prepare the title, fields and rows of the status board.
+        """
+        fields = ['#', 'Request ID', 'Status', 'Duration', 'Last Message']
+        rows = []
+        for num, watcher in enumerate(watchers, start=1):
+            message = watcher.last_message
+            if len(message) > 60:
+                message = f'{message[:57]}...'
+            rows.append([num, watcher.request_id, watcher.state, f'{watcher.duration:.1f}s', message])
+        return '<< Monitor Watch >>', fields, rows
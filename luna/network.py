@@ -79,10 +79,10 @@ class Network():
         network_menu = Helper().get_help_message(subparsers, self.table)
         network_args = network_menu.add_subparsers(dest='action', title='commands', description='Available network operations')
         network_list = network_args.add_parser('list', help='List Networks')
-        Arguments().common_list_args(network_list, True)
+        Arguments().common_list_args(network_list, True, cached=True)
         network_show = network_args.add_parser('show', help='Show Network')
         network_show.add_argument('name', help='Network Name').completer = Helper().name_completer(self.table)
-        Arguments().common_list_args(network_show)
+        Arguments().common_list_args(network_show, cached=True)
         network_add = network_args.add_parser('add', help='Add Network')
         network_add.add_argument('name', help='Network Name')
         Arguments().common_network_args(network_add, True)
@@ -101,6 +101,11 @@ class Network():
         network_taken = network_args.add_parser('reserve', help='List Reserved IP\'s for Network')
         network_taken.add_argument('name', help='Network Name').completer = Helper().name_completer(self.table)
         network_taken.add_argument('-R', '--raw', action='store_true', default=None, help='Raw JSON output')
+        network_view = network_taken.add_mutually_exclusive_group()
+        network_view.add_argument('--ranges', action='store_true', default=None, help='Show the free and taken ranges')
+        network_view.add_argument('--free-ranges', action='store_true', default=None, help='Show only the free ranges')
+        network_view.add_argument('--count', action='store_true', default=None, help='Show the taken and free totals with the utilization')
+        network_view.add_argument('--slice', type=int, metavar='PREFIX', help='Show the utilization per slice, like 24 for the /24 slices')
         network_taken.add_argument('-v', '--verbose', action='store_true', default=None, help='Verbose Mode')
         network_ipinfo = network_args.add_parser('ipinfo', help='Show Network IP Information')
         network_ipinfo.add_argument('name', help='Network Name').completer = Helper().name_completer(self.table)
@@ -198,7 +203,8 @@ class Network():
 
     def reserve_network(self):
         """
-        This method will show all Nodes boots with the OSimage.
+        This method will show the reserved IP Addresses of a network, one per row or as
+        ranges, totals or slices.
         """
         return Helper().reserved_ip(self.args)
 
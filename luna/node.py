@@ -36,9 +36,15 @@ from luna.utils.helper import Helper
 from luna.utils.presenter import Presenter
 from luna.utils.rest import Rest
 from luna.utils.log import Log
-from luna.utils.constant import actions, BOOL_CHOICES, BOOL_META
+from luna.utils.constant import actions, BOOL_CHOICES, BOOL_META, IMPORT_WORKERS, filter_columns
 from luna.utils.message import Message
+from luna.utils.cache import NameCache
 from luna.utils.arguments import Arguments
+from luna.utils.parallel import Parallel
+from luna.utils.query import Query
+from luna.utils.importer import NodeImporter
+from luna.utils.rollout import RollingPush
+from luna.utils.ipplan import IPPlanner
 
 
 class Node():
@@ -74,10 +80,10 @@ class Node():
         node_menu = Helper().get_help_message(subparsers, self.table)
         node_args = node_menu.add_subparsers(dest='action', title='commands', description='Available node operations')
         node_list = node_args.add_parser('list', help='List All Nodes')
-        Arguments().common_list_args(node_list, True)
+        Arguments().common_list_args(node_list, True, cached=True, query=True)
         node_show = node_args.add_parser('show', help='Show A Node')
         node_show.add_argument('name', help='Name of the Node').completer = Helper().name_completer(self.table)
-        Arguments().common_list_args(node_show)
+        Arguments().common_list_args(node_show, cached=True)
         node_show.add_argument('-f', '--full-scripts', action='store_true', default=None, help='Show the Full Scripts')
         node_add = node_args.add_parser('add', help='Add A Node')
         node_add.add_argument('name', help='Name of the Node')
@@ -85,10 +91,12 @@ class Node():
         node_change = node_args.add_parser('change', help='Make Changes Into a Node')
         node_change.add_argument('name', help='Name of the Node').completer = Helper().name_completer(self.table)
         Arguments().common_node_args(node_change)
+        node_change.add_argument('--parallel', type=int, metavar='N', help='Run on N nodes at once, with one summary at the end')
         node_clone = node_args.add_parser('clone', help='Clone A Node')
         node_clone.add_argument('name', help='Name of the Node').completer = Helper().name_completer(self.table)
         Arguments().common_node_args(node_clone)
-        node_clone.add_argument('newnodename', help='New Name for the Node')
+        node_clone.add_argument('newnodename', help='New Name for the Node, or a hostlist where --ipaddress is the first address to hand out or auto')
+        node_clone.add_argument('--parallel', type=int, metavar='N', help='Run on N nodes at once, with one summary at the end')
         node_rename = node_args.add_parser('rename', help='Rename A Node')
         node_rename.add_argument('name', help='Name of the Node').completer = Helper().name_completer(self.table)
         node_rename.add_argument('newnodename', help='New Name for the Node')
@@ -96,6 +104,15 @@ class Node():
         node_remove = node_args.add_parser('remove', help='Remove A Node')
         node_remove.add_argument('name', help='Name of the Node').completer = Helper().name_completer(self.table)
         node_remove.add_argument('-v', '--verbose', action='store_true', default=None, help='Verbose Mode')
+        node_remove.add_argument('--parallel', type=int, metavar='N', help='Run on N nodes at once, with one summary at the end')
+        node_import = node_args.add_parser('import', help='Add Nodes from a CSV File')
+        node_import.add_argument('file', help='CSV file with a header line, name,group,interface,ipaddress,macaddress,network '
+                                              'or columns like ib0.ipaddress for more interfaces, an ipaddress auto takes the next free one')
+        node_import.add_argument('--check', action='store_true', default=None, help='Only check the file, add nothing')
+        node_import.add_argument('--resume', action='store_true', default=None, help='Skip the nodes the journal has as added')
+        node_import.add_argument('--journal', metavar='<file>', help='Journal file, default <file>.journal')
+        node_import.add_argument('--parallel', type=int, metavar='N', help=f'Add N nodes at once, default {IMPORT_WORKERS}')
+        node_import.add_argument('-v', '--verbose', action='store_true', default=None, help='Verbose Mode')
         node_osgrab = node_args.add_parser('osgrab', help="Grab a Node's live file system into an OSImage. "
                                                  'Utilizes the settings for grab_filesystems and grab_exclude '
                                                  'of the provided OSImage')
@@ -105,6 +122,7 @@ class Node():
         node_osgrab.add_argument('--nodry', action='store_true', default=None,
                                  help='No Dry flag to avoid dry run')
         node_osgrab.add_argument('-v', '--verbose', action='store_true', default=None, help='Verbose Mode')
+        node_osgrab.add_argument('--parallel', type=int, metavar='N', help='Run on N nodes at once, with one summary at the end')
         node_ospush = node_args.add_parser('ospush', help='Push an OSImage to a Node. Utilizes the settings for '
                                                           'grab_filesystems and grab_exclude of the provided OSImage')
         node_ospush.add_argument('name', help='Name of the Node').completer = Helper().name_completer(self.table)
@@ -112,6 +130,8 @@ class Node():
         node_ospush.add_argument('--nodry', action='store_true', default=None,
                                  help='No Dry flag to avoid dry run')
         node_ospush.add_argument('-v', '--verbose', action='store_true', default=None, help='Verbose Mode')
+        node_ospush.add_argument('--parallel', type=int, metavar='N', help='Run on N nodes at once, with one summary at the end')
+        Arguments().rolling_args(node_ospush)
         node_interfaces = node_args.add_parser('listinterface', help='List Node Interfaces')
         node_interfaces.add_argument('name', help='Name of the Node').completer = Helper().name_completer(self.table)
         Arguments().common_list_args(node_interfaces)
@@ -162,21 +182,23 @@ class Node():
         """
         response = False
         fields, rows = [], []
-        get_list = Rest().get_data(self.table)
+        get_list = Helper().config_data(self.table, None, self.args)
         if get_list.status_code == 200:
             get_list = get_list.content
         else:
             Message().error_exit(get_list.content, get_list.status_code)
         self.logger.debug(f'Get List Data from Helper => {get_list}')
         if get_list:
-            data = get_list['config'][self.table]
-            if self.args.get('csv'):
+            data = Query(self.args).apply(get_list['config'][self.table])
+            if self.args.get('fields') or self.args.get('output') in ['ndjson', 'tsv']:
+                response = Helper().output_records(self.table, data.values(), self.args)
+            elif self.args.get('csv'):
                 response = Helper().column_csv(self.table, data, self.args['csv'])
             elif 'raw' in self.args and self.args['raw']:
                 json_data = Helper().prepare_json(data)
                 response = Presenter().show_json(json_data)
             else:
-                data = Helper().prepare_json(data, True)
+                data = Helper().prepare_json(data, True, filter_columns(self.table))
                 fields, rows  = Helper().filter_nodelist_col(self.table, data)
                 self.logger.debug(f'Fields => {fields}')
                 self.logger.debug(f'Rows => {rows}')
@@ -272,6 +294,7 @@ class Node():
         if 'local' in self.args:
             local = self.args['local']
             del self.args['local']
+        parallel = self.args.pop('parallel', None)
         real_args = deepcopy(self.args)
         hostlist = Helper().get_hostlist(self.args['name'])
         hostlist = Helper().luna_hostlist(hostlist)
@@ -310,18 +333,21 @@ class Node():
         if record.status_code == 200:
             if 'config' in record.content:
                 if self.table in record.content['config']:
-                    records = list(record.content['config'][self.table].keys())
+                    snapshot = record.content['config'][self.table]
+                    records = list(snapshot.keys())
                     if all(x in records for x in hostlist) is True:
                         if hostlist:
-                            for each in hostlist:
-                                if each in records:
-                                    self.args['name'] = each
-                                    real_args['name'] = each
-                                    change = Helper().compare_data(self.table, real_args)
-                                    if change is True:
-                                        Helper().update_record(self.table, self.args, local)
-                                    else:
-                                        Message().show_error('Nothing is changed, Kindly change something to update')
+                            def change_each(each):
+                                node_args = deepcopy(self.args)
+                                node_args['name'] = each
+                                node_real_args = deepcopy(real_args)
+                                node_real_args['name'] = each
+                                change = Helper().compare_data(self.table, node_real_args, snapshot[each])
+                                if change is True:
+                                    Helper().update_record(self.table, node_args, local, exists=True)
+                                else:
+                                    Message().show_error('Nothing is changed, Kindly change something to update')
+                            self.run_hostlist(hostlist, change_each, parallel)
                         else:
                             Message().error_exit(f'Node Hostlist is: {hostlist}')
                     else:
@@ -340,6 +366,28 @@ class Node():
         # return Helper().update_record(self.table, self.args)
 
 
+    def run_hostlist(self, hostlist=None, call=None, parallel=None):
+        """
+        This method will run the call for each node of the hostlist, one after the other, or with
+        a pool of parallel workers and a single summary at the end.
+        """
+        if parallel:
+            title = f'<< {self.table_cap} {self.args["action"].capitalize()} >>'
+            runner = Parallel(parallel)
+            return runner.show_summary(title, runner.run(hostlist, call))
+        for each in hostlist:
+            call(each)
+        return True
+
+
+    def import_node(self):
+        """
+        Method to add the nodes of a CSV file in Luna Configuration.
+        """
+        importer = NodeImporter(self.args['file'], self.args['journal'], self.args['parallel'])
+        return importer.run(self.args['resume'], self.args['check'])
+
+
     def rename_node(self):
         """
         Method to rename a node in Luna Configuration.
@@ -351,6 +399,7 @@ class Node():
         """
         Method to remove a node in Luna Configuration.
         """
+        parallel = self.args.pop('parallel', None)
         hostlist = Helper().get_hostlist(self.args['name'])
         hostlist = Helper().luna_hostlist(hostlist)
         record = Rest().get_data(self.table)
@@ -360,10 +409,9 @@ class Node():
                     records = list(record.content['config'][self.table].keys())
                     if all(x in records for x in hostlist) is True:
                         if hostlist:
-                            for each in hostlist:
-                                if each in records:
-                                    self.args['name'] = each
-                                    Helper().delete_record(self.table, self.args)
+                            def remove_each(each):
+                                Helper().delete_record(self.table, dict(deepcopy(self.args), name=each))
+                            self.run_hostlist(hostlist, remove_each, parallel)
                         else:
                             Message().error_exit(f'Node Hostlist is: {hostlist}')
                     else:
@@ -386,6 +434,7 @@ class Node():
         """
         Method to grab an osimage to a node.
         """
+        parallel = self.args.pop('parallel', None)
         hostlist = Helper().get_hostlist(self.args['name'])
         hostlist = Helper().luna_hostlist(hostlist)
         record = Rest().get_data(self.table)
@@ -395,10 +444,9 @@ class Node():
                     records = list(record.content['config'][self.table].keys())
                     if all(x in records for x in hostlist) is True:
                         if hostlist:
-                            for each in hostlist:
-                                if each in records:
-                                    self.args['name'] = each
-                                    Helper().grab_osimage(self.table, self.args)
+                            def osgrab_each(each):
+                                Helper().grab_osimage(self.table, dict(deepcopy(self.args), name=each))
+                            self.run_hostlist(hostlist, osgrab_each, parallel)
                         else:
                             Message().error_exit(f'Node Hostlist is: {hostlist}')
                     else:
@@ -422,6 +470,10 @@ class Node():
         """
         Method to push an osimage to a node.
         """
+        parallel = self.args.pop('parallel', None)
+        rolling = RollingPush.pop_args(self.args)
+        if rolling and parallel:
+            Message().error_exit('ERROR :: --parallel can not be used with --rolling, --canary or --max-failure-rate, use --window')
         hostlist = Helper().get_hostlist(self.args['name'])
         hostlist = Helper().luna_hostlist(hostlist)
         record = Rest().get_data(self.table)
@@ -430,11 +482,12 @@ class Node():
                 if self.table in record.content['config']:
                     records = list(record.content['config'][self.table].keys())
                     if all(x in records for x in hostlist) is True:
-                        if hostlist:
-                            for each in hostlist:
-                                if each in records:
-                                    self.args['name'] = each
-                                    Helper().push_osimage(self.table, self.args)
+                        if hostlist and rolling:
+                            RollingPush(self.args, **rolling).run(hostlist)
+                        elif hostlist:
+                            def ospush_each(each):
+                                Helper().push_osimage(self.table, dict(deepcopy(self.args), name=each))
+                            self.run_hostlist(hostlist, ospush_each, parallel)
                         else:
                             Message().error_exit(f'Node Hostlist is: {hostlist}')
                     else:
@@ -457,6 +510,7 @@ class Node():
         """
         Method to rename a node in Luna Configuration.
         """
+        parallel = self.args.pop('parallel', None)
         hostlist = Helper().get_hostlist(self.args['newnodename'])
         hostlist = Helper().luna_hostlist(hostlist)
         if self.args['interface'] is None and (self.args['network'] or self.args['ipaddress'] or self.args['macaddress'] or self.args['options']):
@@ -488,8 +542,8 @@ class Node():
             self.args['interfaces'] = [interface]
             for remove in ['interface', 'network', 'ipaddress', 'macaddress', 'options', 'mtu', 'vlanid', 'vlan_parent', 'bond_mode', 'bond_slaves', 'dhcp']:
                 self.args.pop(remove, None)
-            if len(hostlist) > 1 and ('ipaddress' in interface or 'macaddress' in interface):
-                Message().error_exit('Interface IP Address or MAC Address can not be use with the hostlist, Kindly provide the single node or remove the IP Address and MAC Address.')
+            if len(hostlist) > 1 and 'macaddress' in interface:
+                Message().error_exit('Interface MAC Address can not be use with the hostlist, Kindly provide the single node or remove the MAC Address.')
         record = Rest().get_data(self.table)
         if record.status_code == 200:
             if 'config' in record.content:
@@ -497,10 +551,16 @@ class Node():
                     records = list(record.content['config'][self.table].keys())
                     if all(x in records for x in hostlist) is False:
                         if hostlist:
-                            for each in hostlist:
-                                if each not in records:
-                                    self.args['newnodename'] = each
-                                    Helper().clone_record(self.table, self.args)
+                            hostlist = [each for each in hostlist if each not in records]
+                            plan = {}
+                            if 'ipaddress' in interface and (len(hostlist) > 1 or interface['ipaddress'] == 'auto'):
+                                plan = self.plan_clone(hostlist, interface, record.content['config'][self.table].get(self.args['name'], {}))
+                            def clone_each(each):
+                                data = deepcopy(self.args)
+                                if each in plan:
+                                    data['interfaces'][0]['ipaddress'] = plan[each]
+                                Helper().clone_record(self.table, dict(data, newnodename=each))
+                            self.run_hostlist(hostlist, clone_each, parallel)
                         else:
                             Message().error_exit(f'Node Hostlist is: {hostlist}')
                     else:
@@ -519,6 +579,27 @@ class Node():
         # return Helper().clone_record(self.table, self.args)
 
 
+    def plan_clone(self, hostlist=None, interface=None, source=None):
+        """
+        Method to plan the IP addresses of the cloned nodes, the --ipaddress is the first address
+        to hand out, or auto for the first free one. The network is the one of the interface, or
+        of the same interface of the source node, taken from the snapshot of the node table.
+        """
+        network = interface.get('network')
+        if not network:
+            for each in source.get('interfaces') or []:
+                if each.get('interface') == interface['interface']:
+                    network = each.get('network')
+        if not network:
+            Message().error_exit(f'ERROR :: Kindly supply the network of interface {interface["interface"]} to plan the IP addresses.')
+        start = None if interface['ipaddress'] == 'auto' else interface['ipaddress']
+        planner = IPPlanner(network)
+        plan = planner.plan(hostlist, start)
+        planner.check(plan)
+        self.logger.debug(f'IP Plan => {plan}')
+        return plan
+
+
     def listinterface(self):
         """
         Method to list a node interfaces in Luna Configuration.
@@ -536,7 +617,7 @@ class Node():
                 json_data = Helper().prepare_json(data)
                 Presenter().show_json(json_data)
             else:
-                data = Helper().prepare_json(data, True)
+                data = Helper().prepare_json(data, True, filter_columns(self.interface))
                 fields, rows  = Helper().filter_interface(self.interface, data)
                 self.logger.debug(f'Fields => {fields}')
                 self.logger.debug(f'Rows => {rows}')
@@ -706,6 +787,7 @@ class Node():
                 response = Rest().post_data(self.table, node_name+'/interfaces', request_data)
                 self.logger.debug(f'Response => {response}')
                 if response.status_code in (204,201):
+                    NameCache(self.table, node_name, kind='interfaces').invalidate()
                     Message().show_success(f'Node {node_name} Interface {interface["interface"]} is updated.')
                 else:
                     Message().error_exit(response.content, response.status_code)
@@ -730,6 +812,7 @@ class Node():
             response = Rest().get_delete(self.table, uri)
             self.logger.debug(f'Response => {response}')
             if response.status_code == 204:
+                NameCache(self.table, payload['name'], kind='interfaces').invalidate()
                 msg = f'Node {payload["name"]} Interface {payload["interface"]} is removed.'
                 Message().show_success(msg)
             else:
@@ -767,6 +850,7 @@ class Node():
                 response = Rest().post_data(self.table, node_name+'/interfaces', request_data)
                 self.logger.debug(f'Response => {response}')
                 if response.status_code in (204,201):
+                    NameCache(self.table, node_name, kind='interfaces').invalidate()
                     Message().show_success(f'Node {node_name} Interface {interface["interface"]} is updated.')
                 else:
                     Message().error_exit(response.content, response.status_code)
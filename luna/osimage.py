@@ -30,12 +30,12 @@ __email__       = "sumit.sharma@clustervision.com"
 __status__      = "Development"
 
 from operator import methodcaller
-from time import sleep
-from multiprocessing import Process
 from luna.utils.helper import Helper
 from luna.utils.rest import Rest
+from luna.utils.cache import NameCache
 from luna.utils.log import Log
-from luna.utils.constant import actions
+from luna.utils.watcher import TaskWatcher
+from luna.utils.constant import actions, WATCH_FIRST_POLL
 from luna.utils.message import Message
 from luna.utils.arguments import Arguments
 from luna.utils.presenter import Presenter
@@ -78,13 +78,13 @@ class OSImage():
         osimage_menu = Helper().get_help_message(subparsers, self.table)
         osimage_args = osimage_menu.add_subparsers(dest='action', title='commands', description='Available osimage operations')
         osimage_list = osimage_args.add_parser('list', help='Lists available OSImages')
-        Arguments().common_list_args(osimage_list, True)
+        Arguments().common_list_args(osimage_list, True, cached=True, query=True)
         osimage_show = osimage_args.add_parser('show', help='Show a OSImage')
         osimage_show.add_argument('name', help='OSImage Name').completer = Helper().name_completer(self.table)
-        Arguments().common_list_args(osimage_show)
+        Arguments().common_list_args(osimage_show, cached=True)
         osimage_member = osimage_args.add_parser('member', help='Lists which nodes are using the OSImage')
         osimage_member.add_argument('name', help='OSImage Name').completer = Helper().name_completer(self.table)
-        Arguments().common_list_args(osimage_member)
+        Arguments().common_list_args(osimage_member, cached=True)
         osimage_add = osimage_args.add_parser('add', help='Add an OSImage')
         osimage_add.add_argument('name', help='OSImage Name')
         Arguments().common_osimage_args(osimage_add)
@@ -207,44 +207,15 @@ class OSImage():
         request_data = {'config':{self.table:{payload['name']: payload}}}
         self.logger.debug(f'Payload => {request_data}')
         result = Rest().post_clone(self.table, payload['name'], request_data)
+        if result.status_code in [200, 201]:
+            NameCache(self.table).invalidate()
         if result.status_code == 200:
             http_response = result.content
             if 'request_id' in http_response.keys():
-                process1 = Process(target=Helper().loader, args=("OSImage Cloning...",))
-                process1.start()
-                uri = f'config/status/{http_response["request_id"]}'
-                def dig_packing_status(uri):
-                    task_status = 200
-                    result = Rest().get_raw(route=uri, noexit=True)
-                    if isinstance(result, bool):
-                        sleep(2)
-                        return 503
-                    elif result.status_code == 404:
-                        pass
-                    elif result.status_code == 200:
-                        http_response = result.json()
-                        if 'status' in http_response and isinstance(http_response['status'], int):
-                            task_status = http_response['status']
-                        if http_response['message']:
-                            message = http_response['message'].split(';;')
-                            for msg in message:
-                                sleep(1)
-                                Message().show_success(f'{msg}')
-                        if task_status == 404: # even if the image is not found, we fail
-                            return 500
-                        elif task_status != 200:
-                            return task_status
-                    else:
-                        Message().show_error(f'{result.content}', result.status_code)
-                    return result.status_code
-            response = True
-            status = 200
-            while status != 404:
-                status = dig_packing_status(uri)
-                if status in [500, 501, 503]:
-                    response = False
-                sleep(2)
-            process1.terminate()
+                process1 = Helper().start_loader("OSImage Cloning...")
+                watcher = TaskWatcher('config', http_response['request_id'])
+                response = watcher.watch()
+                Helper().stop_loader(process1)
         if response:
             Message().show_success(f'[========] OSImage {self.args["newosimage"]} Cloned.')
         elif response is None:
@@ -267,51 +238,16 @@ class OSImage():
                 if len(http_response['message']) > 5:
                     message = http_response['message'].split(';;')
                     for msg in message:
-                        sleep(2)
                         Message().show_success(f'{msg}')
                 else:
                     Message().show_success(f'{http_response["message"]}')
 
-            if 'request_id' in http_response.keys():
-                process1 = Process(target=Helper().loader, args=("OSImage Packing...",))
-                process1.start()
-                uri = f'config/status/{http_response["request_id"]}'
-                def dig_packing_status(uri):
-                    task_status = 200
-                    result = Rest().get_raw(route=uri, noexit=True)
-                    if isinstance(result, bool):
-                        sleep(2)
-                        return 503
-                    elif result.status_code == 404:
-                        pass
-                    elif result.status_code == 200:
-                        http_response = result.json()
-                        if 'status' in http_response and isinstance(http_response['status'], int):
-                            task_status = http_response['status']
-                        if http_response['message']:
-                            if len(http_response['message']) > 5:
-                                message = http_response['message'].split(';;')
-                                for msg in message:
-                                    sleep(1)
-                                    Message().show_success(f'{msg}')
-                            else:
-                                Message().show_success(f'{http_response["message"]}')
-                        if task_status == 404: # even if the image is not found, we fail
-                            return 500
-                        elif task_status != 200:
-                            return task_status
-                    else:
-                        Message().show_error(f'{result.content}', result.status_code)
-                        return 500
-                    return result.status_code
             response = True
-            status = 200
-            while status != 404:
-                sleep(2) # yes, before.
-                status = dig_packing_status(uri)
-                if status in [500, 501, 503]:
-                    response = False
-            process1.terminate()
+            if 'request_id' in http_response.keys():
+                process1 = Helper().start_loader("OSImage Packing...")
+                watcher = TaskWatcher('config', http_response['request_id'], first_poll=WATCH_FIRST_POLL)
+                response = watcher.watch()
+                Helper().stop_loader(process1)
         if response:
             Message().show_success(f'[========] Image {self.args["name"]} Packed.')
         elif response is None:
@@ -357,51 +293,16 @@ class OSImage():
                 if len(http_response['message']) > 5:
                     message = http_response['message'].split(';;')
                     for msg in message:
-                        sleep(2)
                         Message().show_success(f'{msg}')
                 else:
                     Message().show_success(f'{http_response["message"]}')
 
-            if 'request_id' in http_response.keys():
-                process1 = Process(target=Helper().loader, args=("OSImage Certificate Updating...",))
-                process1.start()
-                uri = f'config/status/{http_response["request_id"]}'
-                def dig_packing_status(uri):
-                    task_status = 200
-                    result = Rest().get_raw(route=uri, noexit=True)
-                    if isinstance(result, bool):
-                        sleep(2)
-                        return 503
-                    elif result.status_code == 404:
-                        pass
-                    elif result.status_code == 200:
-                        http_response = result.json()
-                        if 'status' in http_response and isinstance(http_response['status'], int):
-                            task_status = http_response['status']
-                        if http_response['message']:
-                            if len(http_response['message']) > 5:
-                                message = http_response['message'].split(';;')
-                                for msg in message:
-                                    sleep(1)
-                                    Message().show_success(f'{msg}')
-                            else:
-                                Message().show_success(f'{http_response["message"]}')
-                        if task_status == 404: # even if the image is not found, we fail
-                            return 500
-                        elif task_status != 200:
-                            return task_status
-                    else:
-                        Message().show_error(f'{result.content}', result.status_code)
-                        return 500
-                    return result.status_code
             response = True
-            status = 200
-            while status != 404:
-                sleep(2) # yes, before.
-                status = dig_packing_status(uri)
-                if status in [500, 501, 503]:
-                    response = False
-            process1.terminate()
+            if 'request_id' in http_response.keys():
+                process1 = Helper().start_loader("OSImage Certificate Updating...")
+                watcher = TaskWatcher('config', http_response['request_id'], first_poll=WATCH_FIRST_POLL)
+                response = watcher.watch()
+                Helper().stop_loader(process1)
         if response:
             Message().show_success(f'[========] Image {self.args["name"]} certificates updated.')
         elif response is None:
@@ -431,47 +332,16 @@ class OSImage():
                 if len(http_response['message']) > 5:
                     message = http_response['message'].split(';;')
                     for msg in message:
-                        sleep(2)
                         Message().show_success(f'{msg}')
                 else:
                     Message().show_success(f'{http_response["message"]}')
 
-            if 'request_id' in http_response.keys():
-                process1 = Process(target=Helper().loader, args=("OSImage Kernel Updating...",))
-                process1.start()
-                uri = f'config/status/{http_response["request_id"]}'
-                def dig_packing_status(uri):
-                    task_status = 200
-                    result = Rest().get_raw(route=uri, noexit=True)
-                    if isinstance(result, bool):
-                        sleep(2)
-                        return 503
-                    elif result.status_code == 404:
-                        pass
-                    elif result.status_code == 200:
-                        http_response = result.json()
-                        if 'status' in http_response and isinstance(http_response['status'], int):
-                            task_status = http_response['status']
-                        if http_response['message']:
-                            message = http_response['message'].split(';;')
-                            for msg in message:
-                                sleep(1)
-                                Message().show_success(f'{msg}')
-                        if task_status == 404: # even if the image is not found, we fail
-                            return 500
-                        elif task_status != 200:
-                            return task_status
-                    else:
-                        Message().show_error(f'{result.content}', result.status_code)
-                    return result.status_code
             response = True
-            status = 200
-            while status != 404:
-                sleep(2) # yes, before.
-                status = dig_packing_status(uri)
-                if status in [500, 501, 503]:
-                    response = False
-            process1.terminate()
+            if 'request_id' in http_response.keys():
+                process1 = Helper().start_loader("OSImage Kernel Updating...")
+                watcher = TaskWatcher('config', http_response['request_id'], first_poll=WATCH_FIRST_POLL)
+                response = watcher.watch()
+                Helper().stop_loader(process1)
             if response:
                 Message().show_success(f'[========] Image {self.args["name"]} Packed.')
             elif response is None:
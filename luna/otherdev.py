@@ -65,10 +65,10 @@ class OtherDev():
         otherdev_menu = Helper().get_help_message(subparsers, self.table)
         otherdev_args = otherdev_menu.add_subparsers(dest='action', title='commands', description='Available otherdev operations')
         otherdev_list = otherdev_args.add_parser('list', help='List Other Devices')
-        Helper().common_list_args(otherdev_list, True)
+        Helper().common_list_args(otherdev_list, True, cached=True, query=True)
         otherdev_show = otherdev_args.add_parser('show', help='Show Other Devices')
         otherdev_show.add_argument('name', help='Other Device Name').completer = Helper().name_completer(self.table)
-        Helper().common_list_args(otherdev_show)
+        Helper().common_list_args(otherdev_show, cached=True)
         otherdev_add = otherdev_args.add_parser('add', help='Add Other Devices')
         otherdev_add.add_argument('name', help='Other Device Name')
         otherdev_add.add_argument('-N', '--network', help='Network Name').completer = Helper().name_completer("network")
@@ -35,6 +35,8 @@ from luna.utils.presenter import Presenter
 from luna.utils.rest import Rest
 from luna.utils.log import Log
 from luna.utils.message import Message
+from luna.utils.cache import NameCache
+from luna.utils.arguments import Arguments
 
 class Secrets():
     """
@@ -66,19 +68,16 @@ class Secrets():
         secrets_args = secrets_menu.add_subparsers(dest='action', title='commands', description='Available secrets operations')
         ## >>>>>>> Secrets Command >>>>>>> list
         list_secrets = secrets_args.add_parser('list', help='List Secrets')
-        list_secrets.add_argument('-v', '--verbose', action='store_true', default=None, help='Verbose Mode')
-        list_secrets.add_argument('-R', '--raw', action='store_true', default=None, help='Raw JSON output')
+        Arguments().common_list_args(list_secrets, output=True)
         list_parser = list_secrets.add_subparsers(dest='entity')
         list_node = list_parser.add_parser('node', help='List Node Secrets')
         list_node.add_argument('name', help='Name of the Node').completer = Helper().name_completer("node")
         list_node.add_argument('-s', '--secret', help='Name of the Secret').completer = Helper().secret_name_completer(self.route, "node")
-        list_node.add_argument('-R', '--raw', action='store_true', default=None, help='Raw JSON output')
-        list_node.add_argument('-v', '--verbose', action='store_true', default=None, help='Verbose Mode')
+        Arguments().common_list_args(list_node, output=True)
         list_group = list_parser.add_parser('group', help='List Group Secrets')
         list_group.add_argument('name', help='Name of the Group').completer = Helper().name_completer("group")
         list_group.add_argument('-s', '--secret', help='Name of the Secret').completer = Helper().secret_name_completer(self.route, "group")
-        list_group.add_argument('-R', '--raw', action='store_true', default=None, help='Raw JSON output')
-        list_group.add_argument('-v', '--verbose', action='store_true', default=None, help='Verbose Mode')
+        Arguments().common_list_args(list_group, output=True)
         ## >>>>>>> Secrets Command >>>>>>> show
         show_secrets = secrets_args.add_parser('show', help='Show Secrets')
         show_parser = show_secrets.add_subparsers(dest='entity')
@@ -194,7 +193,10 @@ class Secrets():
             self.logger.debug(f'Get List Data from Helper => {get_list}')
             if get_list:
                 data = get_list['config']['secrets']
-                if self.args['raw']:
+                if self.args.get('fields') or self.args.get('output') in ['ndjson', 'tsv']:
+                    fields = ['entity', 'owner', 'name', 'path', 'content']
+                    Helper().output_records(self.route, self.secret_records(data), self.args, fields)
+                elif self.args['raw']:
                     json_data = Helper().prepare_json(data)
                     Presenter().show_json(json_data)
                 else:
@@ -223,6 +225,16 @@ class Secrets():
         return True
 
 
+    def secret_records(self, data=None):
+        """
+        This method will yield one record per secret, with the entity and the owner name.
+        """
+        for entity in ['group', 'node']:
+            for owner, secrets in data.get(entity, {}).items():
+                for secret in secrets:
+                    yield {'entity': entity, 'owner': owner, **secret}
+
+
     def show_secrets(self):
         """
         Method to show Secrets for node or group
@@ -306,6 +318,7 @@ class Secrets():
                     response = Rest().post_data(self.route, uri, request_data)
                     self.logger.debug(f'Response => {response}')
                     if response.status_code == 201:
+                        NameCache(entity, entity_name, kind='secrets').invalidate()
                         Message().show_success(response.content)
                     else:
                         Message().error_exit(response.content, response.status_code)
@@ -389,6 +402,7 @@ class Secrets():
                 response = Rest().post_clone(self.route, uri, request_data)
                 self.logger.debug(f'Response => {response}')
                 if response.status_code == 201:
+                    NameCache(entity, entity_name, kind='secrets').invalidate()
                     Message().show_success(response.content)
                 else:
                     Message().error_exit(response.content, response.status_code)
@@ -420,6 +434,7 @@ class Secrets():
                 response = Rest().get_delete(self.route, uri)
                 self.logger.debug(f'Response => {response}')
                 if response.status_code == 204:
+                    NameCache(entity, entity_name, kind='secrets').invalidate()
                     Message().show_success(f'{entity.capitalize()} {entity_name} secret {payload["secret"]} is removed.')
                 else:
                     Message().error_exit(response.content, response.status_code)
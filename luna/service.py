@@ -29,11 +29,11 @@ __maintainer__  = "Sumit Sharma"
 __email__       = "sumit.sharma@clustervision.com"
 __status__      = "Development"
 
-from time import sleep
-from multiprocessing import Process
+import sys
 from luna.utils.helper import Helper
 from luna.utils.rest import Rest
 from luna.utils.log import Log
+from luna.utils.watcher import TaskWatcher
 from luna.utils.constant import SERVICES, SERVICE_ACTIONS
 from luna.utils.message import Message
 
@@ -78,6 +78,18 @@ class Service():
         return parser
 
 
+    @staticmethod
+    def service_format(message=None, task_status=None):
+        """
+        This method will mark a service message as failed on the task status, or when the
+        message reports an error.
+        """
+        # the error text check will disappear in the future as we track per tasks status
+        if 'error' in message.lower() or 'fail' in message.lower():
+            return f'[ FAILED ] {message}'
+        return TaskWatcher.progress_format(message, task_status)
+
+
     def service_action(self):
         """
         Method to will perform the action on the desired service by Luna Daemon's API.
@@ -106,46 +118,11 @@ class Service():
                 Message().error_exit(content, status_code)
         else:
             fetch_msg = f"{self.args['service']} {self.args['action']}..."
-            process1 = Process(target=Helper().loader, args=(fetch_msg,))
-            process1.start()
+            process1 = Helper().start_loader(fetch_msg)
             if 'request_id' in content:
-                uri = f'service/status/{content["request_id"]}'
-                def dig_service_status(uri):
-                    task_status = 200
-                    result = Rest().get_raw(route=uri, noexit=True)
-                    if isinstance(result, bool):
-                        sleep(2)
-                        return 503
-                    elif result.status_code == 404:
-                        pass
-                    elif result.status_code == 200:
-                        http_response = result.json()
-                        if http_response['message']:
-                            message = http_response['message'].split(';;')
-                            if 'status' in http_response and isinstance(http_response['status'], int):
-                                task_status = http_response['status']
-                            for msg in message:
-                                sleep(1)
-                                if task_status != 200:
-                                    Message().show_success(f'[ FAILED ] {msg}')
-                                    return task_status
-                                # below 'elif' will disappear in the future as we track per tasks status like above 'if'
-                                elif 'error' in msg.lower() or 'fail' in msg.lower():
-                                    Message().show_success(f'[ FAILED ] {msg}')
-                                    return task_status
-                                else:
-                                    Message().show_success(f'[========] {msg}')
-                    else:
-                        Message().error_exit(result.content, result.status_code)
-                    return result.status_code
-                status = 200
-                response = True
-                while status != 404:
-                    status = dig_service_status(uri)
-                    if status in [500, 501, 503]:
-                        response = False
-                    sleep(1)
-                process1.terminate()
+                watcher = TaskWatcher('service', content['request_id'], self.service_format)
+                response = watcher.watch()
+                Helper().stop_loader(process1)
                 service = self.args['service']
                 action = self.args['action']
                 if response:
@@ -153,6 +130,6 @@ class Service():
                 else:
                     Message().show_failed_exit(f'[ FAILED ] Service {service} {action} is finished unsuccesfully.')
             else:
-                process1.terminate()
+                Helper().stop_loader(process1)
                 Message().error_exit(result.content, result.status_code)
         return response
@@ -35,7 +35,7 @@ from luna.utils.helper import Helper
 from luna.utils.log import Log
 from luna.utils.presenter import Presenter
 from luna.utils.rest import Rest
-from luna.utils.constant import actions, BOOL_CHOICES, BOOL_META
+from luna.utils.constant import actions, BOOL_CHOICES, BOOL_META, filter_columns
 from luna.utils.message import Message
 
 class Switch():
@@ -69,10 +69,10 @@ class Switch():
         switch_menu = Helper().get_help_message(subparsers, self.table)
         switch_args = switch_menu.add_subparsers(dest='action', title='commands', description='Available switch operations')
         switch_list = switch_args.add_parser('list', help='List Switch')
-        Helper().common_list_args(switch_list, True)
+        Helper().common_list_args(switch_list, True, cached=True, query=True)
         switch_show = switch_args.add_parser('show', help='Show Switch')
         switch_show.add_argument('name', help='Switch Name').completer = Helper().name_completer(self.table)
-        Helper().common_list_args(switch_show)
+        Helper().common_list_args(switch_show, cached=True)
         switch_add = switch_args.add_parser('add', help='Add Switch')
         switch_add.add_argument('name', help='Switch Name')
         switch_add.add_argument('--vendor', help='Add Switch Vendor Name')
@@ -286,7 +286,7 @@ class Switch():
         if self.args['raw']:
             Presenter().show_json(Helper().prepare_json(data))
         else:
-            data = Helper().prepare_json(data, True)
+            data = Helper().prepare_json(data, True, filter_columns(self.interface))
             fields, rows = Helper().filter_interface(self.interface, data)
             title = f' << {self.table_cap} {self.args["name"]} Interfaces >>'
             Presenter().show_table(title, fields, rows)
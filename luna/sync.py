@@ -0,0 +1,122 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+# This code is part of the TrinityX software suite
+# Copyright (C) 2025  ClusterVision Solutions b.v.
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program.  If not, see <https://www.gnu.org/licenses/>
+
+
+"""
+Sync Class for the CLI
+"""
+__author__      = "Sumit Sharma"
+__copyright__   = "Copyright 2025, Luna2 Project [CLI]"
+__license__     = "GPL"
+__version__     = "2.1"
+__maintainer__  = "Sumit Sharma"
+__email__       = "sumit.sharma@clustervision.com"
+__status__      = "Development"
+
+import sys
+from time import time
+from luna.utils.helper import Helper
+from luna.utils.mirror import Mirror
+from luna.utils.presenter import Presenter
+from luna.utils.log import Log
+from luna.utils.message import Message
+from luna.utils.constant import MIRROR_TABLES, MIRROR_STALE_AGE
+
+
+class Sync():
+    """
+    Sync Class responsible to keep the local mirror of the cluster configuration.
+    """
+
+    def __init__(self, args=None, parser=None, subparsers=None):
+        self.logger = Log.get_logger()
+        self.args = args
+        self.route = "sync"
+        if self.args:
+            self.logger.debug(f'Arguments Supplied => {self.args}')
+            if self.args['find']:
+                self.find_mirror()
+            elif self.args['status']:
+                self.status_mirror()
+            else:
+                self.sync_mirror()
+        else:
+            self.get_arguments(parser, subparsers)
+
+
+    def get_arguments(self, parser, subparsers):
+        """
+        Method will provide all the arguments related to the Sync class.
+        """
+        sync_menu = Helper().get_help_message(subparsers, self.route)
+        sync_menu.add_argument('tables', nargs='*', metavar='table',
+                               help=f'Tables to sync, by default all of {", ".join(MIRROR_TABLES)}')
+        sync_menu.add_argument('-F', '--force', action='store_true', help='Rewrite the tables even without a change')
+        sync_menu.add_argument('-s', '--status', action='store_true', help='Show the freshness of the mirror')
+        sync_menu.add_argument('--find', metavar='<name|ip|mac>', help='Find the records with a name, IP or MAC address')
+        sync_menu.add_argument('-v', '--verbose', action='store_true', default=None, help='Verbose Mode')
+        return parser
+
+
+    def sync_mirror(self):
+        """
+        This method will refresh the mirror, and exit with an error if a table has failed.
+        """
+        unknown = [table for table in self.args['tables'] if table not in MIRROR_TABLES]
+        if unknown:
+            Message().error_exit(f'ERROR :: {", ".join(unknown)} can not be mirrored, choose from {", ".join(MIRROR_TABLES)}')
+        start = time()
+        results = Mirror().sync(self.args['tables'], self.args['force'])
+        fields = ['#', 'Table', 'Records', 'Status']
+        rows = []
+        for num, result in enumerate(results, start=1):
+            rows.append([num, result['table'], '--NA--' if result['records'] is None else result['records'], result['status']])
+        Presenter().show_table(f' << Sync in {time() - start:.2f}s >>', fields, rows)
+        if any(result['status'] == 'FAILED' for result in results):
+            sys.exit(1)
+        return True
+
+
+    def status_mirror(self):
+        """
+        This method will show the records, the hash and the age of each mirrored table.
+        """
+        freshness = Mirror().freshness()
+        if not freshness:
+            Message().error_exit('ERROR :: The local mirror is empty, run luna sync first')
+        fields = ['#', 'Table', 'Records', 'Hash', 'Age', 'Fresh']
+        rows = []
+        for num, table in enumerate([table for table in MIRROR_TABLES if table in freshness], start=1):
+            fresh = freshness[table]
+            rows.append([num, table, fresh['records'], fresh['hash'][:12], Mirror.age_text(fresh['age']),
+                         'no' if fresh['age'] > MIRROR_STALE_AGE else 'yes'])
+        return Presenter().show_table(' << Local Mirror >>', fields, rows)
+
+
+    def find_mirror(self):
+        """
+        This method will show the mirrored records with the name, IP address or MAC address.
+        """
+        rows = []
+        for num, found in enumerate(Mirror().find(self.args['find']), start=1):
+            rows.append([num] + ['' if value is None else value for value in found])
+        if not rows:
+            Message().error_exit(f'ERROR :: {self.args["find"]} is not found in the local mirror')
+        fields = ['#', 'Table', 'Name', 'Interface', 'Network', 'IP Address', 'MAC Address']
+        return Presenter().show_table(f' << {self.args["find"]} >>', fields, rows)
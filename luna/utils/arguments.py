@@ -30,7 +30,7 @@ __email__       = "sumit.sharma@clustervision.com"
 __status__      = "Development"
 
 
-from luna.utils.constant import BOOL_CHOICES, BOOL_META
+from luna.utils.constant import BOOL_CHOICES, BOOL_META, OUTPUT_CHOICES, OSPUSH_WINDOW
 from luna.utils.helper import Helper
 
 
@@ -39,7 +39,7 @@ class Arguments():
     All kind of common Arguments methods.
     """
 
-    def common_list_args(self, parser, csv=False):
+    def common_list_args(self, parser, csv=False, output=False, cached=False, query=False):
         """
         This method will provide the common list and show arguments.
         """
@@ -48,6 +48,36 @@ class Arguments():
         if csv:
             parser.add_argument('--csv', metavar='<column>', default=None,
                                 help='Output a single column as comma-separated values')
+        if csv or output:
+            parser.add_argument('-o', '--output', choices=OUTPUT_CHOICES, default='table',
+                                help='Output format, ndjson and tsv write one record per line')
+            parser.add_argument('--fields', metavar='<field,...>', default=None,
+                                help='Only these comma separated fields, e.g. name,interfaces.ipaddress')
+        if query:
+            parser.add_argument('--where', metavar='<field><op><value>', action='append', default=None,
+                                help='Only the matching records, op is one of = != ~ !~ < <= > >=, '
+                                     '~ is a glob, e.g. osimage~rocky* or interfaces.network=ib. Repeat to AND')
+            parser.add_argument('--sort', metavar='<field,...>', default=None,
+                                help='Sort on these comma separated fields, --sort=-field for descending')
+            parser.add_argument('--limit', metavar='N', type=int, default=None, help='Show at most N records')
+        if cached:
+            parser.add_argument('--cached', action='store_true', default=None,
+                                help='Answer from the local mirror, see luna sync')
+        return parser
+
+
+    def rolling_args(self, parser):
+        """
+        This method will provide the arguments of a rolling osimage push.
+        """
+        parser.add_argument('--rolling', action='store_true', default=None,
+                            help='Push node by node with a window of pushes in flight')
+        parser.add_argument('--window', type=int, metavar='N', default=OSPUSH_WINDOW,
+                            help=f'Pushes in flight with --rolling, default {OSPUSH_WINDOW}')
+        parser.add_argument('--canary', type=int, metavar='N', default=0,
+                            help='Push to the first N nodes first, the others only when these have succeeded')
+        parser.add_argument('--max-failure-rate', type=float, metavar='PCT', default=None,
+                            help='Start no new push once more than PCT percent of the pushes have failed')
         return parser
 
 
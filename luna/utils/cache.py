@@ -0,0 +1,186 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+# This code is part of the TrinityX software suite
+# Copyright (C) 2025  ClusterVision Solutions b.v.
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program.  If not, see <https://www.gnu.org/licenses/>
+
+
+"""
+Name Cache Class for the CLI
+"""
+__author__      = "Sumit Sharma"
+__copyright__   = "Copyright 2025, Luna2 Project [CLI]"
+__license__     = "GPL"
+__version__     = "2.1"
+__maintainer__  = "Sumit Sharma"
+__email__       = "sumit.sharma@clustervision.com"
+__status__      = "Development"
+
+import os
+import sys
+import json
+import tempfile
+from time import time
+from bisect import bisect_left
+from luna.utils.log import Log
+from luna.utils.constant import CACHE_DIR, NAME_CACHE_TTL, NAME_CACHE_LOCK_TTL
+
+
+class NameCache():
+    """
+    Disk backed cache of names for the shell completion.
+    Kind 'names' keeps the record names of a table, kind 'interfaces' and 'secrets' keep the
+    interface or secret names of one record.
+    """
+
+    def __init__(self, table=None, name=None, kind='names'):
+        """
+        Constructor - The cache file is derived from the kind, table and the record name.
+        """
+        self.logger = Log.get_logger()
+        self.table = table
+        self.name = name
+        self.kind = kind
+        key = '-'.join(str(part) for part in [kind, table, name] if part)
+        self.cache_file = f'{CACHE_DIR}/{key.replace("/", "_")}.json'
+        self.lock_file = f'{self.cache_file}.lock'
+
+
+    def lookup(self, prefix=''):
+        """
+        This method will return the names starting with the prefix. It answers from the cache,
+        a missing cache is fetched right away and a stale one is refreshed in the background.
+        """
+        names, checked = self.read()
+        if names is None:
+            names = self.refresh()
+        elif time() - checked > NAME_CACHE_TTL:
+            self.refresh_background()
+        response = []
+        index = bisect_left(names, prefix)
+        while index < len(names) and names[index].startswith(prefix):
+            response.append(names[index])
+            index += 1
+        return response
+
+
+    def read(self):
+        """
+        This method will read the sorted names and the time of the last refresh from the disk.
+        """
+        names, checked = None, 0
+        try:
+            with open(self.cache_file, 'r', encoding='utf-8') as cache_data:
+                cache = json.load(cache_data)
+            names, checked = cache['names'], cache['checked']
+        except (OSError, ValueError, KeyError, TypeError):
+            self.logger.debug(f'Name Cache Missing => {self.cache_file}')
+        return names, checked
+
+
+    def write(self, names=None):
+        """
+        This method will write the names atomically, readers see the old or the new file only.
+        """
+        cache = {'checked': time(), 'names': sorted(names)}
+        try:
+            os.makedirs(CACHE_DIR, exist_ok=True)
+            file_desc, temp_file = tempfile.mkstemp(dir=CACHE_DIR, prefix='.names.')
+            with os.fdopen(file_desc, 'w', encoding='utf-8') as cache_data:
+                json.dump(cache, cache_data)
+            os.replace(temp_file, self.cache_file)
+        except OSError as cache_error:
+            self.logger.debug(f'Name Cache Write Error => {cache_error}')
+        return cache['names']
+
+
+    def fetch(self):
+        """
+        This method will fetch the names from the Luna Daemon.
+        """
+        from luna.utils.rest import Rest # pylint: disable=C0415
+        response = []
+        if self.kind == 'interfaces':
+            get_list = Rest().get_data(self.table, f'{self.name}/interfaces')
+            if get_list.status_code == 200:
+                interfaces = get_list.content['config'][self.table][self.name]['interfaces']
+                response = [item['interface'] for item in interfaces]
+        elif self.kind == 'secrets':
+            get_list = Rest().get_data(f'secrets/{self.table}/{self.name}')
+            if get_list.status_code == 200:
+                secrets = get_list.content['config']['secrets'][self.table][self.name]
+                response = [item['name'] for item in secrets]
+        else:
+            get_list = Rest().get_data(self.table)
+            if get_list.status_code == 200:
+                content = get_list.content
+                if content and 'config' in content and self.table in content['config']:
+                    response = list(content['config'][self.table].keys())
+        return response
+
+
+    def refresh(self):
+        """
+        This method will fetch the names and store them in the cache.
+        """
+        try:
+            names = self.fetch()
+        except (Exception, SystemExit) as fetch_error: # pylint: disable=W0718
+            self.logger.debug(f'Name Cache Fetch Error => {fetch_error}')
+            return []
+        return self.write(names)
+
+
+    def refresh_background(self):
+        """
+        This method will start a detached refresh, unless another one is already running.
+        A lock older than NAME_CACHE_LOCK_TTL is treated as left over and replaced.
+        """
+        import subprocess # pylint: disable=C0415
+        try:
+            if os.path.isfile(self.lock_file) and time() - os.path.getmtime(self.lock_file) > NAME_CACHE_LOCK_TTL:
+                os.remove(self.lock_file)
+            os.close(os.open(self.lock_file, os.O_CREAT | os.O_EXCL | os.O_WRONLY))
+        except OSError:
+            return False
+        command = [sys.executable, '-m', 'luna.utils.cache', self.kind, self.table]
+        if self.name:
+            command.append(self.name)
+        subprocess.Popen(command, stdin=subprocess.DEVNULL, stdout=subprocess.DEVNULL, # pylint: disable=R1732
+                         stderr=subprocess.DEVNULL, start_new_session=True)
+        return True
+
+
+    def invalidate(self):
+        """
+        This method will drop the cache, so the next completion will fetch fresh names.
+        """
+        try:
+            os.remove(self.cache_file)
+        except OSError:
+            pass
+        return True
+
+
+if __name__ == '__main__':
+    # Background refresh started by NameCache.refresh_background: kind table [name]
+    Log.init_log('info')
+    CACHE = NameCache(*sys.argv[2:4], kind=sys.argv[1])
+    try:
+        CACHE.refresh()
+    finally:
+        if os.path.isfile(CACHE.lock_file):
+            os.remove(CACHE.lock_file)
@@ -36,7 +36,32 @@ TOKEN_FILE = '/trinity/local/luna/cli/config/token.txt'
 VERSION_FILE = 'VERSION.txt'
 LOG_DIR = '/var/log/luna'
 LOG_FILE = '/var/log/luna/luna2-cli.log'
+CACHE_DIR = '/trinity/local/luna/cli/cache'
+DAEMON_PROBE_FILE = '/trinity/local/luna/cli/cache/daemon.json'
+DAEMON_PROBE_TTL = 3600
+NAME_CACHE_TTL = 300
+NAME_CACHE_LOCK_TTL = 60
+REST_POOL_SIZE = 32
+TOKEN_REFRESH_MARGIN = 60
+WATCH_FIRST_POLL = 2
+WATCH_MIN_INTERVAL = 0.5
+WATCH_MAX_INTERVAL = 5
+WATCH_BACKOFF = 1.5
+WATCH_MAX_ERRORS = 3
+CONTROL_WAVE_INTERVAL = 10
+OSPUSH_WINDOW = 4
+OCCUPANCY_MAX_ADDRESSES = 2 ** 24
+STREAM_TABLE_ROWS = 1000
+STREAM_TABLE_CHUNK = 200
+MIRROR_FILE = '/trinity/local/luna/cli/cache/mirror.db'
+MIRROR_SCHEMA = 1
+MIRROR_STALE_AGE = 900
+MIRROR_TABLES = ['network', 'osimage', 'bmcsetup', 'switch', 'otherdev', 'cloud', 'group', 'node']
+APPLY_TABLES = ['group', 'node']
+APPLY_WORKERS = 8
+IMPORT_WORKERS = 8
 BOOL_CHOICES = ['y', 'yes', 'n', 'no', '']
+OUTPUT_CHOICES = ['table', 'ndjson', 'tsv']
 BOOL_META = "{y,yes,n,no,''}"
 BOOL_KEYS = [
     'debug',
@@ -174,6 +199,33 @@ def parser_doc(table: str) -> types.SimpleNamespace:
             "description":  '''\
                 This relates to monitoring luna status messages and queues.
             '''
+        },
+        "batch" : {
+            "help": "Run many commands in one go.",
+            "description":  '''\
+                Luna batch reads luna commands from a file or stdin, one per
+                line, and runs them in a single process with one connection
+                and token. A summary with the exit status of each command is
+                shown at the end.
+            '''
+        },
+        "sync" : {
+            "help": "Local mirror of the configuration.",
+            "description":  '''\
+                Luna sync mirrors the configuration tables into a local
+                SQLite database. Only tables with a changed content are
+                rewritten. List and show commands answer from the mirror
+                with --cached.
+            '''
+        },
+        "apply" : {
+            "help": "Apply a manifest of groups and nodes.",
+            "description":  '''\
+                Luna apply brings the groups and nodes in line with a YAML or
+                JSON manifest. Each table is fetched once and only the records
+                with a difference are created or changed. Use --plan to see
+                the changes without writing them.
+            '''
         }
     }
     response.help = static[table]["help"]
@@ -194,7 +246,7 @@ def actions(table: str) -> list:
     static = {
         "cloud" : network_actions,
         "group": common_actions + member_action + ["ospush"] + interface_actions,
-        "node": common_actions + ["osgrab", "ospush"] + interface_actions + inventory_actions,
+        "node": common_actions + ["import", "osgrab", "ospush"] + interface_actions + inventory_actions,
         "network": network_actions + ["reserve", "ipinfo", "nextip", "dns", "route"],
         "osimage": common_actions + member_action + ["pack", "cancel", "kernel", "tag", "updatecerts"],
         "bmcsetup": common_actions + member_action,
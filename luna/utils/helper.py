@@ -33,21 +33,20 @@ import os
 from time import time, sleep
 import base64
 import binascii
-import subprocess
 import re
 from random import randint
 from os import getpid
-from multiprocessing import Process
 from copy import deepcopy
 from textwrap import dedent
 from argparse import RawDescriptionHelpFormatter
-import urllib3
-import hostlist
-from termcolor import colored
-from nested_lookup import nested_lookup, nested_update, nested_delete, nested_alter
+from nested_lookup import nested_lookup, nested_update, nested_delete
 from luna.utils.rest import Rest
 from luna.utils.log import Log
 from luna.utils.presenter import Presenter
+from luna.utils.cache import NameCache
+from luna.utils.parallel import Parallel
+from luna.utils.watcher import TaskWatcher
+from luna.utils.query import Query
 from luna.utils.constant import EDITOR_KEYS, BOOL_KEYS, filter_columns, sortby, divider, spacer, overrides, parser_doc
 from luna.utils.message import Message
 
@@ -81,16 +80,9 @@ class Helper():
     def get_all_names(table):
         """
         Return a sorted list of all names for the given table (e.g. 'node', 'osimage', 'network').
+        Names are served from the disk cache, see NameCache.
         """
-        try:
-            get_list = Rest().get_data(table)
-            if get_list.status_code == 200:
-                content = get_list.content
-                if content and "config" in content and table in content["config"]:
-                    return sorted(content["config"][table].keys())
-        except Exception:
-            pass
-        return []
+        return NameCache(table).lookup()
 
 
     def name_completer(self, kind):
@@ -101,8 +93,8 @@ class Helper():
             """
             Completer function that returns a list of names starting with the given prefix.
             """
-            self.logger.info(f"prefix: {type(prefix)} {prefix}")
-            return [n for n in self.get_all_names(kind) if n.startswith(prefix)]
+            self.logger.debug(f"prefix: {type(prefix)} {prefix}")
+            return NameCache(kind).lookup(prefix)
         return completer
 
 
@@ -114,23 +106,10 @@ class Helper():
             """
             Completer function that returns a list of names starting with the given prefix.
             """
-            self.logger.info(f"prefix: {type(prefix)} {prefix}")
-            self.logger.info(f"parsed_args: {type(parsed_args)} {parsed_args}")
-            self.logger.info(f"kind: {type(kind)} {kind}")
-            self.logger.info(f"entity: {type(entity)} {entity}")
-            entity_name = parsed_args.name
-            uri = f'{kind}/{entity}/{entity_name}'
-            self.logger.info(uri)
-            get_list = Rest().get_data(uri)
-            if get_list.status_code == 200:
-                self.logger.info(get_list)
-                get_list = get_list.content
-                self.logger.info(get_list)
-                node_secrets = get_list['config']['secrets'][entity][entity_name]
-                return [item['name'] for item in node_secrets]
-            else:
-                self.logger.error(f"Failed to fetch secrets for {entity_name}: {get_list.content}")
-                return []
+            self.logger.debug(f"prefix: {type(prefix)} {prefix}")
+            self.logger.debug(f"kind: {type(kind)} {kind}")
+            self.logger.debug(f"entity: {type(entity)} {entity}")
+            return NameCache(entity, parsed_args.name, kind='secrets').lookup(prefix)
         return completer
 
 
@@ -142,21 +121,9 @@ class Helper():
             """
             Completer function that returns a list of names starting with the given prefix.
             """
-            self.logger.info(f"prefix: {type(prefix)} {prefix}")
-            self.logger.info(f"parsed_args: {type(parsed_args)} {parsed_args}")
-            self.logger.info(f"kind: {type(kind)} {kind}")
-            entity_name = parsed_args.name
-            get_list = Rest().get_data(kind, entity_name+'/interfaces')
-            self.logger.info(f"entity_name: {type(entity_name)} {entity_name}")
-            self.logger.info(f"get_list.status_code: {type(get_list.status_code)} {get_list.status_code}")
-            if get_list.status_code == 200:
-                get_list = get_list.content
-                node_interfaces = get_list['config'][kind][entity_name]['interfaces']
-                self.logger.info(node_interfaces)
-                return [item['interface'] for item in node_interfaces]
-            else:
-                self.logger.error(f"Failed to fetch secrets for {entity_name}: {get_list.content}")
-                return []
+            self.logger.debug(f"prefix: {type(prefix)} {prefix}")
+            self.logger.debug(f"kind: {type(kind)} {kind}")
+            return NameCache(kind, parsed_args.name, kind='interfaces').lookup(prefix)
         return completer
 
 
@@ -263,6 +230,7 @@ class Helper():
             value = self.base64_decode(value)
             temp_file.write(value)
             temp_file.close()
+        import subprocess # pylint: disable=C0415
         subprocess.check_output(f"sed -i 's/\r$//' {editor}", shell=True)
         subprocess.call([editor, filename])
         subprocess.check_output(f"sed -i 's/\r$//' {filename}", shell=True)
@@ -279,21 +247,23 @@ class Helper():
         """
         response = False
         fields, rows = [], []
-        get_list = Rest().get_data(table)
+        get_list = self.config_data(table, None, args)
         if get_list.status_code == 200:
             get_list = get_list.content
         else:
             Message().error_exit(get_list.content, get_list.status_code)
         self.logger.debug(f'Get List Data from Helper => {get_list}')
         if get_list:
-            data = get_list['config'][table]
-            if args['raw']:
+            data = Query(args).apply(get_list['config'][table])
+            if args.get('fields') or args.get('output') in ['ndjson', 'tsv']:
+                response = self.output_records(table, data.values(), args)
+            elif args['raw']:
                 json_data = Helper().prepare_json(data)
                 response = Presenter().show_json(json_data)
             elif args.get('csv'):
                 response = self.column_csv(table, data, args['csv'])
             else:
-                data = Helper().prepare_json(data, True)
+                data = Helper().prepare_json(data, True, filter_columns(table))
                 fields, rows  = self.filter_data(table, data)
                 # fields = list(map(lambda x: x.replace('tpm_uuid', 'tpm_present'), fields))
                 # fields = list(map(lambda x: x.replace('ns_ip', 'nameserver'), fields))
@@ -306,6 +276,69 @@ class Helper():
         return response
 
 
+    def config_data(self, table=None, name=None, args=None):
+        """
+        This method will fetch the configuration from the Luna Daemon, or from the local mirror
+        with --cached.
+        """
+        if args and args.get('cached'):
+            from luna.utils.mirror import Mirror # pylint: disable=C0415
+            return Mirror().get_data(table, name)
+        return Rest().get_data(table, name)
+
+
+    def field_value(self, record=None, path=None):
+        """
+        This method will resolve a dotted field path in a record, a list on the way gives the
+        value of each item. Only the resolved value is decoded. A derived column of the list,
+        like tpm_present, is computed when the record does not have it.
+        """
+        if path == 'tpm_present' and isinstance(record, dict) and path not in record:
+            return bool(record.get('tpm_uuid'))
+        value = record
+        for key in path.split('.'):
+            if isinstance(value, list):
+                value = [item.get(key) for item in value if isinstance(item, dict)]
+            elif isinstance(value, dict):
+                value = value.get(key)
+            else:
+                return None
+        return self.decode_value(key, value)
+
+
+    def output_records(self, table=None, records=None, args=None, fields=None):
+        """
+        This method will show the records projected on the requested fields, as a table or one
+        compact line per record for the ndjson and tsv output. The fields are resolved and
+        decoded record by record, everything else is skipped. Without fields, ndjson keeps the
+        whole record and tsv uses the list columns of the table.
+        """
+        if args.get('fields'):
+            fields = [field.strip() for field in args['fields'].split(',') if field.strip()]
+        elif args['output'] == 'ndjson':
+            fields = None
+        elif fields is None:
+            fields = [field for field in filter_columns(table) if field != '_override']
+        def projected():
+            for record in records:
+                if fields:
+                    yield {field: self.field_value(record, field) for field in fields}
+                else:
+                    yield self.prepare_json(record)
+        if args.get('output') in ['ndjson', 'tsv']:
+            return Presenter().show_records(projected(), fields, args['output'])
+        rows = []
+        for num, record in enumerate(projected(), start=1):
+            row = [num]
+            for field in fields:
+                value = record[field]
+                if isinstance(value, list):
+                    value = '\n'.join('' if item is None else str(item) for item in value)
+                row.append(value)
+            rows.append(row)
+        return Presenter().show_table(f' << {table.capitalize()} >>', ['#'] + fields, rows)
+
+
     def column_csv(self, table=None, data=None, column=None):
         """
         Output a single column across all records as a comma-separated line.
@@ -347,7 +380,6 @@ class Helper():
         Method to show a switch in Luna Configuration. Detail True will return the full details.
         """
         response = {'controllers': []} if detail is True else []
-        urllib3.disable_warnings()
         check = Rest().daemon_validation(parser=True)
         if check is not True:
             get_list = Rest().get_data('cluster')
@@ -374,7 +406,7 @@ class Helper():
         row_name = None
         if 'name' in args:
             row_name = args['name']
-        get_list = Rest().get_data(table, row_name)
+        get_list = self.config_data(table, row_name, args)
         if get_list.status_code == 200:
             get_list = get_list.content
         else:
@@ -385,8 +417,8 @@ class Helper():
                 data = get_list['config'][table][row_name]
             else:
                 data = get_list['config'][table]
-            json_data = Helper().prepare_json(data)
             if args['raw']:
+                json_data = Helper().prepare_json(data)
                 response = Presenter().show_json(json_data)
             else:
                 div = divider(table)
@@ -409,7 +441,7 @@ class Helper():
         This method fetch the nodes to the provided entity.
         """
         response = False
-        get_list = Rest().get_data(table, args['name']+'/_member')
+        get_list = self.config_data(table, args['name']+'/_member', args)
         if get_list.status_code == 200:
             get_list = get_list.content
         else:
@@ -448,6 +480,8 @@ class Helper():
         self.logger.debug(f'Get List Data from Helper => {get_list}')
         if get_list:
             data = get_list['config']['network'][args["name"]]['taken']
+            if args.get('ranges') or args.get('free_ranges') or args.get('count') or args.get('slice') is not None:
+                return self.reserved_ranges(args, data)
             data = Helper().prepare_json(data)
             if args['raw']:
                 response = Presenter().show_json(data)
@@ -466,6 +500,44 @@ class Helper():
         return response
 
 
+    def reserved_ranges(self, args=None, taken=None):
+        """
+        This method will show the reserved IP Addresses of a network as free and taken ranges,
+        as totals or per subnet slice, computed from an occupancy bitmap.
+        """
+        from luna.utils.occupancy import IPOccupancy # pylint: disable=C0415
+        record = Rest().get_data('network', args['name'])
+        if record.status_code != 200:
+            Message().error_exit(record.content, record.status_code)
+        subnet = record.content['config']['network'][args['name']].get('network')
+        occupancy = IPOccupancy(args['name'], subnet, taken)
+        if args.get('count'):
+            data = occupancy.totals()
+            if args['raw']:
+                return Presenter().show_json(data)
+            fields = ['Network', 'Subnet', 'Usable', 'Taken', 'Free', 'Utilization']
+            rows = [[data['network'], data['subnet'], data['usable'], data['taken'], data['free'], f'{data["utilization"]}%']]
+            return Presenter().show_table(f'<< IP Occupancy for Network {args["name"]} >>', fields, rows)
+        if args.get('slice') is not None:
+            data = occupancy.slices(args['slice'])
+            if args['raw']:
+                return Presenter().show_json(data)
+            fields = ['#', 'Slice', 'Usable', 'Taken', 'Free', 'Utilization']
+            rows = [[num, each['slice'], each['usable'], each['taken'], each['free'], f'{each["utilization"]}%']
+                    for num, each in enumerate(data, start=1)]
+            return Presenter().show_table(f'<< IP Occupancy for Network {args["name"]} per /{args["slice"]} >>', fields, rows)
+        data = occupancy.ranges(args.get('free_ranges'))
+        if args['raw']:
+            return Presenter().show_json(data)
+        if not data:
+            return Message().show_error(f'Network {args["name"]} not have any free IP Address.')
+        fields = ['#', 'Start', 'End', 'Count', 'State', 'Device Name']
+        rows = [[num, each['start'], each['end'], each['count'], each['state'], each.get('devices', '')]
+                for num, each in enumerate(data, start=1)]
+        title = 'Free IP Ranges' if args.get('free_ranges') else 'IP Ranges'
+        return Presenter().show_table(f'<< {title} for Network {args["name"]} >>', fields, rows)
+
+
     def add_record(self, table=None, data=None):
         """
         This method will add a new record.
@@ -483,15 +555,17 @@ class Helper():
             response = Rest().post_data(table, payload['name'], request_data)
             self.logger.debug(f'Response => {response}')
             if response.status_code == 201:
+                NameCache(table).invalidate()
                 Message().show_success(response.content)
             else:
                 Message().error_exit(response.content, response.status_code)
         return True
 
 
-    def update_record(self, table=None, data=None, local=False):
+    def update_record(self, table=None, data=None, local=False, exists=False):
         """
-        This method will update a record.
+        This method will update a record. With exists True the record is already known to be
+        present, i.e. from a snapshot of the table, and it will not be fetched again.
         """
         response = None
         for remove in ['verbose', 'command', 'action']:
@@ -510,6 +584,11 @@ class Helper():
         self.logger.debug(f'Payload => {request_data}')
         if 'cluster' in table:
             response = Rest().post_data(table, None, request_data)
+        elif exists is True:
+            if len(payload) == 1:
+                Message().error_exit('Kindly choose something to update.')
+            else:
+                response = Rest().post_data(table, name, request_data)
         else:
             record = Rest().get_data(table, payload['name'])
             if record.status_code == 200:
@@ -522,6 +601,8 @@ class Helper():
         self.logger.debug(f'Response => {response}')
         if response:
             if response.status_code in [201, 204]:
+                if name and 'interfaces' in payload:
+                    NameCache(table, name, kind='interfaces').invalidate()
                 additional_message = ''
                 if len(response.content) > 0:
                     additional_message = response.content
@@ -534,18 +615,25 @@ class Helper():
         return True
 
 
-    def compare_data(self, table=None, data=None):
+    def compare_data(self, table=None, data=None, db_data=None):
         """
         This method will compare the payload data with the original data.
+        The original data can be given from a snapshot of the table, then only the interface
+        will be fetched, and only when the snapshot does not have the compared keys.
         """
         check = False
-        db_data = Rest().get_data(table, data['name'])
-        if db_data.status_code == 200:
-            db_data = db_data.content
+        snapshot = db_data is not None
+        if snapshot:
+            db_data = deepcopy(db_data)
         else:
-            Message().error_exit(db_data.content, db_data.status_code)
-        self.logger.debug(f'Get List Data from Helper => {db_data}')
-        db_data = db_data['config'][table][data['name']]
+            db_data = Rest().get_data(table, data['name'])
+            if db_data.status_code == 200:
+                db_data = db_data.content
+            else:
+                Message().error_exit(db_data.content, db_data.status_code)
+            self.logger.debug(f'Get List Data from Helper => {db_data}')
+            db_data = db_data['config'][table][data['name']]
+        interfaces = db_data.get('interfaces') or []
         db_data = Helper().prepare_json(db_data)
         for remove in ['verbose', 'command', 'action']:
             data.pop(remove, None)
@@ -554,40 +642,45 @@ class Helper():
             if key in EDITOR_KEYS:
                 if value is False:
                     data = nested_delete(data, key)
-        final_data = deepcopy(data)
-        for key, value in data.items():
-            if key in db_data:
-                if db_data[key] != value:
-                    self.logger.debug(f"key   {key} value   {db_data[key]} value   {value}")
-                    check = True
-                del final_data[key]
-            else:
-                check = True
+        for key, (current, value) in self.changed_fields(data, db_data).items():
+            self.logger.debug(f"key   {key} value   {current} value   {value}")
+            check = True
+        final_data = {key: value for key, value in data.items() if key not in db_data}
 
         if 'interface' in final_data:
-            uri = data['name']+'/interfaces/'+final_data['interface']
-            interface_data = Rest().get_data(table, uri)
-            if interface_data.status_code == 200:
-                interface_data = interface_data.content
-                if isinstance(interface_data, str):
-                    check = True
-                else:
-                    interface_data = interface_data['config'][table][data["name"]]['interfaces'][0]
-                    interface_data = Helper().prepare_json(interface_data)
-                    interface_data = self.remove_none(interface_data)
-                    for key, value in final_data.items():
-                        if key not in interface_data:
-                            check = True
-                            self.logger.debug(f"-----------------------different~~~~~   {key}")
-                        else:
-                            if value != interface_data[key]:
-                                check = True
-                                self.logger.debug(f"-----------------------different   {key}")
-            else:
+            interface_data = None
+            if snapshot:
+                for interface in interfaces:
+                    if interface.get('interface') == final_data['interface']:
+                        if all(key in interface for key in final_data):
+                            interface_data = deepcopy(interface)
+            if interface_data is None:
+                uri = data['name']+'/interfaces/'+final_data['interface']
+                response = Rest().get_data(table, uri)
+                if response.status_code == 200:
+                    interface_data = response.content
+                    if not isinstance(interface_data, str):
+                        interface_data = interface_data['config'][table][data["name"]]['interfaces'][0]
+            if interface_data is None or isinstance(interface_data, str):
                 check = True
+            else:
+                interface_data = Helper().prepare_json(interface_data)
+                interface_data = self.remove_none(interface_data)
+                for key in self.changed_fields(final_data, interface_data):
+                    check = True
+                    self.logger.debug(f"-----------------------different   {key}")
         return check
 
 
+    def changed_fields(self, data=None, db_data=None):
+        """
+        This method will return the keys of the data with another value in the original data,
+        as key => (original, new). A key the original data does not have is changed as well.
+        """
+        return {key: (db_data.get(key), value) for key, value in data.items()
+                if key not in db_data or db_data[key] != value}
+
+
     def remove_none(self, data=None):
         """
         This method will remove the None values recursively from the object.
@@ -611,6 +704,9 @@ class Helper():
         response = Rest().get_delete(table, data['name'])
         self.logger.debug(f'Response => {response}')
         if response.status_code == 204:
+            NameCache(table).invalidate()
+            NameCache(table, data['name'], kind='interfaces').invalidate()
+            NameCache(table, data['name'], kind='secrets').invalidate()
             Message().show_success(f'{table.capitalize()} {data["name"]} is removed.')
         else:
             Message().error_exit(response.content, response.status_code)
@@ -628,6 +724,9 @@ class Helper():
         response = Rest().post_data(table, data['name'], request_data)
         self.logger.debug(f'Response => {response}')
         if response.status_code == 204:
+            NameCache(table).invalidate()
+            NameCache(table, data['name'], kind='interfaces').invalidate()
+            NameCache(table, data['name'], kind='secrets').invalidate()
             Message().show_success(f'{table.capitalize()} {data["name"]} is renamed to {newname}.')
         else:
             Message().error_exit(response.content, response.status_code)
@@ -646,6 +745,7 @@ class Helper():
         response = Rest().post_clone(table, payload['name'], request_data)
         self.logger.debug(f'Response => {response}')
         if response.status_code == 201:
+            NameCache(table).invalidate()
             Message().show_success(response.content)
         else:
             Message().error_exit(response.content, response.status_code)
@@ -656,7 +756,6 @@ class Helper():
         """
         Method to grab an osimage for a node.
         """
-        process1 = Process(target=Helper().loader, args=("OSImage Grabbing...",))
         response = False
         for remove in ['verbose', 'command', 'action']:
             data.pop(remove, None)
@@ -667,43 +766,13 @@ class Helper():
         http_response = Rest().post_raw(uri, request_data)
         result = http_response
         if http_response.status_code == 200:
-            process1.start()
+            process1 = self.start_loader("OSImage Grabbing...")
             http_response = http_response.json()
-            if 'request_id' in http_response.keys():
-                uri = f'config/status/{http_response["request_id"]}'
-                def dig_grabbing_status(uri):
-                    task_status = 200
-                    result = Rest().get_raw(route=uri, noexit=True)
-                    if isinstance(result, bool):
-                        sleep(2)
-                        return 503
-                    elif result.status_code == 404:
-                        pass
-                    elif result.status_code == 200:
-                        http_response = result.json()
-                        if 'status' in http_response and isinstance(http_response['status'], int):
-                            task_status = http_response['status']
-                        if http_response['message']:
-                            message = http_response['message'].split(';;')
-                            for msg in message:
-                                sleep(1)
-                                if task_status != 200:
-                                    Message().show_success(f'[ FAILED ] {msg}')
-                                else:
-                                    Message().show_success(f'[========] {msg}')
-                    if task_status == 404: # even if the image or node is not found, we fail
-                        return 500
-                    elif task_status != 200:
-                        return task_status
-                    return result.status_code
-            status = 200
             response = True
-            while status != 404:
-                status = dig_grabbing_status(uri)
-                if status in [500, 501, 503]:
-                    response = False
-                sleep(2)
-            process1.terminate()
+            if 'request_id' in http_response.keys():
+                watcher = TaskWatcher('config', http_response['request_id'], TaskWatcher.progress_format)
+                response = watcher.watch()
+            self.stop_loader(process1)
         if response:
             Message().show_success(f'[========] OSImage Grabbed for node {data["name"]}.')
         else:
@@ -722,7 +791,6 @@ class Helper():
         """
         Method to push an osimage for a node or a group.
         """
-        process1 = Process(target=Helper().loader, args=("OSImage Pushing...",))
         response = False
         for remove in ['verbose', 'command', 'action']:
             data.pop(remove, None)
@@ -733,45 +801,13 @@ class Helper():
         http_response = Rest().post_raw(uri, request_data)
         result = http_response
         if http_response.status_code == 200:
-            process1.start()
+            process1 = self.start_loader("OSImage Pushing...")
             http_response = http_response.json()
-            if 'request_id' in http_response.keys():
-                uri = f'config/status/{http_response["request_id"]}'
-                def dig_push_status(uri):
-                    task_status = 200
-                    result = Rest().get_raw(route=uri, noexit=True)
-                    if isinstance(result, bool):
-                        sleep(2)
-                        return 503
-                    elif result.status_code == 404:
-                        pass
-                    elif result.status_code == 200:
-                        http_response = result.json()
-                        if 'status' in http_response and isinstance(http_response['status'], int):
-                            task_status = http_response['status']
-                        if http_response['message']:
-                            message = http_response['message'].split(';;')
-                            for msg in message:
-                                sleep(1)
-                                if ':success' in msg:
-                                    Message().show_success(f'[========] {msg}')
-                                elif task_status != 200:
-                                    Message().show_success(f'[ FAILED ] {msg}')
-                                else:
-                                    Message().show_success(f'[========] {msg}')
-                    if task_status == 404: # even if the image, node or group is not found, we fail
-                        return 500
-                    elif task_status != 200:
-                        return task_status
-                    return result.status_code
-            status = 200
             response = True
-            while status != 404:
-                status = dig_push_status(uri)
-                if status in [500, 501, 503]:
-                    response = False
-                sleep(2)
-            process1.terminate()
+            if 'request_id' in http_response.keys():
+                watcher = TaskWatcher('config', http_response['request_id'], TaskWatcher.push_format)
+                response = watcher.watch()
+            self.stop_loader(process1)
         if response:
             Message().show_success(f'[========] OSImage Pushed for {table} {data["name"]}.')
         else:
@@ -790,6 +826,7 @@ class Helper():
         """
         This method will perform power option on node.
         """
+        import hostlist # pylint: disable=C0415
         response = []
         self.logger.debug(f'Received hostlist: {raw_hosts}.')
         try:
@@ -821,16 +858,34 @@ class Helper():
         return response
 
 
-    def common_list_args(self, parser=None, csv=False):
+    def common_list_args(self, parser=None, csv=False, output=False, cached=False, query=False):
+        """
+        This method will provide the common list and show arguments, from Arguments.
+        """
+        from luna.utils.arguments import Arguments # pylint: disable=C0415
+        return Arguments().common_list_args(parser, csv, output, cached, query)
+
+
+    def start_loader(self, message=None):
         """
-        This method will provide the common list and show arguments..
+        This method will start the loader in a separate process. It's skipped inside a parallel
+        worker, where the output is collected for the summary.
         """
-        parser.add_argument('-v', '--verbose', action='store_true', default=None, help='Verbose Mode')
-        parser.add_argument('-R', '--raw', action='store_true', default=None, help='Raw JSON output')
-        if csv:
-            parser.add_argument('--csv', metavar='<column>', default=None,
-                                help='Output a single column as comma-separated values')
-        return parser
+        if Parallel.collecting():
+            return None
+        from multiprocessing import Process # pylint: disable=C0415
+        process = Process(target=self.loader, args=(message,))
+        process.start()
+        return process
+
+
+    def stop_loader(self, process=None):
+        """
+        This method will stop the loader started by start_loader.
+        """
+        if process is not None:
+            process.terminate()
+        return True
 
 
     def loader(self, message=None):
@@ -866,63 +921,87 @@ class Helper():
         return True
 
 
-    def control_print(self, system=None, content=None, count=None):
+    def control_results(self, system=None, content=None):
         """
-        This method will parse the data for Control API's.
+        This method will parse the data for Control API's, into node => (state, status). The
+        state is OK, ON, OFF or FAILED, the status is shown, for a failed node it's the reason.
         """
         result = {}
         possible_cases = ['ok', 'on', 'off']
         if 'failed' in content['control']:
             for key, value in content['control']['failed'].items():
-                result[key] = value
+                result[key] = ('FAILED', value)
 
         if system in content['control']:
             for case in possible_cases:
                 if case in content['control'][system]:
                     for key, value in content['control'][system][case].items():
-                        result[key] = case.upper()
-        result = dict(sorted(result.items()))
+                        result[key] = (case.upper(), case.upper())
+        return result
 
+
+    def control_print(self, system=None, content=None, count=None, results=None):
+        """
+        This method will show the results of Control API's as rows, the results can be given
+        already parsed. It returns the next row number.
+        """
+        if results is None:
+            results = self.control_results(system, content)
         header = "| #     |     Node Name      |       "
         header += "Status                                              |"
         hr_line = 'X--------------------------------------------'
         hr_line += '--------------------------------------------X'
-        rows = []
-        for key, value in result.items():
-            rows.append([count, key, value])
+        for key, (_, value) in sorted(results.items()):
+            if count == 1:
+                Message().show_success(hr_line)
+                Message().show_success(header)
+                Message().show_success(hr_line)
+            line = f'| {f"{count}".ljust(6)}| {f"{key}".ljust(19)}| {f"{value}".ljust(58)}|'
+            Message().show_success(line)
             count = count + 1
-
-        if rows:
-            for row in rows:
-                if row[0] == 1:
-                    Message().show_success(hr_line)
-                    Message().show_success(header)
-                    Message().show_success(hr_line)
-                row[0] = f'{row[0]}'.ljust(6)
-                row[1] = f'{row[1]}'.ljust(19)
-                row[2] = f'{row[2]}'.ljust(58)
-                line = f'| {row[0]}| {row[1]}| {row[2]}|'
-                Message().show_success(line)
         return count
 
 
-    def dig_control_status(self, request_id=None, count=None, system=None):
+    def table_rows(self, records=None, columns=None):
         """
-        This method will fetch the status of Control API.
+        This method will build the rows in a single pass, each row starts with the serial
+        number. A column is the key of the record and an accessor, which gets the record and
+        if it is the last one. A missing key is shown as --NA--.
         """
-        uri = f'control/status/{request_id}'
-        sleep(2)
-        status = Rest().get_raw(uri)
-        status_json = status.json()
-        if status.status_code == 200:
-            count = Helper().control_print(system, status_json, count)
-            return self.dig_control_status(request_id, count, system)
-        elif status.status_code == 404:
-            hr_line = 'X--------------------------------------------'
-            hr_line += '--------------------------------------------X'
-            Message().show_success(hr_line)
-        else:
-            Message().show_error(f"Something Went Wrong {status.status_code}")
+        rows = []
+        total = len(records)
+        for num, record in enumerate(records, start=1):
+            last = num == total
+            row = [num]
+            for key, accessor in columns:
+                row.append(accessor(record, last) if key in record else '--NA--')
+            rows.append(row)
+        return rows
+
+
+    def remove_override(self, fields=None, data=None):
+        """
+        This method will mark the overridden records with a star and drop the _override key.
+        """
+        for record in data.values():
+            if '_override' in record:
+                if record['_override'] and 'name' in record:
+                    record['name'] = f"{record['name']} *"
+                del record['_override']
+                if '_override' in fields:
+                    fields.remove('_override')
+        return fields
+
+
+    def list_cell(self, value=None):
+        """
+        This method will show a list of dictionaries as key = value lines.
+        """
+        lines = []
+        for internal in value:
+            for in_key in internal:
+                lines.append(f'{in_key} = {internal[in_key]} ')
+        return '\n'.join(lines)
 
 
     def filter_interface(self, table=None, data=None):
@@ -930,52 +1009,30 @@ class Helper():
         This method will generate the data as for
         row format from the interface
         """
-        
+        from termcolor import colored # pylint: disable=C0415
         self.logger.debug(f'table => {table}')
-        self.logger.debug(f'data => {data}')
-        fields, rows, colored_fields = [], [], []
+        self.logger.debug(f'records => {len(data)}')
         fields = filter_columns(table)
         self.logger.debug(f'fields => {fields}')
-        for field_key in fields:
-            val_row = []
-            for ele in data:
-                if field_key in list(ele.keys()):
-                    if ele[field_key] == 'in progress':
-                        val_row.append(colored('in progress', 'green'))
-                    elif ele[field_key] == 'queued':
-                        val_row.append(colored('queued', 'yellow'))
-                    elif ele[field_key] == 1:
-                        val_row.append(colored('yes', 'green'))
-                    elif ele[field_key] == 0:
-                        val_row.append(colored('no', 'yellow'))
-                    elif ele[field_key] == 'maintask':
-                        val_row.append(colored('Main Task', 'blue'))
-                    elif ele[field_key] == 'subtask':
-                        val_row.append(colored('Sub Task', 'magenta'))
-                    else:
-                        val_row.append(ele[field_key])
-                else:
-                    val_row.append("--NA--")
-                self.logger.debug(f'Element => {ele}')
-            rows.append(val_row)
-            val_row = []
-            colored_fields.append(field_key)
-        fields = colored_fields
-        self.logger.debug(f'Rows before Swapping => {rows}')
-        final_rows = []
-        for array in range(len(rows[0])) :
-            tmp = []
-            for element in rows:
-                tmp.append(element[array])
-            final_rows.append(tmp)
-        rows = final_rows
-        # Adding Serial Numbers to the dataset
+        def status_cell(key):
+            def cell(record, last):
+                value = record[key]
+                if value == 'in progress':
+                    return colored('in progress', 'green')
+                if value == 'queued':
+                    return colored('queued', 'yellow')
+                if value == 1:
+                    return colored('yes', 'green')
+                if value == 0:
+                    return colored('no', 'yellow')
+                if value == 'maintask':
+                    return colored('Main Task', 'blue')
+                if value == 'subtask':
+                    return colored('Sub Task', 'magenta')
+                return value
+            return cell
+        rows = self.table_rows(data, [(key, status_cell(key)) for key in fields])
         fields.insert(0, '#')
-        num = 1
-        for outer in rows:
-            outer.insert(0, num)
-            num = num + 1
-        # Adding Serial Numbers to the dataset
         return fields, rows
 
 
@@ -985,101 +1042,47 @@ class Helper():
         row format
         """
         self.logger.debug(f'Table => {table}')
-        self.logger.debug(f'Data => {data}')
-        fields, rows, colored_fields = [], [], []
-        fields = filter_columns(table)
+        self.logger.debug(f'Records => {len(data)}')
+        fields = self.remove_override(filter_columns(table), data)
         self.logger.debug(f'Fields => {fields}')
-        datacopy=data.copy()
-        for ele in datacopy.keys():
-            if '_override' in datacopy[ele]:
-                if datacopy[ele]['_override'] and 'name' in datacopy[ele]:
-                    data[ele]['name'] = f"{data[ele]['name']} *"
-                del data[ele]['_override']
-                if '_override' in fields:
-                    fields.remove('_override')
-        for field_key in fields:
-            val_row = []
-            num = 1
-            for ele in data:
-                if field_key in list((data[ele].keys())):
-                    if isinstance(data[ele][field_key], list):
-                        new_list = []
-                        for internal in data[ele][field_key]:
-                            for internal_val in internal:
-                                self.logger.debug(f'Key => {internal_val}')
-                                self.logger.debug(f'Value => {internal[internal_val]}')
-                                in_key = internal_val
-                                in_val = internal[internal_val]
-                                new_list.append(f'{in_key} = {in_val} ')
-                        new_list = '\n'.join(new_list)
-                        val_row.append(new_list)
-                        new_list = []
-                    elif field_key == 'tpm_uuid':
-                        if data[ele][field_key]:
-                            val_row.append(True)
-                        else:
-                            val_row.append(False)
-                    else:
-                        if table == "network":
-                            if field_key == "network":
-                                network = data[ele][field_key]
-                                if "network_ipv6" in data[ele].keys():
-                                    if data[ele]['network_ipv6'] not in ['', None]:
-                                        network = f'{data[ele][field_key]}\n{data[ele]["network_ipv6"]}'
-                                network = network if num == len(data) else f'{network}\n'
-                                val_row.append(network)
-                         
-                            
-                            elif field_key == "dhcp_range_begin":
-                                dhcp_range_begin = data[ele][field_key]
-                                if "dhcp_range_begin_ipv6" in data[ele].keys():
-                                    if data[ele]['network_ipv6'] not in ['', None]:
-                                        dhcp_range_begin = f'{data[ele][field_key]}\n{data[ele]["dhcp_range_begin_ipv6"]}'
-                                dhcp_range_begin = dhcp_range_begin if num == len(data) else f'{dhcp_range_begin}\n'
-                                val_row.append(dhcp_range_begin)
-                           
-                            
-                            elif field_key == "dhcp_range_end":
-                                dhcp_range_end = data[ele][field_key]
-                                if "dhcp_range_end_ipv6" in data[ele].keys():
-                                    if data[ele]['network_ipv6'] not in ['', None]:
-                                        dhcp_range_end = f'{data[ele][field_key]}\n{data[ele]["dhcp_range_end_ipv6"]}'
-                                dhcp_range_end = dhcp_range_end if num == len(data) else f'{dhcp_range_end}\n'
-                                val_row.append(dhcp_range_end)
-                            elif field_key == "dhcp_mode":
-                                dhcp_mode = "--NA--"
-                                if data[ele].get("dhcp_nodes_in_pool"):
-                                    dhcp_mode = "nodes_in_pool"
-                                elif data[ele].get("dhcp_nodes_only"):
-                                    dhcp_mode = "nodes_only"
-                                dhcp_mode = dhcp_mode if num == len(data) else f'{dhcp_mode}\n'
-                                val_row.append(dhcp_mode)
-                            else:
-                                val_row.append(data[ele][field_key])
-                        else:
-                            val_row.append(data[ele][field_key])
-                else:
-                    val_row.append("--NA--")
-                num = num + 1
-            rows.append(val_row)
-            self.logger.debug(f'Each Row => {val_row}')
-            val_row = []
-            colored_fields.append(field_key)
-        fields = colored_fields
-        final_rows = []
-        for array in range(len(rows[0])) :
-            tmp = []
-            for element in rows:
-                tmp.append(element[array])
-            final_rows.append(tmp)
-        rows = final_rows
-        # Adding Serial Numbers to the dataset
+        def value_cell(key):
+            def cell(record, last):
+                value = record[key]
+                if isinstance(value, list):
+                    return self.list_cell(value)
+                if key == 'tpm_uuid':
+                    return bool(value)
+                return value
+            return cell
+        def ipv6_cell(key):
+            def cell(record, last):
+                value = record[key]
+                if isinstance(value, list):
+                    return self.list_cell(value)
+                if f'{key}_ipv6' in record and record['network_ipv6'] not in ['', None]:
+                    value = f'{value}\n{record[f"{key}_ipv6"]}'
+                return value if last else f'{value}\n'
+            return cell
+        def dhcp_mode_cell(record, last):
+            if isinstance(record['dhcp_mode'], list):
+                return self.list_cell(record['dhcp_mode'])
+            dhcp_mode = "--NA--"
+            if record.get("dhcp_nodes_in_pool"):
+                dhcp_mode = "nodes_in_pool"
+            elif record.get("dhcp_nodes_only"):
+                dhcp_mode = "nodes_only"
+            return dhcp_mode if last else f'{dhcp_mode}\n'
+        columns = []
+        for key in fields:
+            accessor = value_cell(key)
+            if table == "network":
+                if key in ["network", "dhcp_range_begin", "dhcp_range_end"]:
+                    accessor = ipv6_cell(key)
+                elif key == "dhcp_mode":
+                    accessor = dhcp_mode_cell
+            columns.append((key, accessor))
+        rows = self.table_rows(list(data.values()), columns)
         fields.insert(0, '#')
-        num = 1
-        for outer in rows:
-            outer.insert(0, num)
-            num = num + 1
-        # Adding Serial Numbers to the dataset
         return fields, rows
 
 
@@ -1144,43 +1147,6 @@ class Helper():
         return response
 
 
-    def nested_dict(self, dictionary=None, limit=False):
-        """
-        This method will check the nested dictionary.
-        """
-        for key, value in dictionary.items():
-            if isinstance(value, str):
-                if key in EDITOR_KEYS:
-                    doc = nested_alter({key : value}, key, self.callback)
-                    dictionary[key] = self.less_content(doc[key], limit)
-                else:
-                    dictionary[key] = value
-            elif isinstance(value, dict):
-                return self.nested_dict(dictionary, limit)
-            elif isinstance(value, list):
-                return self.nested_list(dictionary, key, value, limit)
-        return dictionary
-
-
-    def nested_list(self, dictionary=None, key=None, value=None, limit=False):
-        """
-        This method will check the list for a dictionary.
-        """
-        response = []
-        if value:
-            for occurrence in value:
-                if isinstance(occurrence, str):
-                    if key in EDITOR_KEYS:
-                        doc = nested_alter({key : occurrence}, key, self.callback)
-                        response.append(self.less_content(doc[key], limit))
-                    else:
-                        response.append(occurrence)
-                elif isinstance(occurrence, dict):
-                    response.append(self.nested_dict(occurrence, limit))
-        dictionary[key] = response
-        return dictionary
-
-
     def less_content(self, content=None, limit=False):
         """
         This method will reduce the length of the content.
@@ -1200,36 +1166,36 @@ class Helper():
         return content
 
 
-    def prepare_json(self, json_data=None, limit=False):
+    def decode_value(self, key=None, value=None, limit=False):
         """
-        This method will decode the base 64 string.
+        This method will decode the value of an editor key, the dictionaries and lists inside the
+        value are walked once.
+        """
+        if isinstance(value, str):
+            if key in EDITOR_KEYS:
+                value = self.less_content(self.callback(value), limit)
+        elif isinstance(value, dict):
+            for item_key, item_value in value.items():
+                value[item_key] = self.decode_value(item_key, item_value, limit)
+        elif isinstance(value, list):
+            value = [self.decode_value(key, item, limit) for item in value]
+        return value
+
+
+    def prepare_json(self, json_data=None, limit=False, fields=None):
+        """
+        This method will decode the base 64 string. With fields, the data is a collection of
+        records and only these fields of each record are decoded, the others are not shown.
         """
         self.logger.debug(f'Data Limit => {limit}')
-        if isinstance(json_data, list):
-            new_json_data=[]
-            for list_data in json_data:
-                new_json_data.append(self.prepare_json(list_data, limit))
-            return new_json_data
-        elif isinstance(json_data, dict):
-            for key, value in json_data.items():
-                if isinstance(value, str):
-                    if key in EDITOR_KEYS:
-                        doc = nested_alter({key : value}, key, self.callback)
-                        json_data[key] = self.less_content(doc[key], limit)
-                    else:
-                        json_data[key] = value
-                elif isinstance(value, dict):
-                    json_data[key] = self.nested_dict(value, limit)
-                elif isinstance(value, list):
-                    final_list = []
-                    if value:
-                        for occurrence in value:
-                            if isinstance(occurrence, str):
-                                doc = nested_alter({key : occurrence}, key, self.callback)
-                                final_list.append(self.less_content(doc[key], limit))
-                            elif isinstance(occurrence, dict):
-                                final_list.append(self.nested_dict(occurrence, limit))
-                    json_data[key] = final_list
+        if fields is None:
+            return self.decode_value(None, json_data, limit)
+        records = json_data.values() if isinstance(json_data, dict) else json_data
+        for record in records:
+            if isinstance(record, dict):
+                for key in fields:
+                    if key in record:
+                        record[key] = self.decode_value(key, record[key], limit)
         return json_data
 
 
@@ -1481,97 +1447,49 @@ class Helper():
         row format
         """
         self.logger.debug(f'Table => {table}')
-        self.logger.debug(f'Data => {data}')
-        fields, rows, colored_fields = [], [], []
-        fields = filter_columns(table)
+        self.logger.debug(f'Records => {len(data)}')
+        fields = self.remove_override(filter_columns(table), data)
         self.logger.debug(f'Fields => {fields}')
-        macaddress_row = []
-        ipaddress_row = []
-        datacopy=data.copy()
-        for ele in datacopy.keys():
-            if '_override' in datacopy[ele]:
-                if datacopy[ele]['_override'] and 'name' in datacopy[ele]:
-                    data[ele]['name'] = f"{data[ele]['name']} *"
-                del data[ele]['_override']
-                if '_override' in fields:
-                    fields.remove('_override')
-        for field_key in fields:
-#            if field_key in ['prescript', 'partscript', 'postscript']:
-#               continue
-            val_row = []
-            num = 1
-            for ele in data:
-                if field_key in list((data[ele].keys())):
-                    if isinstance(data[ele][field_key], list):
-                        new_list = []
-                        if field_key == 'interfaces':
-                            internal_macaddress = []
-                            internal_ipaddress = []
-                            for internal in data[ele][field_key]:
-                                internal_interface, interface_details = None, ''
-                                if 'interface' in internal:
-                                    internal_interface = internal['interface']
-                                if 'macaddress' in internal:
-                                    internal_macaddress.append(f"{internal_interface} = {internal['macaddress']}")
-                                if internal_interface:
-                                    for internal_val in ['ipaddress','ipaddress_ipv6']:
-                                        if internal_val in internal and internal[internal_val]:
-                                            in_key = internal_val
-                                            in_val = internal[internal_val]
-                                            interface_details += in_val + ' '
-                                    if 'dhcp' in internal and internal['dhcp']:
-                                        interface_details += 'dhcp '
-                                    internal_ipaddress.append(f'{internal_interface} = {interface_details} ')
-                            # adding a nasty dirty space when we have multiple interfaces. spacer.
-                            if len(internal_macaddress)>1 or len(internal_ipaddress)>1:
-                                internal_ipaddress.append('')
-                                internal_macaddress.append('')
-                            # --
-                            internal_macaddress = '\n'.join(internal_macaddress)
-                            internal_ipaddress = '\n'.join(internal_ipaddress)
-                            macaddress_row.append(internal_macaddress)
-                            ipaddress_row.append(internal_ipaddress)
-                        else:
-                            for internal in data[ele][field_key]:
-                                for internal_val in internal:
-                                    self.logger.debug(f'Key => {internal_val}')
-                                    self.logger.debug(f'Value => {internal[internal_val]}')
-                                    in_key = internal_val
-                                    in_val = internal[internal_val]
-                                    new_list.append(f'{in_key} = {in_val} ')
-                        new_list = '\n'.join(new_list)
-                        val_row.append(new_list)
-                        new_list = []
-                    else:
-                        val_row.append(data[ele][field_key])
-                else:
-                    val_row.append("--NA--")
-                num = num + 1
-            rows.append(val_row)
-            self.logger.debug(f'Each Row => {val_row}')
-            val_row = []
-            colored_fields.append(field_key)
-        rows.append(macaddress_row)
-        rows.append(ipaddress_row)
-        colored_fields.append('MAC addresses')
-        colored_fields.append('IP addresses')
-        # removing the column for interfaces. it's empty at this stage anyways
-        index_for_interfaces = colored_fields.index('interfaces')
-        del colored_fields[index_for_interfaces]
-        del rows[index_for_interfaces]
-        fields = colored_fields
-        final_rows = []
-        for array in range(len(rows[0])) :
-            tmp = []
-            for element in rows:
-                tmp.append(element[array])
-            final_rows.append(tmp)
-        rows = final_rows
-        # Adding Serial Numbers to the dataset
-        fields.insert(0, '#')
-        num = 1
-        for outer in rows:
-            outer.insert(0, num)
-            num = num + 1
-        # Adding Serial Numbers to the dataset
+        def interface_cells(interfaces):
+            internal_macaddress = []
+            internal_ipaddress = []
+            for internal in interfaces:
+                internal_interface, interface_details = None, ''
+                if 'interface' in internal:
+                    internal_interface = internal['interface']
+                if 'macaddress' in internal:
+                    internal_macaddress.append(f"{internal_interface} = {internal['macaddress']}")
+                if internal_interface:
+                    for internal_val in ['ipaddress','ipaddress_ipv6']:
+                        if internal_val in internal and internal[internal_val]:
+                            interface_details += internal[internal_val] + ' '
+                    if 'dhcp' in internal and internal['dhcp']:
+                        interface_details += 'dhcp '
+                    internal_ipaddress.append(f'{internal_interface} = {interface_details} ')
+            # adding a nasty dirty space when we have multiple interfaces. spacer.
+            if len(internal_macaddress)>1 or len(internal_ipaddress)>1:
+                internal_ipaddress.append('')
+                internal_macaddress.append('')
+            return '\n'.join(internal_macaddress), '\n'.join(internal_ipaddress)
+        def value_cell(key):
+            def cell(record, last):
+                value = record[key]
+                if isinstance(value, list):
+                    return self.list_cell(value)
+                return value
+            return cell
+        current = {}
+        def interface_cell(index):
+            def cell(record, last):
+                if current.get('record') is not record:
+                    current['record'], current['cells'] = record, interface_cells(record['interfaces'])
+                return current['cells'][index]
+            return cell
+        # the interfaces are shown as the MAC addresses and the IP addresses columns, at the end
+        fields.remove('interfaces')
+        columns = [(key, value_cell(key)) for key in fields]
+        columns.append(('interfaces', interface_cell(0)))
+        columns.append(('interfaces', interface_cell(1)))
+        rows = self.table_rows(list(data.values()), columns)
+        fields = ['#'] + fields + ['MAC addresses', 'IP addresses']
         return fields, rows
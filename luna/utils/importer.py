@@ -0,0 +1,343 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+# This code is part of the TrinityX software suite
+# Copyright (C) 2025  ClusterVision Solutions b.v.
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program.  If not, see <https://www.gnu.org/licenses/>
+
+
+"""
+Node Importer Class for the CLI
+"""
+__author__      = "Sumit Sharma"
+__copyright__   = "Copyright 2025, Luna2 Project [CLI]"
+__license__     = "GPL"
+__version__     = "2.1"
+__maintainer__  = "Sumit Sharma"
+__email__       = "sumit.sharma@clustervision.com"
+__status__      = "Development"
+
+import os
+import sys
+import csv
+import json
+from time import time
+from threading import Lock
+from ipaddress import ip_address, ip_network
+from luna.utils.rest import Rest
+from luna.utils.log import Log
+from luna.utils.message import Message
+from luna.utils.presenter import Presenter
+from luna.utils.parallel import Parallel
+from luna.utils.cache import NameCache
+from luna.utils.ipplan import IPPlanner
+from luna.utils.constant import BOOL_KEYS, EDITOR_KEYS, IMPORT_WORKERS
+
+INTERFACE_KEYS = [
+    'interface', 'ipaddress', 'macaddress', 'network', 'options', 'mtu', 'vlanid', 'vlan_parent',
+    'bond_mode', 'bond_slaves', 'dhcp'
+]
+
+
+class NodeImporter():
+    """
+    Importer Class responsible to add the nodes of a CSV file. The whole file is checked
+    against one snapshot of the node, group, osimage and network tables before anything is
+    written, then the nodes are added by a pool of workers. Each result is written to a
+    journal, an interrupted import continues with --resume. An IP address auto is planned
+    from the free addresses of the network.
+    """
+
+    def __init__(self, csv_file=None, journal=None, workers=None):
+        """
+        Constructor - The journal is kept next to the CSV file by default.
+        """
+        self.logger = Log.get_logger()
+        self.table = 'node'
+        self.csv_file = csv_file
+        self.journal = journal or f'{csv_file}.journal'
+        self.workers = workers or IMPORT_WORKERS
+        self.lock = Lock()
+
+
+    @staticmethod
+    def cell_value(key=None, value=None):
+        """
+        This method will convert a CSV cell, bool keys take yes and no and the editor keys
+        are encoded as the Luna Daemon expects them.
+        """
+        if key in BOOL_KEYS:
+            return value.lower() in ['y', 'yes', 'true']
+        if key in EDITOR_KEYS:
+            from luna.utils.helper import Helper # pylint: disable=C0415
+            return Helper().base64_encode(bytes(value, 'utf-8'))
+        return value
+
+
+    def read_rows(self):
+        """
+        This method will read the CSV file into (line, payload) pairs. The interface columns
+        belong to the interface named in the interface column, a column like ib0.ipaddress
+        belongs to the interface ib0. Empty cells are skipped.
+        """
+        response = []
+        try:
+            with open(self.csv_file, 'r', encoding='utf-8', newline='') as csv_data:
+                reader = csv.DictReader(row for row in csv_data if not row.lstrip().startswith('#'))
+                if not reader.fieldnames or 'name' not in [field.strip() for field in reader.fieldnames]:
+                    Message().error_exit(f'ERROR :: {self.csv_file} needs a header line with a name column')
+                for row in reader:
+                    payload, interfaces = {}, {}
+                    plain = {}
+                    for key, value in row.items():
+                        if key is None or value is None or not value.strip():
+                            continue
+                        key, value = key.strip(), value.strip()
+                        if '.' in key:
+                            interface, field = key.split('.', 1)
+                            interfaces.setdefault(interface, {'interface': interface})[field] = self.cell_value(field, value)
+                        elif key in INTERFACE_KEYS:
+                            plain[key] = self.cell_value(key, value)
+                        else:
+                            payload[key] = self.cell_value(key, value)
+                    if plain:
+                        interface = plain.get('interface')
+                        interfaces = {interface: dict(interfaces.pop(interface, {}), **plain), **interfaces}
+                    if interfaces:
+                        payload['interfaces'] = list(interfaces.values())
+                    if payload:
+                        response.append((reader.line_num, payload))
+        except OSError as file_error:
+            Message().error_exit(f'ERROR :: Unable to read {self.csv_file}: {file_error.strerror}')
+        except csv.Error as csv_error:
+            Message().error_exit(f'ERROR :: {self.csv_file} is not a valid CSV file, {csv_error}')
+        return response
+
+
+    def snapshot(self, table=None, name=None):
+        """
+        This method will fetch a table once, an empty table is answered with 404.
+        """
+        response = {}
+        get_list = Rest().get_data(table, name)
+        if get_list.status_code == 200:
+            response = get_list.content['config'][table]
+        elif get_list.status_code != 404:
+            Message().error_exit(get_list.content, get_list.status_code)
+        return response
+
+
+    def read_journal(self):
+        """
+        This method will return the names the journal has as added.
+        """
+        response = set()
+        try:
+            with open(self.journal, 'r', encoding='utf-8') as journal_data:
+                for line in journal_data:
+                    try:
+                        entry = json.loads(line)
+                    except ValueError:
+                        continue
+                    if entry.get('status') == 'OK':
+                        response.add(entry['name'])
+                    else:
+                        response.discard(entry.get('name'))
+        except OSError:
+            self.logger.debug(f'Import Journal Missing => {self.journal}')
+        return response
+
+
+    def write_journal(self, name=None, status=None, message=None):
+        """
+        This method will append one result to the journal, it's written right away so an
+        interrupted import knows what is done.
+        """
+        entry = json.dumps({'name': name, 'status': status, 'message': message, 'time': time()})
+        with self.lock:
+            with open(self.journal, 'a', encoding='utf-8') as journal_data:
+                journal_data.write(f'{entry}\n')
+        return True
+
+
+    def network_snapshot(self, rows=None):
+        """
+        This method will fetch the networks once, with the reserved addresses of each network
+        the rows use, for the IP plan and the checks.
+        """
+        networks = self.snapshot('network')
+        reserved = {}
+        for network in {item.get('network') for _, payload in rows for item in payload.get('interfaces', [])}:
+            if network in networks:
+                reserved[network] = IPPlanner.fetch_taken(network)
+        return networks, reserved
+
+
+    def plan_addresses(self, rows=None, networks=None, reserved=None):
+        """
+        This method will give each interface with the IP address auto the first free address
+        of its network, in the order of the file. The addresses in the file are left out, the
+        problems are returned as (line, name, problem).
+        """
+        problems = []
+        wanted, fixed = {}, {}
+        for line, payload in rows:
+            for interface in payload.get('interfaces', []):
+                network, ipaddress = interface.get('network'), interface.get('ipaddress')
+                if network not in networks or not ipaddress:
+                    continue
+                if ipaddress == 'auto':
+                    wanted.setdefault(network, []).append((line, payload.get('name') or '', interface))
+                else:
+                    try:
+                        fixed.setdefault(network, set()).add(str(ip_address(ipaddress)))
+                    except ValueError:
+                        continue
+        for network, interfaces in wanted.items():
+            planner = IPPlanner(network, networks[network], reserved.get(network, []))
+            plan = planner.plan(range(len(interfaces)), exclude=fixed.get(network))
+            for index, (line, name, interface) in enumerate(interfaces):
+                if plan[index] is None:
+                    problems.append((line, name, f'no free IP address left in network {network}'))
+                else:
+                    interface['ipaddress'] = plan[index]
+            self.logger.debug(f'IP Plan {network} => {len(interfaces)} addresses')
+        return problems
+
+
+    def validate(self, rows=None, networks=None, reserved=None):
+        """
+        This method will check all the rows against each other and against the tables, and
+        return the problems as (line, name, problem).
+        """
+        problems = []
+        nodes = self.snapshot('node')
+        groups = self.snapshot('group')
+        osimages = self.snapshot('osimage') if any('osimage' in payload for _, payload in rows) else {}
+        known_macs = {}
+        for node_name, node in nodes.items():
+            for interface in node.get('interfaces') or []:
+                if interface.get('macaddress'):
+                    known_macs[interface['macaddress'].lower()] = node_name
+        taken, subnets = {}, {}
+        for network in {item.get('network') for _, payload in rows for item in payload.get('interfaces', [])}:
+            if network in networks:
+                taken[network] = {item['ipaddress']: item.get('device') for item in reserved.get(network, [])}
+                try:
+                    subnets[network] = ip_network(networks[network]['network'], strict=False)
+                except (KeyError, TypeError, ValueError):
+                    self.logger.debug(f'Network Without Subnet => {network}')
+        names, macs, ips = {}, {}, {}
+        for line, payload in rows:
+            name = payload.get('name')
+            def problem(text, line=line, name=name):
+                problems.append((line, name or '', text))
+            if not name:
+                problem('name is missing')
+            elif name in names:
+                problem(f'name is also on line {names[name]}')
+            elif name in nodes:
+                problem('node is already present, use --resume to continue an import')
+            names.setdefault(name, line)
+            if payload.get('group') and payload['group'] not in groups:
+                problem(f'group {payload["group"]} is not present')
+            if payload.get('osimage') and payload['osimage'] not in osimages:
+                problem(f'osimage {payload["osimage"]} is not present')
+            for interface in payload.get('interfaces', []):
+                if not interface.get('interface'):
+                    problem('interface name is missing for the interface columns')
+                    continue
+                network = interface.get('network')
+                if network and network not in networks:
+                    problem(f'network {network} is not present')
+                mac = (interface.get('macaddress') or '').lower()
+                if mac:
+                    if mac in macs:
+                        problem(f'MAC address {mac} is also on line {macs[mac]}')
+                    elif mac in known_macs:
+                        problem(f'MAC address {mac} is taken by {known_macs[mac]}')
+                    macs.setdefault(mac, line)
+                ipaddress = interface.get('ipaddress')
+                if ipaddress == 'auto':
+                    if not network:
+                        problem(f'IP address auto needs the network of interface {interface["interface"]}')
+                elif ipaddress:
+                    try:
+                        address = ip_address(ipaddress)
+                    except ValueError:
+                        problem(f'IP address {ipaddress} is not valid')
+                        continue
+                    if not network:
+                        problem(f'IP address {ipaddress} needs the network of interface {interface["interface"]}')
+                    elif network in subnets and address not in subnets[network]:
+                        problem(f'IP address {ipaddress} is not in network {network} {subnets[network]}')
+                    elif ipaddress in taken.get(network, {}):
+                        problem(f'IP address {ipaddress} is taken by {taken[network][ipaddress]}')
+                    if (network, ipaddress) in ips:
+                        problem(f'IP address {ipaddress} is also on line {ips[(network, ipaddress)]}')
+                    ips.setdefault((network, ipaddress), line)
+        return problems
+
+
+    def add_each(self, payloads=None):
+        """
+        This method will return the call for the workers, it adds one node and journals the result.
+        """
+        def add_node(name):
+            request_data = {'config': {self.table: {name: payloads[name]}}}
+            self.logger.debug(f'Payload => {request_data}')
+            response = Rest().post_data(self.table, name, request_data)
+            if response.status_code == 201:
+                self.write_journal(name, 'OK')
+            else:
+                self.write_journal(name, 'FAILED', str(response.content))
+                Message().error_exit(response.content, response.status_code)
+        return add_node
+
+
+    def run(self, resume=False, check=False):
+        """
+        This method will check the file and add the nodes, with resume the nodes the journal
+        has as added are skipped. With check nothing is written.
+        """
+        start = time()
+        rows = self.read_rows()
+        done = self.read_journal() if resume else set()
+        pending = [(line, payload) for line, payload in rows if payload.get('name') not in done]
+        networks, reserved = self.network_snapshot(pending)
+        problems = self.plan_addresses(pending, networks, reserved) + self.validate(pending, networks, reserved)
+        if problems:
+            fields = ['#', 'Line', 'Name', 'Problem']
+            table_rows = [[num, line, name, text] for num, (line, name, text) in enumerate(problems, start=1)]
+            Presenter().show_table(f' << {os.path.basename(self.csv_file)} >>', fields, table_rows)
+            Message().error_exit(f'ERROR :: {len(problems)} problems found in {self.csv_file}, no node is added')
+        if check:
+            return Message().show_success(f'{self.csv_file} is valid, {len(pending)} nodes to add, {len(rows) - len(pending)} done.')
+        if not resume and os.path.isfile(self.journal):
+            os.remove(self.journal)
+        payloads = {payload['name']: payload for _, payload in pending}
+        results = Parallel(self.workers).run(list(payloads), self.add_each(payloads))
+        if results:
+            NameCache(self.table).invalidate()
+        failed = [result for result in results if result['status'] != 'OK']
+        fields = ['Total', 'Skipped', 'Added', 'Failed', 'Duration']
+        Presenter().show_table(' << Node Import >>', fields, [[len(rows), len(rows) - len(pending),
+                               len(results) - len(failed), len(failed), f'{time() - start:.2f}s']])
+        for result in failed:
+            Message().show_error(f'{result["name"]} :: {result["output"]}')
+        if failed:
+            Message().show_error(f'Journal {self.journal}, run again with --resume to retry the failed nodes.')
+            sys.exit(1)
+        return True
@@ -0,0 +1,174 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+# This code is part of the TrinityX software suite
+# Copyright (C) 2025  ClusterVision Solutions b.v.
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program.  If not, see <https://www.gnu.org/licenses/>
+
+
+"""
+IP Planner Class for the CLI
+"""
+__author__      = "Sumit Sharma"
+__copyright__   = "Copyright 2025, Luna2 Project [CLI]"
+__license__     = "GPL"
+__version__     = "2.1"
+__maintainer__  = "Sumit Sharma"
+__email__       = "sumit.sharma@clustervision.com"
+__status__      = "Development"
+
+
+from ipaddress import ip_address, ip_network
+from luna.utils.rest import Rest
+from luna.utils.log import Log
+from luna.utils.message import Message
+from luna.utils.presenter import Presenter
+
+
+class IPPlanner():
+    """
+    IP Planner Class responsible to give many nodes a static IP address of one network. The
+    network and its taken addresses are fetched once, or given by the caller, the free
+    addresses are computed locally and assigned in the order of the names.
+    """
+
+    def __init__(self, network=None, record=None, taken=None):
+        """
+        Constructor - The network record and its taken list, as in the _member response, can be
+        given when the caller has them already, otherwise they are fetched right away. A missing
+        network stops the command.
+        """
+        self.logger = Log.get_logger()
+        self.network = network
+        if record is None:
+            response = Rest().get_data('network', network)
+            if response.status_code != 200:
+                Message().error_exit(response.content, response.status_code)
+            record = response.content['config']['network'][network]
+        try:
+            self.subnet = ip_network(record['network'], strict=False)
+        except (KeyError, TypeError, ValueError):
+            Message().error_exit(f'ERROR :: Network {network} has no valid subnet')
+        if taken is None:
+            taken = self.fetch_taken(network)
+        self.taken = {}
+        for item in taken:
+            self.taken[int(ip_address(item['ipaddress']))] = item.get('device')
+        if record.get('gateway'):
+            self.taken.setdefault(int(ip_address(record['gateway'])), 'gateway')
+        self.dhcp_range = None
+        if record.get('dhcp') and record.get('dhcp_range_begin') and record.get('dhcp_range_end'):
+            self.dhcp_range = (int(ip_address(record['dhcp_range_begin'])), int(ip_address(record['dhcp_range_end'])))
+        self.logger.debug(f'IP Plan {network} => {self.subnet}, {len(self.taken)} taken, DHCP {self.dhcp_range}')
+
+
+    @staticmethod
+    def fetch_taken(network=None):
+        """
+        This method will fetch the taken list of a network, a network without any reserved
+        address is answered with 404.
+        """
+        response = []
+        members = Rest().get_data('network', f'{network}/_member')
+        if members.status_code == 200:
+            response = members.content['config']['network'][network].get('taken') or []
+        elif members.status_code != 404:
+            Message().error_exit(members.content, members.status_code)
+        return response
+
+
+    def usable(self):
+        """
+        This method will return the first and last address a node can have, the network and
+        broadcast address are left out of an IPv4 subnet.
+        """
+        first, last = int(self.subnet.network_address), int(self.subnet.broadcast_address)
+        if self.subnet.version == 4 and self.subnet.num_addresses > 2:
+            first, last = first + 1, last - 1
+        return first, last
+
+
+    def in_dhcp_range(self, address=None):
+        """
+        This method will tell if an address, as integer, is in the DHCP range of the network.
+        """
+        return self.dhcp_range is not None and self.dhcp_range[0] <= address <= self.dhcp_range[1]
+
+
+    def plan(self, names=None, start=None, exclude=None):
+        """
+        This method will assign the first free addresses, from start or the begin of the
+        network, to the names in their order. The addresses in exclude are not assigned, an
+        address without a name is None when the network is full.
+        """
+        first, last = self.usable()
+        if start:
+            try:
+                start = ip_address(start)
+            except ValueError:
+                Message().error_exit(f'ERROR :: {start} is not a valid IP address')
+            if start not in self.subnet:
+                Message().error_exit(f'ERROR :: {start} is not in network {self.network} {self.subnet}')
+            first = max(first, int(start))
+        exclude = {int(ip_address(address)) for address in exclude or []}
+        response = {}
+        address = first
+        for name in names:
+            while address <= last and (address in self.taken or address in exclude or self.in_dhcp_range(address)):
+                address += 1
+            response[name] = str(ip_address(address)) if address <= last else None
+            address += 1
+        return response
+
+
+    def validate(self, plan=None):
+        """
+        This method will check a plan of name => address, and return the problems as
+        (name, address, problem).
+        """
+        problems = []
+        seen = {}
+        for name, address in plan.items():
+            if address is None:
+                problems.append((name, '', f'no free address left in network {self.network} {self.subnet}'))
+                continue
+            try:
+                value = ip_address(address)
+            except ValueError:
+                problems.append((name, address, 'not a valid IP address'))
+                continue
+            if value not in self.subnet:
+                problems.append((name, address, f'not in network {self.network} {self.subnet}'))
+            elif int(value) in self.taken and self.taken[int(value)] != name:
+                problems.append((name, address, f'taken by {self.taken[int(value)]}'))
+            elif self.in_dhcp_range(int(value)):
+                problems.append((name, address, f'in the DHCP range of network {self.network}'))
+            if address in seen:
+                problems.append((name, address, f'also planned for {seen[address]}'))
+            seen.setdefault(address, name)
+        return problems
+
+
+    def check(self, plan=None):
+        """
+        This method will show the problems of a plan and stop, nothing is written then.
+        """
+        problems = self.validate(plan)
+        if problems:
+            fields = ['#', 'Name', 'IP Address', 'Problem']
+            rows = [[num, name, address, text] for num, (name, address, text) in enumerate(problems, start=1)]
+            Presenter().show_table(f' << IP Plan for Network {self.network} >>', fields, rows)
+            Message().error_exit(f'ERROR :: {len(problems)} problems found in the IP plan, no node is written')
+        return True
@@ -0,0 +1,278 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+# This code is part of the TrinityX software suite
+# Copyright (C) 2025  ClusterVision Solutions b.v.
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program.  If not, see <https://www.gnu.org/licenses/>
+
+
+"""
+Local Mirror Class for the CLI
+"""
+__author__      = "Sumit Sharma"
+__copyright__   = "Copyright 2025, Luna2 Project [CLI]"
+__license__     = "GPL"
+__version__     = "2.1"
+__maintainer__  = "Sumit Sharma"
+__email__       = "sumit.sharma@clustervision.com"
+__status__      = "Development"
+
+import os
+import json
+import types
+import sqlite3
+import hashlib
+from time import time
+from luna.utils.rest import Rest
+from luna.utils.log import Log
+from luna.utils.message import Message
+from luna.utils.constant import CACHE_DIR, MIRROR_FILE, MIRROR_SCHEMA, MIRROR_STALE_AGE, MIRROR_TABLES
+
+SCHEMA = '''
+CREATE TABLE IF NOT EXISTS tables (name TEXT PRIMARY KEY, hash TEXT, synced REAL, records INTEGER);
+CREATE TABLE IF NOT EXISTS records (
+    tbl TEXT, name TEXT, data TEXT, grp TEXT, osimage TEXT, PRIMARY KEY (tbl, name)
+);
+CREATE INDEX IF NOT EXISTS records_name ON records (name);
+CREATE INDEX IF NOT EXISTS records_grp ON records (tbl, grp);
+CREATE INDEX IF NOT EXISTS records_osimage ON records (tbl, osimage);
+CREATE TABLE IF NOT EXISTS addresses (
+    tbl TEXT, name TEXT, interface TEXT, network TEXT, ipaddress TEXT, macaddress TEXT
+);
+CREATE INDEX IF NOT EXISTS addresses_record ON addresses (tbl, name);
+CREATE INDEX IF NOT EXISTS addresses_ipaddress ON addresses (ipaddress);
+CREATE INDEX IF NOT EXISTS addresses_macaddress ON addresses (macaddress);
+'''
+
+
+class Mirror():
+    """
+    SQLite mirror of the /config/<table> data, read commands can answer from it with --cached.
+    Each table keeps the hash of its content, a sync only rewrites the tables that have changed.
+    """
+
+    def __init__(self, mirror_file=None):
+        """
+        Constructor - The mirror is kept in the cache directory of the CLI.
+        """
+        self.logger = Log.get_logger()
+        self.mirror_file = mirror_file or MIRROR_FILE
+
+
+    def connect(self):
+        """
+        This method will open the mirror, a mirror of an older schema is dropped and created again.
+        """
+        try:
+            os.makedirs(CACHE_DIR, exist_ok=True)
+            connection = sqlite3.connect(self.mirror_file, timeout=30)
+            if connection.execute('PRAGMA user_version').fetchone()[0] != MIRROR_SCHEMA:
+                with connection:
+                    for table in ['tables', 'records', 'addresses']:
+                        connection.execute(f'DROP TABLE IF EXISTS {table}')
+                    connection.executescript(SCHEMA)
+                    connection.execute(f'PRAGMA user_version = {MIRROR_SCHEMA}')
+        except (OSError, sqlite3.Error) as mirror_error:
+            Message().error_exit(f'ERROR :: Unable to open the mirror {self.mirror_file}, {mirror_error}')
+        return connection
+
+
+    @staticmethod
+    def digest(data=None):
+        """
+        This method will return the hash of the table content, independent of the key order.
+        """
+        content = json.dumps(data, sort_keys=True, separators=(',', ':'), default=str)
+        return hashlib.sha256(content.encode('utf-8')).hexdigest()
+
+
+    @staticmethod
+    def addresses(table=None, name=None, record=None):
+        """
+        This method will yield the address rows of a record, from its interfaces or from the
+        record itself for the devices with a single address.
+        """
+        interfaces = record.get('interfaces')
+        if not isinstance(interfaces, list):
+            interfaces = [record] if record.get('ipaddress') or record.get('macaddress') else []
+        for interface in interfaces:
+            if isinstance(interface, dict):
+                macaddress = interface.get('macaddress')
+                yield (table, name, interface.get('interface'), interface.get('network'),
+                       interface.get('ipaddress'), macaddress.lower() if macaddress else None)
+
+
+    def fetch(self, table=None):
+        """
+        This method will fetch a table from the Luna Daemon, an empty table is answered by the
+        daemon with 404. It will return None when the table is not available.
+        """
+        response = None
+        get_list = Rest().get_data(table)
+        if get_list is False:
+            Message().show_error(f'ERROR :: {table} is not available.')
+        elif get_list.status_code == 200:
+            response = get_list.content['config'][table]
+        elif get_list.status_code == 404:
+            response = {}
+        else:
+            Message().show_error(f'ERROR :: {table} is not available, {get_list.content}')
+        return response
+
+
+    def store(self, connection=None, table=None, data=None, digest=None):
+        """
+        This method will replace the records and the addresses of a table in one transaction.
+        """
+        records, addresses = [], []
+        for name, record in data.items():
+            records.append((table, name, json.dumps(record), record.get('group'), record.get('osimage')))
+            addresses.extend(self.addresses(table, name, record))
+        with connection:
+            connection.execute('DELETE FROM records WHERE tbl = ?', (table,))
+            connection.execute('DELETE FROM addresses WHERE tbl = ?', (table,))
+            connection.executemany('INSERT INTO records VALUES (?, ?, ?, ?, ?)', records)
+            connection.executemany('INSERT INTO addresses VALUES (?, ?, ?, ?, ?, ?)', addresses)
+            connection.execute('INSERT OR REPLACE INTO tables VALUES (?, ?, ?, ?)',
+                               (table, digest, time(), len(records)))
+        return len(records)
+
+
+    def sync(self, tables=None, force=False):
+        """
+        This method will refresh the mirror. Each table is still fetched whole from the Luna
+        Daemon, the hash only saves the local rewrite: a table with the same hash as the last
+        sync is only marked as checked. Force will rewrite every table. It will return one
+        result per table.
+        """
+        response = []
+        connection = self.connect()
+        try:
+            for table in tables or MIRROR_TABLES:
+                data = self.fetch(table)
+                if data is None:
+                    response.append({'table': table, 'records': None, 'status': 'FAILED'})
+                    continue
+                digest = self.digest(data)
+                known = connection.execute('SELECT hash FROM tables WHERE name = ?', (table,)).fetchone()
+                if force or known is None or known[0] != digest:
+                    self.store(connection, table, data, digest)
+                    status = 'CHANGED'
+                else:
+                    with connection:
+                        connection.execute('UPDATE tables SET synced = ? WHERE name = ?', (time(), table))
+                    status = 'UNCHANGED'
+                self.logger.debug(f'Mirror Sync {table} => {status}, {len(data)} records')
+                response.append({'table': table, 'records': len(data), 'status': status})
+        finally:
+            connection.close()
+        return response
+
+
+    def freshness(self):
+        """
+        This method will return the records count, the hash and the age of each mirrored table.
+        """
+        response = {}
+        if os.path.isfile(self.mirror_file):
+            connection = self.connect()
+            try:
+                for name, digest, synced, records in connection.execute('SELECT * FROM tables'):
+                    response[name] = {'hash': digest, 'age': time() - synced, 'records': records}
+            finally:
+                connection.close()
+        return response
+
+
+    @staticmethod
+    def age_text(seconds=None):
+        """
+        This method will return the age in the largest unit, like 45s, 12m, 3h or 2d.
+        """
+        for unit, size in [('d', 86400), ('h', 3600), ('m', 60)]:
+            if seconds >= size:
+                return f'{int(seconds // size)}{unit}'
+        return f'{int(seconds)}s'
+
+
+    def check_fresh(self, table=None):
+        """
+        This method will stop when the table is never mirrored, and warn when it's older than
+        MIRROR_STALE_AGE.
+        """
+        fresh = self.freshness().get(table)
+        if fresh is None:
+            Message().error_exit(f'ERROR :: {table} is not in the local mirror, run luna sync first')
+        if fresh['age'] > MIRROR_STALE_AGE:
+            Message().show_error(f'WARNING :: {table} in the local mirror is {self.age_text(fresh["age"])} old, '
+                                 'run luna sync to refresh.')
+        return fresh
+
+
+    def get_data(self, table=None, name=None):
+        """
+        This method will answer like Rest.get_data from the mirror, for a table, a record, or the
+        member nodes of a group or an osimage with <name>/_member. An empty table is a 404, as
+        the Luna Daemon answers it. The reserved addresses of a network are not mirrored, the
+        controllers are not in the mirrored tables.
+        """
+        response = types.SimpleNamespace(status_code=200, content=None)
+        self.check_fresh('node' if name and name.endswith('/_member') else table)
+        connection = self.connect()
+        try:
+            if name and name.endswith('/_member'):
+                name = name[:-len('/_member')]
+                column = 'grp' if table == 'group' else 'osimage'
+                found = connection.execute('SELECT 1 FROM records WHERE tbl = ? AND name = ?', (table, name)).fetchone()
+                members = connection.execute(f'SELECT name FROM records WHERE tbl = ? AND {column} = ? ORDER BY rowid',
+                                             ('node', name)).fetchall()
+                data = {name: {'members': [member[0] for member in members]}} if found else {}
+            elif name:
+                rows = connection.execute('SELECT name, data FROM records WHERE tbl = ? AND name = ?', (table, name))
+                data = {row_name: json.loads(row_data) for row_name, row_data in rows}
+            else:
+                rows = connection.execute('SELECT name, data FROM records WHERE tbl = ? ORDER BY rowid', (table,))
+                data = {row_name: json.loads(row_data) for row_name, row_data in rows}
+        finally:
+            connection.close()
+        if name and not data:
+            response.status_code = 404
+            response.content = f'{name} is not found in the local mirror of {table}'
+        elif not data:
+            response.status_code = 404
+            response.content = f'{table} is empty in the local mirror'
+        else:
+            response.content = {'config': {table: data}}
+        return response
+
+
+    def find(self, value=None):
+        """
+        This method will find the records with the name, IP address or MAC address.
+        """
+        connection = self.connect()
+        try:
+            response = connection.execute(
+                'SELECT tbl, name, interface, network, ipaddress, macaddress FROM addresses '
+                'WHERE ipaddress = ? OR macaddress = ? UNION '
+                'SELECT tbl, name, NULL, NULL, NULL, NULL FROM records WHERE name = ? '
+                'AND NOT EXISTS (SELECT 1 FROM addresses WHERE addresses.tbl = records.tbl '
+                'AND addresses.name = records.name) UNION '
+                'SELECT tbl, name, interface, network, ipaddress, macaddress FROM addresses '
+                'WHERE name = ? ORDER BY 1, 2, 3',
+                (value, value.lower(), value, value)).fetchall()
+        finally:
+            connection.close()
+        return response
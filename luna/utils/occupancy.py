@@ -0,0 +1,195 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+# This code is part of the TrinityX software suite
+# Copyright (C) 2025  ClusterVision Solutions b.v.
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program.  If not, see <https://www.gnu.org/licenses/>
+
+
+"""
+IP Occupancy Class for the CLI
+"""
+__author__      = "Sumit Sharma"
+__copyright__   = "Copyright 2025, Luna2 Project [CLI]"
+__license__     = "GPL"
+__version__     = "2.1"
+__maintainer__  = "Sumit Sharma"
+__email__       = "sumit.sharma@clustervision.com"
+__status__      = "Development"
+
+
+import re
+from ipaddress import ip_address, ip_network
+from luna.utils.log import Log
+from luna.utils.message import Message
+from luna.utils.constant import OCCUPANCY_MAX_ADDRESSES
+
+POPCOUNT = bytes(bin(value).count('1') for value in range(256))
+NOT_FULL = re.compile(b'[^\xff]')
+NOT_EMPTY = re.compile(b'[^\x00]')
+
+
+class IPOccupancy():
+    """
+    IP Occupancy Class responsible to answer range questions on the reserved addresses of a
+    network. One bit per address of the subnet is kept, the ranges and the counts are computed
+    from the bitmap without a row per address.
+    """
+
+    def __init__(self, network=None, subnet=None, taken=None):
+        """
+        Constructor - The subnet is the one of the network, taken is the list of the _member
+        response with the ipaddress and device of each reserved address.
+        """
+        self.logger = Log.get_logger()
+        self.network = network
+        try:
+            self.subnet = ip_network(subnet, strict=False)
+        except (TypeError, ValueError):
+            Message().error_exit(f'ERROR :: Network {network} has no valid subnet')
+        self.size = self.subnet.num_addresses
+        if self.size > OCCUPANCY_MAX_ADDRESSES:
+            Message().error_exit(f'ERROR :: Network {network} {self.subnet} is too large for the occupancy view')
+        self.base = int(self.subnet.network_address)
+        self.bitmap = bytearray((self.size + 7) // 8)
+        self.devices = {}
+        for item in taken or []:
+            try:
+                index = int(ip_address(item['ipaddress'])) - self.base
+            except (KeyError, TypeError, ValueError):
+                continue
+            if not 0 <= index < self.size:
+                self.logger.debug(f'Reserved Address Outside {self.subnet} => {item["ipaddress"]}')
+                continue
+            self.bitmap[index >> 3] |= 1 << (index & 7)
+            self.devices[index] = item.get('device')
+        self.first, self.last = 0, self.size - 1
+        if self.subnet.version == 4 and self.size > 2:
+            self.first, self.last = 1, self.size - 2
+
+
+    def is_taken(self, index=None):
+        """
+        This method will tell if the address at an index of the subnet is reserved.
+        """
+        return bool(self.bitmap[index >> 3] & (1 << (index & 7)))
+
+
+    def next_change(self, index=None, taken=None):
+        """
+        This method will return the first index from index on which is not in the state taken,
+        whole bytes in the same state are skipped at once.
+        """
+        end = self.last + 1
+        while index < end and index & 7:
+            if self.is_taken(index) != taken:
+                return index
+            index += 1
+        if index >= end:
+            return end
+        match = (NOT_FULL if taken else NOT_EMPTY).search(self.bitmap, index >> 3)
+        index = end if match is None else min(match.start() << 3, end)
+        while index < end and self.is_taken(index) == taken:
+            index += 1
+        return index
+
+
+    def runs(self):
+        """
+        This method will yield the free and taken runs of the usable addresses as
+        (first index, last index, taken).
+        """
+        index = self.first
+        while index <= self.last:
+            taken = self.is_taken(index)
+            end = self.next_change(index, taken)
+            yield index, end - 1, taken
+            index = end
+
+
+    def address(self, index=None):
+        """
+        This method will return the address at an index of the subnet.
+        """
+        return str(ip_address(self.base + index))
+
+
+    def count(self, first=None, last=None):
+        """
+        This method will count the reserved addresses from the index first up to last.
+        """
+        response = 0
+        while first <= last and first & 7:
+            response += self.is_taken(first)
+            first += 1
+        while first <= last and last & 7 != 7:
+            response += self.is_taken(last)
+            last -= 1
+        if first <= last:
+            response += sum(self.bitmap[first >> 3:(last >> 3) + 1].translate(POPCOUNT))
+        return response
+
+
+    def ranges(self, free_only=False):
+        """
+        This method will return the runs as records, a taken run has its collapsed devices.
+        """
+        import hostlist # pylint: disable=C0415
+        response = []
+        for first, last, taken in self.runs():
+            if free_only and taken:
+                continue
+            record = {'start': self.address(first), 'end': self.address(last), 'count': last - first + 1,
+                      'state': 'taken' if taken else 'free'}
+            if taken:
+                devices = sorted({self.devices[index] for index in range(first, last + 1) if self.devices.get(index)})
+                try:
+                    record['devices'] = hostlist.collect_hostlist(devices)
+                except hostlist.BadHostlist:
+                    record['devices'] = ','.join(devices)
+            response.append(record)
+        return response
+
+
+    def totals(self):
+        """
+        This method will return the size, usable, taken and free counts of the network with
+        its utilization.
+        """
+        usable = self.last - self.first + 1
+        taken = self.count(self.first, self.last)
+        return {'network': self.network, 'subnet': str(self.subnet), 'size': self.size, 'usable': usable,
+                'taken': taken, 'free': usable - taken, 'utilization': round(taken * 100 / usable, 2) if usable else 0}
+
+
+    def slices(self, prefix=None):
+        """
+        This method will return the taken, free and utilization of each slice of the subnet
+        with the prefix length, like the /24 slices of a /16 network.
+        """
+        if not self.subnet.prefixlen <= prefix <= self.subnet.max_prefixlen:
+            Message().error_exit(f'ERROR :: A slice of {self.subnet} needs a prefix from {self.subnet.prefixlen} '
+                                 f'up to {self.subnet.max_prefixlen}')
+        step = 1 << (self.subnet.max_prefixlen - prefix)
+        if self.size // step > OCCUPANCY_MAX_ADDRESSES >> 8:
+            Message().error_exit(f'ERROR :: /{prefix} slices of {self.subnet} are too many to show')
+        response = []
+        for start in range(0, self.size, step):
+            first, last = max(start, self.first), min(start + step - 1, self.last)
+            usable = max(last - first + 1, 0)
+            taken = self.count(first, last) if usable else 0
+            response.append({'slice': f'{self.address(start)}/{prefix}', 'usable': usable, 'taken': taken,
+                             'free': usable - taken, 'utilization': round(taken * 100 / usable, 2) if usable else 0})
+        return response
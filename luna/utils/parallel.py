@@ -0,0 +1,188 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+# This code is part of the TrinityX software suite
+# Copyright (C) 2025  ClusterVision Solutions b.v.
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program.  If not, see <https://www.gnu.org/licenses/>
+
+
+"""
+Parallel Class for the CLI
+"""
+__author__      = "Sumit Sharma"
+__copyright__   = "Copyright 2025, Luna2 Project [CLI]"
+__license__     = "GPL"
+__version__     = "2.1"
+__maintainer__  = "Sumit Sharma"
+__email__       = "sumit.sharma@clustervision.com"
+__status__      = "Development"
+
+import io
+import sys
+import threading
+from time import time
+from concurrent.futures import ThreadPoolExecutor, wait, FIRST_COMPLETED
+from luna.utils.log import Log
+from luna.utils.constant import REST_POOL_SIZE
+
+
+class ThreadOutput():
+    """
+    Stream proxy, writes to the buffer of the current worker thread or to the real stream.
+    """
+
+    def __init__(self, stream=None, local=None, name=None):
+        self.stream = stream
+        self.local = local
+        self.name = name
+
+
+    def write(self, data=None):
+        """
+        This method will write the data to the worker buffer when there is one.
+        """
+        buffer = getattr(self.local, self.name, None)
+        if buffer is None:
+            return self.stream.write(data)
+        return buffer.write(data)
+
+
+    def flush(self):
+        """
+        This method will flush the real stream, worker buffers are kept until the summary.
+        """
+        if getattr(self.local, self.name, None) is None:
+            self.stream.flush()
+
+
+    def __getattr__(self, item):
+        return getattr(self.stream, item)
+
+
+class Parallel():
+    """
+    Parallel Class responsible to run a per node operation with a bounded pool of workers.
+    """
+    __local = threading.local()
+
+    def __init__(self, workers=None):
+        """
+        Constructor - The pool is never bigger than the REST connection pool.
+        """
+        self.logger = Log.get_logger()
+        self.workers = max(1, min(int(workers or 1), REST_POOL_SIZE))
+
+
+    @classmethod
+    def collecting(cls) -> bool:
+        """
+        This method will tell if the current thread is a worker with collected output.
+        """
+        return getattr(cls.__local, 'stdout', None) is not None
+
+
+    def worker(self, name=None, call=None):
+        """
+        This method will run the call for one name, collect its output and return the result.
+        """
+        local = Parallel.__local
+        local.stdout, local.stderr = io.StringIO(), io.StringIO()
+        status = 'OK'
+        start = time()
+        try:
+            call(name)
+        except SystemExit as exit_error:
+            if exit_error.code not in [None, 0]:
+                status = 'FAILED'
+                if not isinstance(exit_error.code, int):
+                    local.stderr.write(f'{exit_error.code}\n')
+        except Exception as call_error: # pylint: disable=W0718
+            self.logger.debug(f'Parallel Worker Exception => {call_error}', exc_info=True)
+            local.stderr.write(f'ERROR :: {call_error}\n')
+            status = 'FAILED'
+        finally:
+            output = local.stdout.getvalue() + local.stderr.getvalue()
+            local.stdout, local.stderr = None, None
+        duration = time() - start
+        self.logger.debug(f'Parallel Worker {name} => {status} in {duration:.2f}s')
+        return {'name': name, 'status': status, 'duration': duration, 'output': output.strip()}
+
+
+    def run(self, names=None, call=None):
+        """
+        This method will run the call for each name with the pool of workers, and return the
+        results in the same order as the names.
+        """
+        stdout, stderr = sys.stdout, sys.stderr
+        sys.stdout = ThreadOutput(stdout, Parallel.__local, 'stdout')
+        sys.stderr = ThreadOutput(stderr, Parallel.__local, 'stderr')
+        try:
+            with ThreadPoolExecutor(max_workers=self.workers) as executor:
+                response = list(executor.map(lambda name: self.worker(name, call), names))
+        finally:
+            sys.stdout, sys.stderr = stdout, stderr
+        return response
+
+
+    def rolling(self, names=None, call=None, stop=None, done=None):
+        """
+        This method will run the call for each name with at most the pool size in flight, a
+        new name is only started when a running one has finished. After each result done gets
+        it, and once stop returns True the names not started yet are skipped. The results are
+        returned in the same order as the names.
+        """
+        results = {}
+        pending = list(names)
+        stdout, stderr = sys.stdout, sys.stderr
+        sys.stdout = ThreadOutput(stdout, Parallel.__local, 'stdout')
+        sys.stderr = ThreadOutput(stderr, Parallel.__local, 'stderr')
+        try:
+            with ThreadPoolExecutor(max_workers=self.workers) as executor:
+                running = set()
+                while pending or running:
+                    while pending and len(running) < self.workers and not (stop and stop(results)):
+                        name = pending.pop(0)
+                        running.add(executor.submit(self.worker, name, call))
+                    if not running:
+                        break
+                    finished, running = wait(running, return_when=FIRST_COMPLETED)
+                    for future in finished:
+                        result = future.result()
+                        results[result['name']] = result
+                        if done:
+                            done(result, results)
+        finally:
+            sys.stdout, sys.stderr = stdout, stderr
+        for name in pending:
+            results[name] = {'name': name, 'status': 'SKIPPED', 'duration': 0, 'output': ''}
+        return [results[name] for name in names]
+
+
+    def show_summary(self, title=None, results=None):
+        """
+        This method will show one table for all the results, and exit with an error if any of
+        them has failed.
+        """
+        from luna.utils.presenter import Presenter # pylint: disable=C0415
+        fields = ['#', 'Node', 'Status', 'Duration', 'Output']
+        rows = []
+        for num, result in enumerate(results, start=1):
+            rows.append([num, result['name'], result['status'], f'{result["duration"]:.2f}s', result['output']])
+        Presenter().show_table(title, fields, rows)
+        failed = [result['name'] for result in results if result['status'] != 'OK']
+        if failed:
+            sys.stderr.write(f'ERROR :: {len(failed)} of {len(results)} failed.\n')
+            sys.exit(1)
+        return True
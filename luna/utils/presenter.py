@@ -29,10 +29,14 @@ __maintainer__  = "Sumit Sharma"
 __email__       = "sumit.sharma@clustervision.com"
 __status__      = "Development"
 
+import re
+import sys
 import json
-from prettytable import PrettyTable
 from luna.utils.log import Log
 from luna.utils.message import Message
+from luna.utils.constant import STREAM_TABLE_ROWS, STREAM_TABLE_CHUNK
+
+ANSI_CODE = re.compile(r'\x1b\[[0-9;]*m')
 
 
 class Presenter():
@@ -44,6 +48,7 @@ class Presenter():
         """
         Constructor - As of now, nothing have to initialize.
         """
+        from prettytable import PrettyTable # pylint: disable=C0415
         self.logger = Log.get_logger()
         self.table = PrettyTable()
 
@@ -73,16 +78,115 @@ class Presenter():
         This method will fetch a records from the Luna 2 Daemon Database
         """
         self.logger.debug(f'Fields => {fields}')
-        self.logger.debug(f'Rows => {rows}')
         self.table.title = title
         self.table.field_names = fields
-        if '\\n' in str(rows) or '<< Monitor' in str(title):
+        if '<< Monitor' in str(title) or any('\n' in str(cell) for row in rows for cell in row):
             self.table.align = "l"
+        if len(rows) > STREAM_TABLE_ROWS:
+            return self.stream_table(rows)
+        self.logger.debug(f'Rows => {rows}')
         self.table.add_rows(rows)
         Message().show_success(self.table)
         return True
 
 
+    def show_records(self, records=None, fields=None, output=None):
+        """
+        This method will write each record on its own line as soon as it is received, as compact
+        JSON for ndjson, or as tab separated values after a header line for tsv.
+        """
+        if output == 'tsv':
+            sys.stdout.write('\t'.join(fields) + '\n')
+        count = 0
+        for record in records:
+            if output == 'tsv':
+                line = '\t'.join(self.tsv_cell(record.get(field)) for field in fields)
+            else:
+                line = json.dumps(record, separators=(',', ':'), default=str)
+            sys.stdout.write(f'{line}\n')
+            count += 1
+        sys.stdout.flush()
+        self.logger.debug(f'Records Written => {count}')
+        return True
+
+
+    @staticmethod
+    def tsv_cell(value=None):
+        """
+        This method will return a value for one tsv cell. Tabs, newlines and backslashes are
+        escaped, anything else than a string is written as compact JSON.
+        """
+        if value is None:
+            return ''
+        if not isinstance(value, str):
+            return json.dumps(value, separators=(',', ':'), default=str)
+        value = value.replace('\\', '\\\\').replace('\t', '\\t')
+        return value.replace('\n', '\\n').replace('\r', '\\r')
+
+
+    @staticmethod
+    def cell_width(cell=None):
+        """
+        This method will return the display width of a cell, the color codes take no space. The
+        width is measured with the helper PrettyTable uses itself, so the borders line up.
+        """
+        from prettytable.prettytable import _str_block_width # pylint: disable=C0415
+        response = 0
+        for line in ANSI_CODE.sub('', str(cell)).split('\n'):
+            width = _str_block_width(line)
+            response = max(response, width if width >= 0 else len(line))
+        return response
+
+
+    def stream_table(self, rows=None):
+        """
+        This method will write a large table in chunks of STREAM_TABLE_CHUNK rows. The column
+        widths come from a first pass over all rows, so every chunk has the same borders and
+        the first rows are shown before the whole table is rendered.
+        """
+        from prettytable import PrettyTable # pylint: disable=C0415
+        self.logger.debug(f'Streaming Rows => {len(rows)}')
+        widths = [self.cell_width(field) for field in self.table.field_names]
+        for row in rows:
+            for index, cell in enumerate(row):
+                widths[index] = max(widths[index], self.cell_width(cell))
+        self.table.min_width = dict(zip(self.table.field_names, widths))
+        self.table.add_rows(rows[:STREAM_TABLE_CHUNK])
+        lines = self.table.get_string().split('\n')
+        sys.stdout.write('\n'.join(lines[:-1]) + '\n')
+        hr_line = lines[-1]
+        widths = [len(column) - 2 for column in hr_line[1:-1].split('+')]
+        for start in range(STREAM_TABLE_CHUNK, len(rows), STREAM_TABLE_CHUNK):
+            chunk = PrettyTable()
+            chunk.field_names = self.table.field_names
+            chunk.align = self.table.align
+            chunk.header = False
+            chunk.min_width = dict(zip(self.table.field_names, widths))
+            chunk.add_rows(rows[start:start + STREAM_TABLE_CHUNK])
+            lines = chunk.get_string().split('\n')
+            sys.stdout.write('\n'.join(lines[1:-1]) + '\n')
+        sys.stdout.write(f'{hr_line}\n')
+        sys.stdout.flush()
+        return True
+
+
+    def show_board(self, title=None, fields=None, rows=None, lines=0):
+        """
+        This method will draw a table in place of the previous one, which had the given number
+        of lines, and return the number of lines drawn.
+        """
+        self.table.title = title
+        self.table.field_names = fields
+        self.table.align = "l"
+        self.table.add_rows(rows)
+        board = self.table.get_string()
+        if lines:
+            sys.stdout.write(f'\033[{lines}F\033[J')
+        sys.stdout.write(f'{board}\n')
+        sys.stdout.flush()
+        return board.count('\n') + 1
+
+
     def show_table_col(self, title=None, field=None, rows=None, divider=None):
         """
         This method will fetch a records from the Luna 2 Daemon Database
@@ -0,0 +1,154 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+# This code is part of the TrinityX software suite
+# Copyright (C) 2025  ClusterVision Solutions b.v.
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program.  If not, see <https://www.gnu.org/licenses/>
+
+
+"""
+Query Class for the CLI
+"""
+__author__      = "Sumit Sharma"
+__copyright__   = "Copyright 2025, Luna2 Project [CLI]"
+__license__     = "GPL"
+__version__     = "2.1"
+__maintainer__  = "Sumit Sharma"
+__email__       = "sumit.sharma@clustervision.com"
+__status__      = "Development"
+
+import re
+from fnmatch import fnmatchcase
+from luna.utils.log import Log
+from luna.utils.message import Message
+from luna.utils.constant import EDITOR_KEYS
+
+EXPRESSION = re.compile(r'^\s*([\w.]+)\s*(!=|!~|<=|>=|=|~|<|>)(.*)$')
+TRUE_WORDS = ['y', 'yes', 'true', '1']
+FALSE_WORDS = ['n', 'no', 'false', '0']
+
+
+class Query():
+    """
+    Query Class responsible to filter, sort and limit the records of a list command with
+    --where, --sort and --limit. It works on the raw records, before anything is decoded.
+    """
+
+    def __init__(self, args=None):
+        """
+        Constructor - The expressions are parsed once, a bad expression stops the command.
+        """
+        from luna.utils.helper import Helper # pylint: disable=C0415
+        self.logger = Log.get_logger()
+        self.decode = Helper().decode_value
+        self.where = [self.parse(expression) for expression in (args or {}).get('where') or []]
+        self.sort = [field.strip() for field in ((args or {}).get('sort') or '').split(',') if field.strip()]
+        self.limit = (args or {}).get('limit')
+
+
+    @staticmethod
+    def parse(expression=None):
+        """
+        This method will split an expression like group=gpu in the field, operator and value.
+        """
+        match = EXPRESSION.match(expression)
+        if match is None:
+            Message().error_exit(f'ERROR :: {expression} is not a valid filter, use <field><operator><value> '
+                                 'with one of = != ~ !~ < <= > >=')
+        return match.group(1), match.group(2), match.group(3).strip()
+
+
+    def resolve(self, record=None, path=None):
+        """
+        This method will resolve a dotted field path in a record, a list on the way gives the
+        value of each item. Only an encoded text is decoded, the record itself is never changed.
+        """
+        value = record
+        for key in path.split('.'):
+            if isinstance(value, list):
+                value = [item.get(key) for item in value if isinstance(item, dict)]
+            elif isinstance(value, dict):
+                value = value.get(key)
+            else:
+                return None
+        if key in EDITOR_KEYS and (isinstance(value, str) or isinstance(value, list)
+                                   and not any(isinstance(item, (dict, list)) for item in value)):
+            value = self.decode(key, value)
+        return value
+
+
+    @staticmethod
+    def compare(value=None, operator=None, expected=None):
+        """
+        This method will compare one value, ~ is a glob match and a bool matches yes or no.
+        """
+        if operator in ['<', '<=', '>', '>=']:
+            try:
+                left, right = float(value), float(expected)
+            except (TypeError, ValueError):
+                left, right = '' if value is None else str(value), expected
+            return {'<': left < right, '<=': left <= right, '>': left > right, '>=': left >= right}[operator]
+        if isinstance(value, bool) and expected.lower() in TRUE_WORDS + FALSE_WORDS:
+            return value is (expected.lower() in TRUE_WORDS)
+        text = '' if value is None else str(value)
+        if operator == '~':
+            return fnmatchcase(text, expected)
+        return text == expected
+
+
+    def matches(self, record=None):
+        """
+        This method will check all the expressions on a record. A list on the field path matches
+        when any of its items does, the negated operators match when none of them does.
+        """
+        for field, operator, expected in self.where:
+            value = self.resolve(record, field)
+            values = value if isinstance(value, list) else [value]
+            positive = operator.lstrip('!')
+            found = any(self.compare(item, positive, expected) for item in values)
+            if found == operator.startswith('!'):
+                return False
+        return True
+
+
+    @staticmethod
+    def natural_key(value=None):
+        """
+        This method will return a sort key, where node2 comes before node10 and empty values first.
+        """
+        if value is None or value == '' or value == []:
+            return (0, [])
+        if isinstance(value, list):
+            value = ','.join('' if item is None else str(item) for item in value)
+        parts = re.split(r'(\d+)', str(value))
+        return (1, [(0, int(part), '') if part.isdigit() else (1, 0, part.lower()) for part in parts])
+
+
+    def apply(self, data=None):
+        """
+        This method will return the records of the data, keyed on name, which match the filter,
+        in the sorted order and up to the limit.
+        """
+        if not (self.where or self.sort or self.limit is not None):
+            return data
+        names = [name for name, record in data.items() if self.matches(record)]
+        for field in reversed(self.sort):
+            path = field.lstrip('-')
+            names.sort(key=lambda name, path=path: self.natural_key(self.resolve(data[name], path)),
+                       reverse=field.startswith('-'))
+        if self.limit is not None:
+            names = names[:max(self.limit, 0)]
+        self.logger.debug(f'Query => {len(names)} of {len(data)} records')
+        return {name: data[name] for name in names}
@@ -34,14 +34,19 @@ import types
 from configparser import RawConfigParser
 import os
 import sys
+import json
+import tempfile
+from time import time
+from threading import Lock
+from typing import Optional
 import requests
 from requests import Session
 from requests.adapters import HTTPAdapter
-import jwt
 import urllib3
 from urllib3.util import Retry
 from luna.utils.log import Log
-from luna.utils.constant import INI_FILE, TOKEN_FILE
+from luna.utils.constant import INI_FILE, TOKEN_FILE, REST_POOL_SIZE, TOKEN_REFRESH_MARGIN, CACHE_DIR,\
+    DAEMON_PROBE_FILE, DAEMON_PROBE_TTL
 from luna.utils.message import Message
 
 
@@ -49,57 +54,162 @@ class Rest():
     """
     All kind of REST Call methods.
     """
+    __ini_info: Optional[tuple] = None
+    __session: Optional[Session] = None
+    __lock = Lock()
+    __token: Optional[str] = None
+    __token_expiry: float = 0
+    __token_lock = Lock()
+
 
     def __init__(self):
         """
         Constructor - Before calling any REST API it will fetch the credentials and endpoint url
-        from luna.ini from Luna 2 Daemon.
+        from luna.ini from Luna 2 Daemon. The INI file and the HTTP session are shared by every
+        Rest object in the process, so creating one is cheap and connections are kept alive.
         """
         self.logger = Log.get_logger()
         self.username,self.password,self.daemon,self.secret_key,self.security = self.get_ini_info()
-        urllib3.disable_warnings()
         self.request_timeout = 20
         self.security = True if self.security.lower() in ['y', 'yes', 'true']  else False
-        self.session = Session()
-        self.retries = Retry(
-            total= 6,
-            backoff_factor=0.2,
-            status_forcelist=[502, 503, 504],
-            allowed_methods={'GET', 'POST'},
-        )
-        self.session.mount('https://', HTTPAdapter(max_retries=self.retries))
+        self.session = self.get_session()
+
+
+    @classmethod
+    def get_session(cls) -> Session:
+        """
+        This method will build the process wide HTTP session on first use. The connection pool is
+        sized for fan-out, so concurrent calls reuse keep-alive connections instead of opening new.
+        """
+        with cls.__lock:
+            if cls.__session is None:
+                urllib3.disable_warnings()
+                retries = Retry(
+                    total= 6,
+                    backoff_factor=0.2,
+                    status_forcelist=[502, 503, 504],
+                    allowed_methods={'GET', 'POST'},
+                )
+                adapter = HTTPAdapter(
+                    pool_connections=REST_POOL_SIZE,
+                    pool_maxsize=REST_POOL_SIZE,
+                    max_retries=retries
+                )
+                cls.__session = Session()
+                cls.__session.mount('https://', adapter)
+                cls.__session.mount('http://', adapter)
+        return cls.__session
+
+
+    @classmethod
+    def pool_stats(cls) -> dict:
+        """
+        This method will report how many connections the shared pool opened and how many requests
+        reused an already open connection.
+        """
+        response = {'opened': 0, 'requests': 0, 'reused': 0}
+        if cls.__session is not None:
+            adapter = cls.__session.get_adapter('https://')
+            pools = adapter.poolmanager.pools
+            for key in pools.keys():
+                pool = pools[key]
+                response['opened'] += pool.num_connections
+                response['requests'] += pool.num_requests
+            response['reused'] = max(response['requests'] - response['opened'], 0)
+        return response
 
 
     def daemon_validation(self, parser=None):
         """
-        This method will fetch a valid token for further use.
+        This method will check if the Luna Daemon is reachable, with the help of the cached
+        version probe. With parser True it will only report the result instead of exiting.
         """
-        check = False
-        exception = 'ERROR'
-        daemon_url = f'{self.daemon}/version'
-        self.logger.debug(f'URL {daemon_url}')
-        try:
-            response = requests.get(url=daemon_url, timeout=20, verify=False)
-            self.logger.debug(f'Response {response.content} & HTTP Code {response.status_code}')
-        except requests.exceptions.SSLError as ssl_loop_error:
-            check = True
-            self.logger.debug(f'{exception} :: {ssl_loop_error}')
-        except requests.exceptions.ConnectionError as conn_error:
-            check = True
-            self.logger.debug(f'{exception} :: {conn_error}')
-        except requests.exceptions.ReadTimeout as time_error:
-            check = True
-            self.logger.debug(f'{exception} :: {time_error}')
+        check = self.daemon_info() is None
         if check is True and parser is not True:
-            exception = f'ERROR :: Unable to reach {daemon_url} Try again or check the config'
-            Message().error_exit(exception)
+            Message().error_exit(f'ERROR :: Unable to reach {self.daemon} Try again or check the config')
         return check
 
 
+    def daemon_info(self, refresh=False):
+        """
+        This method will return the version information of the Luna Daemon. The answer is kept on
+        disk for DAEMON_PROBE_TTL seconds, so only the code paths which need it will pay the call.
+        """
+        response = None
+        if refresh is False and os.path.isfile(DAEMON_PROBE_FILE):
+            try:
+                with open(DAEMON_PROBE_FILE, 'r', encoding='utf-8') as probe_file:
+                    probe = json.load(probe_file)
+                if probe['daemon'] == self.daemon and time() - probe['checked'] < DAEMON_PROBE_TTL:
+                    response = probe['info']
+            except (OSError, ValueError, KeyError, TypeError) as probe_error:
+                self.logger.debug(f'Daemon Probe Cache Error => {probe_error}')
+        if response is None:
+            daemon_url = f'{self.daemon}/version'
+            self.logger.debug(f'URL {daemon_url}')
+            try:
+                call = self.session.get(url=daemon_url, timeout=self.request_timeout, verify=False)
+                self.logger.debug(f'Response {call.content} & HTTP Code {call.status_code}')
+                response = call.json() if call.content else {}
+                self.write_probe(response)
+            except (requests.exceptions.ConnectionError, requests.exceptions.Timeout) as conn_error:
+                self.logger.debug(f'ERROR :: {conn_error}')
+            except requests.exceptions.JSONDecodeError:
+                response = {}
+        return response
+
+
+    def write_probe(self, info=None):
+        """
+        This method will store the daemon probe atomically, a failure to write is not fatal.
+        """
+        probe = {'daemon': self.daemon, 'checked': time(), 'info': info}
+        try:
+            os.makedirs(CACHE_DIR, exist_ok=True)
+            file_desc, temp_file = tempfile.mkstemp(dir=CACHE_DIR, prefix='.daemon.')
+            with os.fdopen(file_desc, 'w', encoding='utf-8') as probe_file:
+                json.dump(probe, probe_file)
+            os.replace(temp_file, DAEMON_PROBE_FILE)
+        except OSError as probe_error:
+            self.logger.debug(f'Daemon Probe Write Error => {probe_error}')
+
+
+    def unreachable(self, daemon_url=None, error=None, noexit=False):
+        """
+        This method will report a failed request with the connectivity diagnosis, and drop the
+        cached daemon probe, so the next call will check the daemon again.
+        """
+        self.logger.debug(f'{daemon_url} :: {error}')
+        if os.path.isfile(DAEMON_PROBE_FILE):
+            try:
+                os.remove(DAEMON_PROBE_FILE)
+            except OSError:
+                pass
+        message = f'ERROR :: Unable to reach {self.daemon} Try again or check the config'
+        if noexit:
+            Message().show_error(message)
+        else:
+            Message().error_exit(message)
+        return False
+
+
+    def certificate_error(self, daemon_url=None, error=None):
+        """
+        This method will report a failed certificate verification, the Luna Daemon is reachable
+        so the connectivity diagnosis would be misleading. The caller gets False, as before.
+        """
+        self.logger.debug(f'SSLError {daemon_url} => {error}')
+        Message().show_error(f'ERROR :: The certificate of {self.daemon} could not be verified, '
+                             f'check the certificate or VERIFY_CERTIFICATE in {INI_FILE}')
+        return False
+
+
     def get_ini_info(self):
         """
         This method will get the information from the INI File.
         """
+        if Rest.__ini_info is not None:
+            return Rest.__ini_info
         errors = []
         file_check = os.path.isfile(INI_FILE)
         read_check = os.access(INI_FILE, os.R_OK)
@@ -126,7 +236,8 @@ class Rest():
                 Message().show_error(f'{num}. {error}')
                 num = num + 1
             sys.exit(1)
-        return self.username, self.password, self.daemon, self.secret_key, self.security
+        Rest.__ini_info = (self.username, self.password, self.daemon, self.secret_key, self.security)
+        return Rest.__ini_info
 
 
     def get_option(self, parser=None, error=None, section=None, option=None):
@@ -187,38 +298,62 @@ class Rest():
                     response = data['token']
                     with open(TOKEN_FILE, 'w', encoding='utf-8') as file_data:
                         file_data.write(response)
+                    self.cache_token(response, verify=False)
                 elif 'message' in data:
                     Message().error_exit(data["message"], call.status_code)
             else:
                 Message().error_exit(call.content, call.status_code)
-        except requests.exceptions.SSLError as ssl_loop_error:
-            self.logger.debug(f'SSLError => {ssl_loop_error}')
-        except requests.exceptions.ConnectionError:
-            Message().error_exit(f'Request Timeout while {daemon_url}')
+        except requests.exceptions.SSLError as ssl_error:
+            self.certificate_error(daemon_url, ssl_error)
+        except (requests.exceptions.ConnectionError, requests.exceptions.Timeout) as conn_error:
+            self.unreachable(daemon_url, conn_error)
         except requests.exceptions.JSONDecodeError:
             Message().error_exit(call.content, call.status_code)
         return response
 
 
+    def cache_token(self, token_data=None, verify=True):
+        """
+        This method will decode the token once and keep it in memory together with its expiry.
+        A token without an expiry claim is kept for the life of the process.
+        """
+        import jwt # pylint: disable=C0415
+        if verify:
+            payload = jwt.decode(token_data, self.secret_key, algorithms=['HS256'])
+        else:
+            payload = jwt.decode(token_data, options={'verify_signature': False})
+        Rest.__token = token_data
+        Rest.__token_expiry = float(payload.get('exp', float('inf')))
+        return Rest.__token
+
+
     def get_token(self):
         """
         This method will fetch a valid token for further use.
+        The token is served from memory and renewed TOKEN_REFRESH_MARGIN seconds before it expires.
         """
-        response = False
-        if os.path.isfile(TOKEN_FILE):
-            with open(TOKEN_FILE, 'r', encoding='utf-8') as token:
-                token_data = token.read()
-            try:
-                jwt.decode(token_data, self.secret_key, algorithms=['HS256'])
-                response = token_data
-            except jwt.exceptions.DecodeError:
-                self.logger.debug('Token Decode Error, Getting New Token.')
-                response = self.token()
-            except jwt.exceptions.ExpiredSignatureError:
-                self.logger.debug('Expired Signature Error, Getting New Token.')
+        if Rest.__token and time() < Rest.__token_expiry - TOKEN_REFRESH_MARGIN:
+            return Rest.__token
+        with Rest.__token_lock:
+            if Rest.__token and time() < Rest.__token_expiry - TOKEN_REFRESH_MARGIN:
+                return Rest.__token
+            import jwt # pylint: disable=C0415
+            response = False
+            if Rest.__token is None and os.path.isfile(TOKEN_FILE):
+                with open(TOKEN_FILE, 'r', encoding='utf-8') as token:
+                    token_data = token.read()
+                try:
+                    self.cache_token(token_data)
+                    if time() < Rest.__token_expiry - TOKEN_REFRESH_MARGIN:
+                        response = token_data
+                    else:
+                        self.logger.debug('Token About To Expire, Getting New Token.')
+                except jwt.exceptions.DecodeError:
+                    self.logger.debug('Token Decode Error, Getting New Token.')
+                except jwt.exceptions.ExpiredSignatureError:
+                    self.logger.debug('Expired Signature Error, Getting New Token.')
+            if response is False:
                 response = self.token()
-        if response is False:
-            response = self.token()
         return response
 
 
@@ -244,10 +379,10 @@ class Rest():
             )
             response = self.get_response(response)
             self.logger.debug(f'Response {response.content} & HTTP Code {response.status_code}')
-        except requests.exceptions.SSLError as ssl_loop_error:
-            self.logger.debug(f'SSLError => {ssl_loop_error}')
-        except requests.exceptions.ConnectionError:
-            Message().error_exit(f'Request Timeout while {daemon_url}')
+        except requests.exceptions.SSLError as ssl_error:
+            self.certificate_error(daemon_url, ssl_error)
+        except (requests.exceptions.ConnectionError, requests.exceptions.Timeout) as conn_error:
+            self.unreachable(daemon_url, conn_error)
         except requests.exceptions.JSONDecodeError:
             response = False
         return response
@@ -277,10 +412,10 @@ class Rest():
             )
             response = self.get_response(response)
             self.logger.debug(f'Response {response.content} & HTTP Code {response.status_code}')
-        except requests.exceptions.SSLError as ssl_loop_error:
-            self.logger.debug(f'SSLError => {ssl_loop_error}')
-        except requests.exceptions.ConnectionError:
-            Message().error_exit(f'Request Timeout while {daemon_url}')
+        except requests.exceptions.SSLError as ssl_error:
+            self.certificate_error(daemon_url, ssl_error)
+        except (requests.exceptions.ConnectionError, requests.exceptions.Timeout) as conn_error:
+            self.unreachable(daemon_url, conn_error)
         return response
 
 
@@ -303,10 +438,10 @@ class Rest():
             )
             response = self.get_response(response)
             self.logger.debug(f'Response {response.content} & HTTP Code {response.status_code}')
-        except requests.exceptions.SSLError as ssl_loop_error:
-            self.logger.debug(f'SSLError => {ssl_loop_error}')
-        except requests.exceptions.ConnectionError:
-            Message().error_exit(f'Request Timeout while {daemon_url}')
+        except requests.exceptions.SSLError as ssl_error:
+            self.certificate_error(daemon_url, ssl_error)
+        except (requests.exceptions.ConnectionError, requests.exceptions.Timeout) as conn_error:
+            self.unreachable(daemon_url, conn_error)
         return response
 
 
@@ -331,10 +466,10 @@ class Rest():
             )
             response = self.get_response(response)
             self.logger.debug(f'Response {response.content} & HTTP Code {response.status_code}')
-        except requests.exceptions.SSLError as ssl_loop_error:
-            self.logger.debug(f'SSLError => {ssl_loop_error}')
-        except requests.exceptions.ConnectionError:
-            Message().error_exit(f'Request Timeout while {daemon_url}')
+        except requests.exceptions.SSLError as ssl_error:
+            self.certificate_error(daemon_url, ssl_error)
+        except (requests.exceptions.ConnectionError, requests.exceptions.Timeout) as conn_error:
+            self.unreachable(daemon_url, conn_error)
         return response
 
 
@@ -360,10 +495,10 @@ class Rest():
             )
             self.logger.debug(f'Response {response.content} & HTTP Code {response.status_code}')
             response = response.status_code
-        except requests.exceptions.SSLError as ssl_loop_error:
-            self.logger.debug(f'SSLError => {ssl_loop_error}')
-        except requests.exceptions.ConnectionError:
-            Message().error_exit(f'Request Timeout while {daemon_url}')
+        except requests.exceptions.SSLError as ssl_error:
+            self.certificate_error(daemon_url, ssl_error)
+        except (requests.exceptions.ConnectionError, requests.exceptions.Timeout) as conn_error:
+            self.unreachable(daemon_url, conn_error)
         return response
 
 
@@ -387,13 +522,10 @@ class Rest():
                 verify=self.security
             )
             self.logger.debug(f'Response {response.content} & HTTP Code {response.status_code}')
-        except requests.exceptions.SSLError as ssl_loop_error:
-            self.logger.debug(f'SSLError => {ssl_loop_error}')
-        except requests.exceptions.ConnectionError:
-            if noexit:
-                Message().show_error(f'Request Timeout while {daemon_url}')
-            else:
-                Message().error_exit(f'Request Timeout while {daemon_url}')
+        except requests.exceptions.SSLError as ssl_error:
+            self.certificate_error(daemon_url, ssl_error)
+        except (requests.exceptions.ConnectionError, requests.exceptions.Timeout) as conn_error:
+            self.unreachable(daemon_url, conn_error, noexit)
         return response
 
 
@@ -416,8 +548,8 @@ class Rest():
                 verify=self.security
             )
             self.logger.debug(f'Response {response.content} & HTTP Code {response.status_code}')
-        except requests.exceptions.SSLError as ssl_loop_error:
-            self.logger.debug(f'SSLError => {ssl_loop_error}')
-        except requests.exceptions.ConnectionError:
-            Message().error_exit(f'Request Timeout while {daemon_url}')
+        except requests.exceptions.SSLError as ssl_error:
+            self.certificate_error(daemon_url, ssl_error)
+        except (requests.exceptions.ConnectionError, requests.exceptions.Timeout) as conn_error:
+            self.unreachable(daemon_url, conn_error)
         return response
@@ -0,0 +1,157 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+# This code is part of the TrinityX software suite
+# Copyright (C) 2025  ClusterVision Solutions b.v.
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program.  If not, see <https://www.gnu.org/licenses/>
+
+
+"""
+Rolling Push Class for the CLI
+"""
+__author__      = "Sumit Sharma"
+__copyright__   = "Copyright 2025, Luna2 Project [CLI]"
+__license__     = "GPL"
+__version__     = "2.1"
+__maintainer__  = "Sumit Sharma"
+__email__       = "sumit.sharma@clustervision.com"
+__status__      = "Development"
+
+import sys
+from time import time
+from copy import deepcopy
+from luna.utils.log import Log
+from luna.utils.message import Message
+from luna.utils.presenter import Presenter
+from luna.utils.parallel import Parallel
+from luna.utils.constant import OSPUSH_WINDOW
+
+
+class RollingPush():
+    """
+    Rolling Push Class responsible to push an osimage to many nodes, with a window of pushes
+    in flight. An optional canary batch is pushed first and must fully succeed, and no new push
+    is started once the failure rate is above the threshold.
+    """
+
+    def __init__(self, args=None, window=None, canary=None, max_failure_rate=None):
+        """
+        Constructor - The args are the ones of the ospush command, the name is set per node.
+        """
+        self.logger = Log.get_logger()
+        self.args = args
+        self.window = window or OSPUSH_WINDOW
+        self.canary = canary or 0
+        self.max_failure_rate = max_failure_rate
+        self.total = 0
+        self.finished = 0
+
+
+    @staticmethod
+    def pop_args(args=None):
+        """
+        This method will take the rolling arguments out of the command arguments, and return
+        them for the constructor, or None when none of them is given.
+        """
+        rolling = args.pop('rolling', None)
+        options = {
+            'window': args.pop('window', None),
+            'canary': args.pop('canary', None),
+            'max_failure_rate': args.pop('max_failure_rate', None)
+        }
+        if rolling or options['canary'] or options['max_failure_rate'] is not None:
+            return options
+        return None
+
+
+    def push_each(self, name=None):
+        """
+        This method will push the osimage to one node, a failed push exits from its worker.
+        """
+        from luna.utils.helper import Helper # pylint: disable=C0415
+        return Helper().push_osimage('node', dict(deepcopy(self.args), name=name))
+
+
+    def show_progress(self, result=None, results=None):
+        """
+        This method will show a line for each node as soon as its push is done.
+        """
+        self.finished += 1
+        marker = '[========]' if result['status'] == 'OK' else '[ FAILED ]'
+        return Message().show_success(f'{marker} {result["name"]} in {result["duration"]:.2f}s '
+                                      f'({self.finished}/{self.total})')
+
+
+    def too_many_failed(self, results=None):
+        """
+        This method will tell if the failure rate of the finished pushes is above the threshold,
+        it's only judged once at least a window of pushes has finished.
+        """
+        if self.max_failure_rate is None or len(results) < min(self.window, self.total):
+            return False
+        failed = len([result for result in results.values() if result['status'] != 'OK'])
+        return failed * 100 / len(results) > self.max_failure_rate
+
+
+    def run(self, nodes=None):
+        """
+        This method will push to the canary nodes first, and to the other nodes when all the
+        canary pushes have succeeded. It ends with the per node durations and the throughput.
+        """
+        start = time()
+        self.total = len(nodes)
+        canary, rest = nodes[:self.canary], nodes[self.canary:]
+        results = []
+        if canary:
+            Message().show_success(f'Canary :: {len(canary)} nodes, window {min(self.window, len(canary))}')
+            results = Parallel(min(self.window, len(canary))).rolling(canary, self.push_each, done=self.show_progress)
+        stage = [('canary', result) for result in results]
+        if any(result['status'] != 'OK' for result in results):
+            Message().show_error('ERROR :: The canary push has failed, the other nodes are skipped.')
+            stage += [('rolling', {'name': name, 'status': 'SKIPPED', 'duration': 0, 'output': ''}) for name in rest]
+        elif rest:
+            Message().show_success(f'Rolling :: {len(rest)} nodes, window {self.window}')
+            done = {result['name']: result for result in results}
+            def stop(running):
+                return self.too_many_failed(dict(done, **running))
+            stage += [('rolling', result) for result in
+                      Parallel(self.window).rolling(rest, self.push_each, stop, self.show_progress)]
+        return self.show_summary(stage, time() - start)
+
+
+    def show_summary(self, stage=None, duration=None):
+        """
+        This method will show the result and the duration of each node, with the throughput,
+        and exit with an error if any push has failed or was skipped.
+        """
+        fields = ['#', 'Node', 'Stage', 'Status', 'Duration']
+        rows = []
+        for num, (name, result) in enumerate(stage, start=1):
+            rows.append([num, result['name'], name, result['status'], f'{result["duration"]:.2f}s'])
+        Presenter().show_table(' << OSImage Push >>', fields, rows)
+        pushed = len([result for _, result in stage if result['status'] == 'OK'])
+        failed = [result for _, result in stage if result['status'] == 'FAILED']
+        skipped = len([result for _, result in stage if result['status'] == 'SKIPPED'])
+        rate = pushed * 60 / duration if duration else 0
+        Message().show_success(f'Pushed {pushed} of {len(stage)} nodes in {duration:.2f}s, {rate:.1f} nodes/min, '
+                               f'{len(failed)} failed, {skipped} skipped.')
+        for result in failed:
+            output = result['output'].splitlines()
+            Message().show_error(f'{result["name"]} :: {output[-1] if output else "failed"}')
+        if failed or skipped:
+            if self.too_many_failed({result['name']: result for _, result in stage if result['status'] != 'SKIPPED'}):
+                Message().show_error(f'ERROR :: The failure rate is above {self.max_failure_rate}%, the push is stopped.')
+            sys.exit(1)
+        return True
@@ -0,0 +1,270 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+# This code is part of the TrinityX software suite
+# Copyright (C) 2025  ClusterVision Solutions b.v.
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program.  If not, see <https://www.gnu.org/licenses/>
+
+
+"""
+Task Watcher Class for the CLI
+"""
+__author__      = "Sumit Sharma"
+__copyright__   = "Copyright 2025, Luna2 Project [CLI]"
+__license__     = "GPL"
+__version__     = "2.1"
+__maintainer__  = "Sumit Sharma"
+__email__       = "sumit.sharma@clustervision.com"
+__status__      = "Development"
+
+from time import time, sleep
+from luna.utils.rest import Rest
+from luna.utils.log import Log
+from luna.utils.message import Message
+from luna.utils.constant import WATCH_MIN_INTERVAL, WATCH_MAX_INTERVAL, WATCH_BACKOFF, WATCH_MAX_ERRORS
+
+
+class TaskWatcher():
+    """
+    Watcher Class responsible to follow a request_id of the Luna Daemon until the task is done.
+    The status is polled at WATCH_MIN_INTERVAL while messages arrive, and the interval grows
+    by WATCH_BACKOFF up to WATCH_MAX_INTERVAL while the task is quiet. The watch is given up
+    after WATCH_MAX_ERRORS polls in a row could not reach the Luna Daemon.
+    """
+
+    def __init__(self, route='config', request_id=None, formatter=None, first_poll=0):
+        """
+        Constructor - route is config, control or service. The formatter gets each message and
+        the task status, and returns the line to show or None to skip it.
+        """
+        self.logger = Log.get_logger()
+        self.request_id = request_id
+        self.uri = f'{route}/status/{request_id}'
+        self.formatter = formatter or self.plain_format
+        self.interval = WATCH_MIN_INTERVAL
+        self.started = time()
+        self.finished = None
+        self.next_poll = self.started + first_poll
+        self.last_message = ''
+        self.failed = False
+        self.done = False
+        self.errors = 0
+
+
+    @staticmethod
+    def plain_format(message=None, task_status=None):
+        """
+        This method will show the message as it is.
+        """
+        return message
+
+
+    @staticmethod
+    def progress_format(message=None, task_status=None):
+        """
+        This method will prefix the message with the progress or the failure marker.
+        """
+        if task_status == 200:
+            return f'[========] {message}'
+        return f'[ FAILED ] {message}'
+
+
+    @staticmethod
+    def push_format(message=None, task_status=None):
+        """
+        This method will prefix the message like progress_format, a node reported with
+        :success is never marked as failed.
+        """
+        if ':success' in message:
+            return f'[========] {message}'
+        return TaskWatcher.progress_format(message, task_status)
+
+
+    @staticmethod
+    def silent_format(message=None, task_status=None):
+        """
+        This method will keep the message quiet, it is only kept as the last message.
+        """
+        return None
+
+
+    @property
+    def state(self) -> str:
+        """
+        This method will return the state of the task as shown on a status board.
+        """
+        if self.failed:
+            return 'FAILED'
+        return 'DONE' if self.done else 'RUNNING'
+
+
+    @property
+    def duration(self) -> float:
+        """
+        This method will return the seconds since the watcher is started, until the task is done.
+        """
+        return (self.finished or time()) - self.started
+
+
+    def poll_once(self):
+        """
+        This method will fetch the status once, show the new messages and plan the next poll.
+        It will return True while the task is still running.
+        """
+        progress = False
+        result = Rest().get_raw(route=self.uri, noexit=True)
+        self.errors = self.errors + 1 if isinstance(result, bool) else 0
+        if isinstance(result, bool):
+            if self.errors >= WATCH_MAX_ERRORS:
+                Message().show_error(f'Luna Daemon is not reachable for {self.errors} polls, stopped watching {self.request_id}.')
+                self.failed = True
+                self.finish()
+        elif result.status_code == 404:
+            self.finish()
+        elif result.status_code == 200:
+            progress = self.handle(result.json())
+        else:
+            Message().show_error(f'{result.content}', result.status_code)
+            self.failed = True
+            self.finish()
+        if progress:
+            self.interval = WATCH_MIN_INTERVAL
+        else:
+            self.interval = min(self.interval * WATCH_BACKOFF, WATCH_MAX_INTERVAL)
+        self.next_poll = time() + self.interval
+        return not self.done
+
+
+    def handle(self, content=None):
+        """
+        This method will show the messages of a status response, and return True when there
+        was anything new.
+        """
+        task_status = 200
+        if 'status' in content and isinstance(content['status'], int):
+            task_status = content['status']
+        if task_status != 200:
+            self.failed = True
+        messages = content['message'].split(';;') if content.get('message') else []
+        for message in messages:
+            self.last_message = message
+            line = self.formatter(message, task_status)
+            if line is not None:
+                Message().show_success(line)
+        return bool(messages)
+
+
+    def finish(self):
+        """
+        This method will mark the task as done, and log how long it took.
+        """
+        self.done = True
+        self.finished = time()
+        state = 'failed' if self.failed else 'finished'
+        self.logger.info(f'Task {self.request_id} {state} in {self.duration:.2f}s')
+        return True
+
+
+    def watch(self):
+        """
+        This method will poll until the task is done, and return True when it has not failed.
+        """
+        while not self.done:
+            delay = self.next_poll - time()
+            if delay > 0:
+                sleep(delay)
+            self.poll_once()
+        return not self.failed
+
+
+class ControlWatcher(TaskWatcher):
+    """
+    Watcher Class responsible to follow a control action on a hostlist. Each node is shown as
+    a row as soon as the daemon reports it, a node already shown with the same status is skipped.
+    """
+
+    def __init__(self, request_id=None, system=None, count=1, first_poll=0, close=True):
+        """
+        Constructor - With close False the table is left open when the action is done, for the
+        next watcher of the same table.
+        """
+        super().__init__('control', request_id, first_poll=first_poll)
+        self.system = system
+        self.count = count
+        self.close = close
+        self.results = {}
+        self.last_result = None
+
+
+    def handle(self, content=None):
+        """
+        This method will show the nodes of the control status which are new or have changed.
+        """
+        from luna.utils.helper import Helper # pylint: disable=C0415
+        results = Helper().control_results(self.system, content)
+        fresh = {node: result for node, result in results.items() if self.results.get(node) != result}
+        if fresh:
+            self.results.update(fresh)
+            self.last_result = time()
+            self.count = Helper().control_print(self.system, content, self.count, fresh)
+        return bool(fresh)
+
+
+    @staticmethod
+    def close_table():
+        """
+        This method will show the closing line of the table.
+        """
+        hr_line = 'X--------------------------------------------'
+        hr_line += '--------------------------------------------X'
+        return Message().show_success(hr_line)
+
+
+    def finish(self):
+        """
+        This method will close the table when the control action is done.
+        """
+        if self.close:
+            self.close_table()
+        return super().finish()
+
+
+    @staticmethod
+    def show_summary(results=None, nodes=None, started=None, last_result=None):
+        """
+        This method will show the nodes of each state as a collapsed hostlist, the nodes without
+        a result, and the time until the last result.
+        """
+        import hostlist # pylint: disable=C0415
+        states = {}
+        for node, (state, _) in results.items():
+            states.setdefault(state, []).append(node)
+        missing = [node for node in nodes or [] if node not in results]
+        if missing:
+            states['NO RESULT'] = missing
+        for state in sorted(states, key=lambda state: state in ['FAILED', 'NO RESULT']):
+            names = states[state]
+            Message().show_success(f'{state}: {hostlist.collect_hostlist(names)}')
+        if last_result is not None:
+            Message().show_success(f'{len(results)} of {len(nodes or results)} nodes, '
+                                   f'last result after {last_result - started:.2f}s')
+        return True
+
+
+    def summary(self, nodes=None):
+        """
+        This method will show the summary of this control action.
+        """
+        return self.show_summary(self.results, nodes, self.started, self.last_result)
@@ -0,0 +1,111 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+# This code is part of the TrinityX software suite
+# Copyright (C) 2025  ClusterVision Solutions b.v.
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program.  If not, see <https://www.gnu.org/licenses/>
+
+
+
+"""
+Unit Tests for the IP Planner Class
+"""
+__author__      = "Sumit Sharma"
+__copyright__   = "Copyright 2025, Luna2 Project [CLI]"
+__license__     = "GPL"
+__version__     = "2.1"
+__maintainer__  = "Sumit Sharma"
+__email__       = "sumit.sharma@clustervision.com"
+__status__      = "Development"
+
+import unittest
+from luna.utils.ipplan import IPPlanner
+
+RECORD = {'network': '10.0.0.0/24', 'gateway': '10.0.0.254', 'dhcp': True,
+          'dhcp_range_begin': '10.0.0.10', 'dhcp_range_end': '10.0.0.19'}
+TAKEN = [{'ipaddress': '10.0.0.1', 'device': 'controller1'}, {'ipaddress': '10.0.0.3', 'device': 'node003'}]
+
+
+class IPPlannerTest(unittest.TestCase):
+    """
+    IP Planner Test Class for the plan and the validation of the addresses, the network data
+    is given to the planner, nothing is fetched.
+    """
+
+    def setUp(self):
+        self.planner = IPPlanner('cluster', RECORD, TAKEN)
+
+
+    def test_plan(self):
+        """
+        This method will check the taken addresses and the DHCP range are skipped.
+        """
+        plan = self.planner.plan([f'node{num:03}' for num in range(1, 9)])
+        self.assertEqual(list(plan.values()), ['10.0.0.2', '10.0.0.4', '10.0.0.5', '10.0.0.6', '10.0.0.7',
+                                               '10.0.0.8', '10.0.0.9', '10.0.0.20'])
+
+
+    def test_plan_start_and_exclude(self):
+        """
+        This method will check the plan from a start address, with excluded addresses.
+        """
+        plan = self.planner.plan(['node001', 'node002', 'node003'], '10.0.0.250', ['10.0.0.251'])
+        self.assertEqual(plan, {'node001': '10.0.0.250', 'node002': '10.0.0.252', 'node003': '10.0.0.253'})
+        with self.assertRaises(SystemExit):
+            self.planner.plan(['node001'], '10.0.1.1')
+        with self.assertRaises(SystemExit):
+            self.planner.plan(['node001'], 'node001')
+
+
+    def test_plan_full(self):
+        """
+        This method will check the network and broadcast address and the gateway are never
+        given, and that a full network gives None.
+        """
+        planner = IPPlanner('small', {'network': '192.168.0.0/29', 'gateway': '192.168.0.1'}, [])
+        plan = planner.plan([f'node{num:03}' for num in range(1, 8)])
+        self.assertEqual(list(plan.values()), ['192.168.0.2', '192.168.0.3', '192.168.0.4', '192.168.0.5',
+                                               '192.168.0.6', None, None])
+
+
+    def test_validate(self):
+        """
+        This method will check each problem of a plan is reported.
+        """
+        plan = {'node001': '10.0.0.1', 'node003': '10.0.0.3', 'node004': '10.0.1.4', 'node005': '10.0.0.15',
+                'node006': '10.0.0.30', 'node007': '10.0.0.30', 'node008': None, 'node009': 'ten'}
+        problems = {(name, address): text for name, address, text in self.planner.validate(plan)}
+        self.assertEqual(problems[('node001', '10.0.0.1')], 'taken by controller1')
+        self.assertNotIn(('node003', '10.0.0.3'), problems)
+        self.assertIn('not in network', problems[('node004', '10.0.1.4')])
+        self.assertIn('DHCP range', problems[('node005', '10.0.0.15')])
+        self.assertEqual(problems[('node007', '10.0.0.30')], 'also planned for node006')
+        self.assertNotIn(('node006', '10.0.0.30'), problems)
+        self.assertIn('no free address', problems[('node008', '')])
+        self.assertEqual(problems[('node009', 'ten')], 'not a valid IP address')
+        self.assertEqual(len(problems), 6)
+        self.assertEqual(self.planner.validate(self.planner.plan(['node010', 'node011'])), [])
+
+
+    def test_bad_subnet(self):
+        """
+        This method will check a network without a valid subnet stops the command.
+        """
+        with self.assertRaises(SystemExit):
+            IPPlanner('broken', {'network': None}, [])
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,86 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+# This code is part of the TrinityX software suite
+# Copyright (C) 2025  ClusterVision Solutions b.v.
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program.  If not, see <https://www.gnu.org/licenses/>
+
+
+
+"""
+Unit Tests for the IP Occupancy Class
+"""
+__author__      = "Sumit Sharma"
+__copyright__   = "Copyright 2025, Luna2 Project [CLI]"
+__license__     = "GPL"
+__version__     = "2.1"
+__maintainer__  = "Sumit Sharma"
+__email__       = "sumit.sharma@clustervision.com"
+__status__      = "Development"
+
+import unittest
+from luna.utils.occupancy import IPOccupancy
+
+
+def taken(*hosts):
+    """
+    This method will return a taken list, as in the _member response, for the host numbers.
+    """
+    return [{'ipaddress': f'10.1.{host >> 8}.{host & 255}', 'device': f'node{host:03}'} for host in hosts]
+
+
+class IPOccupancyTest(unittest.TestCase):
+    """
+    IP Occupancy Test Class for the runs, the counts and the slices of the bitmap.
+    """
+
+    def test_runs(self):
+        """
+        This method will check the free and taken runs, across the byte boundaries.
+        """
+        occupancy = IPOccupancy('cluster', '10.1.0.0/24', taken(*range(5, 20), 100))
+        self.assertEqual(list(occupancy.runs()), [(1, 4, False), (5, 19, True), (20, 99, False),
+                                                  (100, 100, True), (101, 254, False)])
+        ranges = occupancy.ranges()
+        self.assertEqual(ranges[1]['devices'], 'node[005-019]')
+        self.assertEqual([item['state'] for item in occupancy.ranges(free_only=True)], ['free'] * 3)
+
+
+    def test_count_and_totals(self):
+        """
+        This method will check the counts against a plain count, and the totals.
+        """
+        hosts = [3, 7, 8, 9, 15, 16, 17, 40, 63, 64, 200]
+        occupancy = IPOccupancy('cluster', '10.1.0.0/24', taken(*hosts) + [{'ipaddress': '10.2.0.1'}])
+        for first, last in [(0, 255), (3, 3), (4, 6), (7, 17), (9, 64), (1, 254), (65, 199)]:
+            self.assertEqual(occupancy.count(first, last), len([host for host in hosts if first <= host <= last]))
+        self.assertEqual(occupancy.totals(), {'network': 'cluster', 'subnet': '10.1.0.0/24', 'size': 256,
+                                              'usable': 254, 'taken': 11, 'free': 243, 'utilization': 4.33})
+
+
+    def test_slices(self):
+        """
+        This method will check the slices, the network and broadcast address are not usable.
+        """
+        occupancy = IPOccupancy('cluster', '10.1.0.0/22', taken(1, 2, 256, 1023))
+        slices = occupancy.slices(24)
+        self.assertEqual([item['slice'] for item in slices], ['10.1.0.0/24', '10.1.1.0/24', '10.1.2.0/24', '10.1.3.0/24'])
+        self.assertEqual([(item['usable'], item['taken']) for item in slices], [(255, 2), (256, 1), (256, 0), (255, 0)])
+        with self.assertRaises(SystemExit):
+            occupancy.slices(16)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,126 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+# This code is part of the TrinityX software suite
+# Copyright (C) 2025  ClusterVision Solutions b.v.
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program.  If not, see <https://www.gnu.org/licenses/>
+
+
+
+"""
+Unit Tests for the Query Class
+"""
+__author__      = "Sumit Sharma"
+__copyright__   = "Copyright 2025, Luna2 Project [CLI]"
+__license__     = "GPL"
+__version__     = "2.1"
+__maintainer__  = "Sumit Sharma"
+__email__       = "sumit.sharma@clustervision.com"
+__status__      = "Development"
+
+import unittest
+from base64 import b64encode
+from luna.utils.query import Query
+
+
+def encode(text=None):
+    """
+    This method will encode a text like the Luna Daemon does for the editor keys.
+    """
+    return b64encode(text.encode()).decode()
+
+
+RECORDS = {
+    'node10': {'name': 'node10', 'group': 'compute', 'setupbmc': True, 'cores': 32,
+               'interfaces': [{'interface': 'BOOTIF', 'network': 'cluster'}], 'comment': encode('rack b')},
+    'node2': {'name': 'node2', 'group': 'gpu', 'setupbmc': False, 'cores': 8,
+              'interfaces': [{'interface': 'BOOTIF', 'network': 'cluster'}, {'interface': 'ib0', 'network': 'ib'}],
+              'comment': encode('rack a')},
+    'node1': {'name': 'node1', 'group': 'compute', 'setupbmc': True, 'cores': 16, 'interfaces': [], 'comment': ''}
+}
+
+
+class QueryTest(unittest.TestCase):
+    """
+    Query Test Class for the filter, the sort and the limit of the list commands.
+    """
+
+    def names(self, args=None):
+        """
+        This method will return the names of the records matching the args, in their order.
+        """
+        return list(Query(args).apply(RECORDS))
+
+
+    def test_parse(self):
+        """
+        This method will check the split of an expression and the exit on a bad one.
+        """
+        self.assertEqual(Query.parse('group = gpu '), ('group', '=', 'gpu'))
+        self.assertEqual(Query.parse('interfaces.network!~i*'), ('interfaces.network', '!~', 'i*'))
+        self.assertEqual(Query.parse('cores>=16'), ('cores', '>=', '16'))
+        with self.assertRaises(SystemExit):
+            Query({'where': ['group']})
+
+
+    def test_compare(self):
+        """
+        This method will check the glob, the bool and the numeric compare.
+        """
+        self.assertTrue(Query.compare('node10', '~', 'node1*'))
+        self.assertFalse(Query.compare('node10', '=', 'node1'))
+        self.assertTrue(Query.compare(True, '=', 'yes'))
+        self.assertFalse(Query.compare(False, '=', 'y'))
+        self.assertTrue(Query.compare(8, '<', '10'))
+        self.assertTrue(Query.compare('9', '<=', '9'))
+        self.assertFalse(Query.compare(None, '=', 'gpu'))
+
+
+    def test_where(self):
+        """
+        This method will check the filter on a field, a bool and the items of a list.
+        """
+        self.assertEqual(self.names({'where': ['group=compute']}), ['node10', 'node1'])
+        self.assertEqual(self.names({'where': ['group=compute', 'cores>16']}), ['node10'])
+        self.assertEqual(self.names({'where': ['setupbmc=no']}), ['node2'])
+        self.assertEqual(self.names({'where': ['interfaces.network=ib']}), ['node2'])
+        self.assertEqual(self.names({'where': ['interfaces.network!=ib']}), ['node10', 'node1'])
+        self.assertEqual(self.names({'where': ['comment~*rack a*']}), ['node2'])
+
+
+    def test_sort_and_limit(self):
+        """
+        This method will check the natural sort, the descending sort and the limit.
+        """
+        self.assertEqual(self.names({'sort': 'name'}), ['node1', 'node2', 'node10'])
+        self.assertEqual(self.names({'sort': '-cores'}), ['node10', 'node1', 'node2'])
+        self.assertEqual(self.names({'sort': 'group,-name'}), ['node10', 'node1', 'node2'])
+        self.assertEqual(self.names({'sort': 'name', 'limit': 2}), ['node1', 'node2'])
+        self.assertEqual(self.names({'limit': 0}), [])
+        self.assertLess(Query.natural_key(''), Query.natural_key('a'))
+
+
+    def test_records_unchanged(self):
+        """
+        This method will check the data is given back as it is without any option, and that an
+        encoded field is not decoded in the records.
+        """
+        self.assertIs(Query().apply(RECORDS), RECORDS)
+        Query({'where': ['comment~rack*'], 'sort': 'comment'}).apply(RECORDS)
+        self.assertEqual(RECORDS['node2']['comment'], encode('rack a'))
+
+
+if __name__ == '__main__':
+    unittest.main()
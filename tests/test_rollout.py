@@ -0,0 +1,148 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+# This code is part of the TrinityX software suite
+# Copyright (C) 2025  ClusterVision Solutions b.v.
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program.  If not, see <https://www.gnu.org/licenses/>
+
+
+
+"""
+Unit Tests for the Rolling Push Class
+"""
+__author__      = "Sumit Sharma"
+__copyright__   = "Copyright 2025, Luna2 Project [CLI]"
+__license__     = "GPL"
+__version__     = "2.1"
+__maintainer__  = "Sumit Sharma"
+__email__       = "sumit.sharma@clustervision.com"
+__status__      = "Development"
+
+import sys
+import unittest
+from luna.utils.rollout import RollingPush
+
+
+class FakePush(RollingPush):
+    """
+    Rolling Push with a local push, the nodes in failing exit like a failed push does.
+    """
+
+    def __init__(self, failing=None, **options):
+        super().__init__({'osimage': 'compute'}, **options)
+        self.failing = failing or []
+        self.pushed = []
+        self.stage = None
+
+
+    def push_each(self, name=None):
+        self.pushed.append(name)
+        if name in self.failing:
+            sys.exit(1)
+        return True
+
+
+    def show_summary(self, stage=None, duration=None):
+        self.stage = [(name, result['name'], result['status']) for name, result in stage]
+        return super().show_summary(stage, duration)
+
+
+NODES = [f'node{num:03}' for num in range(1, 9)]
+
+
+class RollingPushTest(unittest.TestCase):
+    """
+    Rolling Push Test Class for the arguments and the stop conditions of a rolling push.
+    """
+
+    def test_pop_args(self):
+        """
+        This method will check the rolling arguments are taken out, and only used when given.
+        """
+        args = {'name': 'node[001-008]', 'rolling': False, 'window': 4, 'canary': None, 'max_failure_rate': None}
+        self.assertIsNone(RollingPush.pop_args(args))
+        self.assertEqual(args, {'name': 'node[001-008]'})
+        args = {'rolling': False, 'window': None, 'canary': None, 'max_failure_rate': 0.0}
+        self.assertEqual(RollingPush.pop_args(args), {'window': None, 'canary': None, 'max_failure_rate': 0.0})
+        args = {'rolling': True, 'window': 2, 'canary': None, 'max_failure_rate': None}
+        self.assertEqual(RollingPush.pop_args(args)['window'], 2)
+
+
+    def test_too_many_failed(self):
+        """
+        This method will check the failure rate is only judged after a window of results.
+        """
+        push = RollingPush({}, window=4, max_failure_rate=25)
+        push.total = 8
+        results = {'node001': {'status': 'FAILED'}, 'node002': {'status': 'FAILED'}, 'node003': {'status': 'OK'}}
+        self.assertFalse(push.too_many_failed(results))
+        results['node004'] = {'status': 'OK'}
+        self.assertTrue(push.too_many_failed(results))
+        results['node002']['status'] = 'OK'
+        self.assertFalse(push.too_many_failed(results))
+        push.total = 2
+        self.assertTrue(push.too_many_failed({'node001': {'status': 'OK'}, 'node002': {'status': 'FAILED'}}))
+        self.assertFalse(RollingPush({}, window=1).too_many_failed({'node001': {'status': 'FAILED'}}))
+
+
+    def test_all_pushed(self):
+        """
+        This method will check every node is pushed, in the canary and the rolling stage.
+        """
+        push = FakePush(window=3, canary=2)
+        self.assertTrue(push.run(NODES))
+        self.assertEqual(sorted(push.pushed), NODES)
+        self.assertEqual([stage for stage, _, _ in push.stage], ['canary'] * 2 + ['rolling'] * 6)
+        self.assertEqual({status for _, _, status in push.stage}, {'OK'})
+
+
+    def test_canary_failed(self):
+        """
+        This method will check the other nodes are skipped when a canary push has failed.
+        """
+        push = FakePush(['node002'], window=3, canary=2)
+        with self.assertRaises(SystemExit) as context:
+            push.run(NODES)
+        self.assertEqual(context.exception.code, 1)
+        self.assertEqual(sorted(push.pushed), NODES[:2])
+        self.assertEqual(push.stage[1], ('canary', 'node002', 'FAILED'))
+        self.assertEqual({status for _, _, status in push.stage[2:]}, {'SKIPPED'})
+
+
+    def test_failure_rate(self):
+        """
+        This method will check no new push is started once the failure rate is too high.
+        """
+        push = FakePush(['node002', 'node003'], window=1, max_failure_rate=50)
+        with self.assertRaises(SystemExit):
+            push.run(NODES)
+        self.assertEqual(push.pushed, NODES[:3])
+        self.assertEqual([status for _, _, status in push.stage],
+                         ['OK', 'FAILED', 'FAILED'] + ['SKIPPED'] * 5)
+
+
+    def test_failure_rate_not_reached(self):
+        """
+        This method will check a failure below the threshold does not stop the push.
+        """
+        push = FakePush(['node004'], window=2, max_failure_rate=50)
+        with self.assertRaises(SystemExit):
+            push.run(NODES)
+        self.assertEqual(sorted(push.pushed), NODES)
+        self.assertNotIn('SKIPPED', [status for _, _, status in push.stage])
+
+
+if __name__ == '__main__':
+    unittest.main()
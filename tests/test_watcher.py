@@ -0,0 +1,130 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+# This code is part of the TrinityX software suite
+# Copyright (C) 2025  ClusterVision Solutions b.v.
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program.  If not, see <https://www.gnu.org/licenses/>
+
+
+
+"""
+Unit Tests for the Task Watcher Class
+"""
+__author__      = "Sumit Sharma"
+__copyright__   = "Copyright 2025, Luna2 Project [CLI]"
+__license__     = "GPL"
+__version__     = "2.1"
+__maintainer__  = "Sumit Sharma"
+__email__       = "sumit.sharma@clustervision.com"
+__status__      = "Development"
+
+import unittest
+from unittest import mock
+from luna.utils.watcher import TaskWatcher
+from luna.utils.constant import WATCH_MIN_INTERVAL, WATCH_MAX_INTERVAL, WATCH_BACKOFF, WATCH_MAX_ERRORS
+
+
+def response(status_code=200, content=None):
+    """
+    This method will return a response like the one of Rest.get_raw.
+    """
+    return mock.Mock(status_code=status_code, content=content, json=mock.Mock(return_value=content))
+
+
+class TaskWatcherTest(unittest.TestCase):
+    """
+    Task Watcher Test Class for the state of a task after each poll, the Luna Daemon is replaced
+    by the responses given to Rest.get_raw.
+    """
+
+    def setUp(self):
+        patcher = mock.patch('luna.utils.watcher.Rest')
+        self.rest = patcher.start()
+        self.addCleanup(patcher.stop)
+        self.watcher = TaskWatcher('config', 'abc123', TaskWatcher.silent_format)
+
+
+    def poll(self, *results):
+        """
+        This method will poll once for each result, and return what poll_once has returned.
+        """
+        self.rest.return_value.get_raw.side_effect = list(results)
+        return [self.watcher.poll_once() for _ in results]
+
+
+    def test_progress(self):
+        """
+        This method will check new messages keep the interval short, and a quiet poll backs off.
+        """
+        self.assertEqual(self.poll(response(200, {'message': 'one;;two'}), response(200, {})), [True, True])
+        self.assertEqual(self.watcher.last_message, 'two')
+        self.assertEqual(self.watcher.interval, WATCH_MIN_INTERVAL * WATCH_BACKOFF)
+        self.assertEqual(self.watcher.state, 'RUNNING')
+        self.poll(*[response(200, {})] * 20)
+        self.assertEqual(self.watcher.interval, WATCH_MAX_INTERVAL)
+        self.poll(response(200, {'message': 'three'}))
+        self.assertEqual(self.watcher.interval, WATCH_MIN_INTERVAL)
+        self.rest.return_value.get_raw.assert_called_with(route='config/status/abc123', noexit=True)
+
+
+    def test_done(self):
+        """
+        This method will check a 404 ends the task, failed when the task has reported a failure.
+        """
+        self.assertEqual(self.poll(response(200, {'message': 'broken', 'status': 500}), response(404)),
+                         [True, False])
+        self.assertTrue(self.watcher.done)
+        self.assertEqual(self.watcher.state, 'FAILED')
+        watcher = TaskWatcher('config', 'abc124')
+        self.rest.return_value.get_raw.side_effect = [response(404)]
+        self.assertFalse(watcher.poll_once())
+        self.assertEqual(watcher.state, 'DONE')
+
+
+    def test_error_response(self):
+        """
+        This method will check an error response of the Luna Daemon fails the task at once.
+        """
+        self.assertEqual(self.poll(response(500, 'internal error')), [False])
+        self.assertEqual(self.watcher.state, 'FAILED')
+
+
+    def test_unreachable(self):
+        """
+        This method will check the task stays running while the Luna Daemon is not reachable,
+        and is given up after WATCH_MAX_ERRORS polls in a row.
+        """
+        self.assertEqual(self.poll(*[False] * (WATCH_MAX_ERRORS - 1)), [True] * (WATCH_MAX_ERRORS - 1))
+        self.assertEqual(self.watcher.state, 'RUNNING')
+        self.poll(response(200, {'message': 'back'}))
+        self.assertEqual(self.watcher.errors, 0)
+        self.assertEqual(self.poll(*[False] * WATCH_MAX_ERRORS)[-1], False)
+        self.assertTrue(self.watcher.done)
+        self.assertEqual(self.watcher.state, 'FAILED')
+
+
+    def test_watch(self):
+        """
+        This method will check watch returns once the Luna Daemon stays unreachable.
+        """
+        self.rest.return_value.get_raw.return_value = False
+        with mock.patch('luna.utils.watcher.sleep') as sleep:
+            self.assertFalse(self.watcher.watch())
+        self.assertEqual(self.rest.return_value.get_raw.call_count, WATCH_MAX_ERRORS)
+        self.assertTrue(sleep.called)
+
+
+if __name__ == '__main__':
+    unittest.main()